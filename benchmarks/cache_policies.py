@@ -0,0 +1,102 @@
+"""This module benchmarks the LRU Cache against the scan-resistant
+eviction policies by replaying synthetic access traces. Every access is
+a get, followed by a put when the get misses. For every trace and policy
+it reports the hit ratio and the replay throughput.
+
+Run it from the root of the repository with:
+    python -m benchmarks.cache_policies --cache-size 1000
+"""
+
+import argparse
+import itertools
+import random
+import time
+
+from data_structures.lru_cache.eviction_policies import (
+    SegmentedLRUCache,
+    TinyLFUCache,
+    TwoQueueCache,
+)
+from data_structures.lru_cache.lru_cache import LRUCache
+
+
+POLICIES = {
+    "lru": LRUCache,
+    "slru": SegmentedLRUCache,
+    "2q": TwoQueueCache,
+    "w-tinylfu": TinyLFUCache,
+}
+
+
+def zipf_trace(num_accesses, num_keys, exponent, generator):
+    """Return a list of keys drawn from a Zipfian distribution, where the
+    key of rank k is drawn with probability proportional to 1 / k^exponent.
+    """
+    cumulative_weights = list(
+        itertools.accumulate(1 / rank ** exponent for rank in range(1, num_keys + 1))
+    )
+    return generator.choices(
+        range(num_keys), cum_weights=cumulative_weights, k=num_accesses
+    )
+
+
+def scan_trace(num_accesses, num_keys, exponent, scan_length, generator):
+    """Return a Zipfian trace where, every few thousand accesses, a scan
+    of scan_length keys that are never used again is spliced in.
+    """
+    trace = []
+    next_scan_key = num_keys
+    for access in zipf_trace(num_accesses, num_keys, exponent, generator):
+        trace.append(access)
+        if len(trace) % 5000 == 0:
+            trace.extend(range(next_scan_key, next_scan_key + scan_length))
+            next_scan_key += scan_length
+    return trace
+
+
+def replay(cache, trace):
+    """Replay the trace against the cache and return the hit ratio and
+    the throughput in accesses per second.
+    """
+    hits = 0
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get(key) is None:
+            cache.put(key, key)
+        else:
+            hits += 1
+    seconds = time.perf_counter() - start
+    return hits / len(trace), len(trace) / seconds
+
+
+def main():
+    """Replay every trace against every policy."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cache-size", type=int, default=1000)
+    parser.add_argument("--num-keys", type=int, default=100000)
+    parser.add_argument("--num-accesses", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    traces = {
+        "zipf 0.8": zipf_trace(args.num_accesses, args.num_keys, 0.8, generator),
+        "zipf 1.0": zipf_trace(args.num_accesses, args.num_keys, 1.0, generator),
+        "zipf+scan": scan_trace(
+            args.num_accesses, args.num_keys, 0.9, 2 * args.cache_size, generator
+        ),
+    }
+
+    row = "%-10s %-10s %10s %14s"
+    print(row % ("trace", "policy", "hit ratio", "accesses/sec"))
+    for trace_name, trace in traces.items():
+        for policy_name, policy in POLICIES.items():
+            hit_ratio, throughput = replay(policy(args.cache_size), trace)
+            print(
+                row
+                % (trace_name, policy_name, "%.4f" % hit_ratio, "%.0f" % throughput)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""This module benchmarks the thread-safe hash table that uses lock
+striping against the chaining hash table guarded by one global lock.
+For every thread count and read ratio it reports the total throughput
+of a mixed workload of gets and puts over a shared key space.
+
+Run it from the root of the repository with:
+    python -m benchmarks.concurrent_hash_table --ops-per-thread 20000
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from data_structures.hash_tables.concurrent_hash_table import ConcurrentHashTable
+from data_structures.hash_tables.hash_table_with_chaining import HashTable
+
+
+class GlobalLockHashTable:
+    """Class to wrap the chaining hash table so that every get and put
+    holds the same lock. It is the baseline for the striped table.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._table = HashTable()
+
+    def get(self, key):
+        """Return the item associated with the given key."""
+        with self._lock:
+            return self._table.get(key)
+
+    def put(self, key, value):
+        """Insert the given value into the hash table."""
+        with self._lock:
+            self._table.put(key, value)
+
+
+def make_operations(num_ops, read_ratio, num_keys, seed):
+    """Return a list of (is_read, key) tuples for a single thread."""
+    generator = random.Random(seed)
+    return [
+        (generator.random() < read_ratio, generator.randrange(num_keys))
+        for _ in range(num_ops)
+    ]
+
+
+def run_workload(table, operations_per_thread):
+    """Run every thread's operations against the table at the same time
+    and return the total throughput in operations per second.
+    """
+    barrier = threading.Barrier(len(operations_per_thread) + 1)
+
+    def worker(operations):
+        barrier.wait()
+        for is_read, key in operations:
+            if is_read:
+                table.get(key)
+            else:
+                table.put(key, key)
+
+    threads = [
+        threading.Thread(target=worker, args=(operations,))
+        for operations in operations_per_thread
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    return sum(len(operations) for operations in operations_per_thread) / seconds
+
+
+def main():
+    """Run the benchmark for every thread count and read ratio."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops-per-thread", type=int, default=20000)
+    parser.add_argument("--num-keys", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    row = "%-8s %-11s %16s %16s"
+    print(row % ("threads", "read ratio", "striped ops/sec", "global ops/sec"))
+    for num_threads in (1, 2, 4, 8):
+        for read_ratio in (0.5, 0.9, 0.99):
+            operations_per_thread = [
+                make_operations(
+                    args.ops_per_thread, read_ratio, args.num_keys, args.seed + number
+                )
+                for number in range(num_threads)
+            ]
+            striped = run_workload(ConcurrentHashTable(), operations_per_thread)
+            global_lock = run_workload(GlobalLockHashTable(), operations_per_thread)
+            print(
+                row
+                % (
+                    num_threads,
+                    read_ratio,
+                    "%.0f" % striped,
+                    "%.0f" % global_lock,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
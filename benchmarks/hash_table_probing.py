@@ -0,0 +1,79 @@
+"""This module benchmarks the probing strategies of the hash table that
+uses open addressing. For every strategy and key set it reports insert
+and lookup throughput, along with the mean and worst-case probe length
+once all keys are in the table.
+
+Run it from the root of the repository with:
+    python -m benchmarks.hash_table_probing --num-keys 10000
+"""
+
+import argparse
+import random
+import time
+
+from data_structures.hash_tables.hash_table_with_linear_probing import (
+    HashTable,
+    PROBING_STRATEGIES,
+)
+
+
+def make_key_sets(num_keys, seed=0):
+    """Return a dictionary mapping a key set name to a list of integer
+    keys. The adversarial keys are all multiples of 256, so they share
+    their low bits and pile up in a handful of home buckets.
+    """
+    generator = random.Random(seed)
+    return {
+        "uniform": generator.sample(range(1 << 62), num_keys),
+        "sequential": list(range(num_keys)),
+        "adversarial": [key << 8 for key in range(num_keys)],
+    }
+
+
+def benchmark_strategy(probing, keys):
+    """Insert and then look up every key in a new hash table with the
+    given probing strategy. Return the insert and lookup throughput in
+    operations per second, and the table's probe length statistics.
+    """
+    table = HashTable(probing=probing)
+    start = time.perf_counter()
+    for key in keys:
+        table.put(key, key)
+    insert_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys:
+        table.get(key)
+    lookup_seconds = time.perf_counter() - start
+
+    stats = table.probe_length_stats()
+    return len(keys) / insert_seconds, len(keys) / lookup_seconds, stats
+
+
+def main():
+    """Run the benchmark for every probing strategy and key set."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-keys", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    row = "%-12s %-15s %14s %14s %10s %10s"
+    print(row % ("keys", "probing", "inserts/sec", "lookups/sec", "mean", "max"))
+    for name, keys in make_key_sets(args.num_keys, args.seed).items():
+        for probing in PROBING_STRATEGIES:
+            inserts, lookups, stats = benchmark_strategy(probing, keys)
+            print(
+                row
+                % (
+                    name,
+                    probing,
+                    "%.0f" % inserts,
+                    "%.0f" % lookups,
+                    "%.2f" % stats["mean"],
+                    stats["max"],
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""This module benchmarks the unrolled linked list and the indexable skip
+list against the singly and doubly linked lists without tail pointers.
+Each list is built with push_front, then iterated over, indexed into,
+edited in the middle and pushed and popped at the back, and the time per
+operation and memory per value are reported.
+
+The singly and doubly linked lists have to walk the list to reach a
+position, so their positional and back operations are O(n) and only a
+few of them are timed. The singly linked list's push_back is also only safe on a list
+that isn't empty, which is why every list is built from the front.
+
+Run it from the root of the repository with:
+    python -m benchmarks.linked_lists --size 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from data_structures.linked_lists.doubly_linked_list_no_tail_pointer import (
+    DoublyLinkedList,
+)
+from data_structures.linked_lists.indexable_skip_list import IndexableSkipList
+from data_structures.linked_lists.singly_linked_list_no_tail_pointer import (
+    SinglyLinkedList,
+)
+from data_structures.linked_lists.unrolled_linked_list import UnrolledLinkedList
+
+
+def time_per_operation(operation, repeats):
+    """Call operation the given number of times and return the average
+    time per call in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeats):
+        operation()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def memory_per_value(make_list, size):
+    """Build a separate list with push_front and return the memory it
+    uses per value in bytes. Tracing allocations slows the pushes down, so
+    this list isn't the one that is timed.
+    """
+    tracemalloc.start()
+    linked_list = make_list()
+    for data in range(size):
+        linked_list.push_front(data)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / size
+
+
+def run(make_list, size, back_repeats):
+    """Run every operation against a new linked list and return a row of
+    results.
+    """
+    linked_list = make_list()
+    start = time.perf_counter()
+    for data in range(size):
+        linked_list.push_front(data)
+    build_time = (time.perf_counter() - start) / size * 1e6
+    start = time.perf_counter()
+    for _ in linked_list:
+        pass
+    iterate_time = (time.perf_counter() - start) / size * 1e6
+
+    def insert_and_remove_middle():
+        linked_list.insert(size // 2, -1)
+        linked_list.remove_at_index(size // 2)
+
+    def push_and_pop_back():
+        linked_list.push_back(-1)
+        linked_list.pop_back()
+
+    return (
+        build_time,
+        iterate_time,
+        time_per_operation(lambda: linked_list.value_at(size // 2), back_repeats),
+        time_per_operation(insert_and_remove_middle, back_repeats),
+        time_per_operation(linked_list.peek_back, back_repeats),
+        time_per_operation(push_and_pop_back, back_repeats),
+        memory_per_value(make_list, size),
+    )
+
+
+def main():
+    """Run the benchmark for every linked list."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--back-repeats", type=int, default=5)
+    parser.add_argument("--node-capacity", type=int, default=64)
+    args = parser.parse_args()
+
+    row = "%-10s %12s %12s %12s %12s %12s %14s %12s"
+    print(
+        row
+        % (
+            "list",
+            "push_front",
+            "iterate",
+            "value_at",
+            "ins+rm mid",
+            "peek_back",
+            "push+pop back",
+            "bytes/value",
+        )
+    )
+    print(row % ("", "us/op", "us/value", "us/op", "us/op", "us/op", "us/op", ""))
+    linked_lists = (
+        ("singly", SinglyLinkedList),
+        ("doubly", DoublyLinkedList),
+        ("unrolled", lambda: UnrolledLinkedList(args.node_capacity)),
+        ("skip list", IndexableSkipList),
+    )
+    for name, make_list in linked_lists:
+        results = run(make_list, args.size, args.back_repeats)
+        print(row % ((name,) + tuple("%.3f" % result for result in results)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""This module benchmarks the blocking and asyncio queues against the
+standard library's queue.Queue and asyncio.Queue. Producers hand a fixed
+number of items to consumers through a small bounded queue, one item at
+a time and, for the circular queue based ones, in batches, and the
+throughput of each run is reported in items per second.
+
+Run it from the root of the repository with:
+    python -m benchmarks.producer_consumer --num-items 200000 --threads 2
+"""
+
+import argparse
+import asyncio
+import queue
+import threading
+import time
+
+from data_structures.queues.blocking_queue import AsyncQueue, BlockingQueue
+
+
+def split(num_items, num_parts):
+    """Return how many of the items each of num_parts workers handles."""
+    share, remainder = divmod(num_items, num_parts)
+    return [share + (1 if index < remainder else 0) for index in range(num_parts)]
+
+
+def run_threads(make_queue, num_items, num_threads, batch_size):
+    """Run num_threads producers and as many consumers on a new queue and
+    return the throughput in items per second. A batch size of 1 moves
+    items one at a time with put and get.
+    """
+    shared_queue = make_queue()
+
+    def produce(count):
+        if batch_size == 1:
+            for item in range(count):
+                shared_queue.put(item)
+        else:
+            batch = list(range(batch_size))
+            for start in range(0, count, batch_size):
+                shared_queue.put_many(batch[: count - start])
+
+    def consume(count):
+        if batch_size == 1:
+            for _ in range(count):
+                shared_queue.get()
+        else:
+            while count:
+                count -= len(shared_queue.get_many(min(batch_size, count)))
+
+    shares = split(num_items, num_threads)
+    threads = [threading.Thread(target=produce, args=(count,)) for count in shares]
+    threads += [threading.Thread(target=consume, args=(count,)) for count in shares]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return num_items / (time.perf_counter() - start)
+
+
+async def run_tasks(make_queue, num_items, num_tasks, batch_size):
+    """Run num_tasks producer and as many consumer coroutines on a new
+    queue and return the throughput in items per second.
+    """
+    shared_queue = make_queue()
+
+    async def produce(count):
+        if batch_size == 1:
+            for item in range(count):
+                await shared_queue.put(item)
+        else:
+            batch = list(range(batch_size))
+            for start in range(0, count, batch_size):
+                await shared_queue.put_many(batch[: count - start])
+
+    async def consume(count):
+        if batch_size == 1:
+            for _ in range(count):
+                await shared_queue.get()
+        else:
+            while count:
+                count -= len(await shared_queue.get_many(min(batch_size, count)))
+
+    shares = split(num_items, num_tasks)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[produce(count) for count in shares], *[consume(count) for count in shares]
+    )
+    return num_items / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark for every queue."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-items", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=2)
+    parser.add_argument("--max-capacity", type=int, default=1024)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    row = "%-28s %14s"
+    print(row % ("queue", "items/sec"))
+    runs = (
+        ("queue.Queue", lambda: queue.Queue(args.max_capacity), 1),
+        ("BlockingQueue", lambda: BlockingQueue(args.max_capacity), 1),
+        (
+            "BlockingQueue batched",
+            lambda: BlockingQueue(args.max_capacity),
+            args.batch_size,
+        ),
+    )
+    for name, make_queue, batch_size in runs:
+        result = run_threads(make_queue, args.num_items, args.threads, batch_size)
+        print(row % (name, "%.0f" % result))
+    runs = (
+        ("asyncio.Queue", lambda: asyncio.Queue(args.max_capacity), 1),
+        ("AsyncQueue", lambda: AsyncQueue(args.max_capacity), 1),
+        ("AsyncQueue batched", lambda: AsyncQueue(args.max_capacity), args.batch_size),
+    )
+    for name, make_queue, batch_size in runs:
+        result = asyncio.run(
+            run_tasks(make_queue, args.num_items, args.threads, batch_size)
+        )
+        print(row % (name, "%.0f" % result))
+
+
+if __name__ == "__main__":
+    main()
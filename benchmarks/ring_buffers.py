@@ -0,0 +1,119 @@
+"""This module benchmarks the growable circular queue and deque against
+collections.deque. Every structure starts small and has items added and
+removed one at a time and then in batches, and the throughput of each
+workload is reported in items per second.
+
+Run it from the root of the repository with:
+    python -m benchmarks.ring_buffers --num-items 1000000 --batch-size 64
+"""
+
+import argparse
+import collections
+import time
+
+from data_structures.queues.circular_deque import CircularDeque
+from data_structures.queues.circular_queue import CircularQueue
+
+
+def throughput(workload, num_items):
+    """Run the workload and return the number of items it moved per
+    second.
+    """
+    start = time.perf_counter()
+    workload()
+    return num_items / (time.perf_counter() - start)
+
+
+def one_at_a_time(add, remove, num_items, backlog):
+    """Return a workload that keeps about backlog items queued while
+    adding and removing num_items items one at a time.
+    """
+
+    def workload():
+        for item in range(backlog):
+            add(item)
+        for item in range(num_items):
+            add(item)
+            remove()
+
+    return workload
+
+
+def in_batches(extend, pop_many, num_items, batch_size):
+    """Return a workload that adds two batches for every one it removes
+    until half the items are queued, then drains them a batch at a time.
+    """
+    batch = list(range(batch_size))
+
+    def workload():
+        for _ in range(num_items // (2 * batch_size)):
+            extend(batch)
+            extend(batch)
+            pop_many(batch_size)
+        for _ in range(num_items // (2 * batch_size)):
+            pop_many(batch_size)
+
+    return workload
+
+
+def deque_pop_many(queue):
+    """Return a function that pops a batch from the left of a
+    collections.deque.
+    """
+    popleft = queue.popleft
+
+    def pop_many(count):
+        return [popleft() for _ in range(min(count, len(queue)))]
+
+    return pop_many
+
+
+def main():
+    """Run the benchmark for every structure."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-items", type=int, default=1000000)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--backlog", type=int, default=1000)
+    args = parser.parse_args()
+
+    queue = CircularQueue(16, growable=True)
+    deque = CircularDeque(16, growable=True)
+    builtin = collections.deque()
+    structures = (
+        (
+            "CircularQueue",
+            queue.enqueue,
+            queue.dequeue,
+            queue.extend,
+            queue.pop_many,
+        ),
+        (
+            "CircularDeque",
+            deque.push_back,
+            deque.pop_front,
+            deque.extend,
+            deque.pop_many,
+        ),
+        (
+            "collections.deque",
+            builtin.append,
+            builtin.popleft,
+            builtin.extend,
+            deque_pop_many(builtin),
+        ),
+    )
+    row = "%-18s %18s %18s"
+    print(row % ("structure", "single items/sec", "batched items/sec"))
+    for name, add, remove, extend, pop_many in structures:
+        single = throughput(
+            one_at_a_time(add, remove, args.num_items, args.backlog), args.num_items
+        )
+        batched = throughput(
+            in_batches(extend, pop_many, args.num_items, args.batch_size),
+            args.num_items,
+        )
+        print(row % (name, "%.0f" % single, "%.0f" % batched))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""This module benchmarks the sharded LRU Cache against a single
+thread-safe LRU Cache. Every thread performs gets (and a put on each
+miss) on keys drawn from the same key space, and the total throughput is
+reported for an increasing number of threads.
+
+With a global interpreter lock, only one thread runs Python code at a
+time, so neither cache scales much; sharding then shows up as less time
+lost to lock contention. On a free-threaded build of Python, the sharded
+cache's throughput should grow with the number of threads while the
+single cache's stays flat.
+
+Run it from the root of the repository with:
+    python -m benchmarks.sharded_lru_cache --ops-per-thread 50000
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from data_structures.lru_cache.concurrent_lru_cache import ThreadSafeLRUCache
+from data_structures.lru_cache.sharded_lru_cache import ShardedLRUCache
+
+
+def run_workload(cache, keys_per_thread):
+    """Run every thread's gets against the cache at the same time and
+    return the total throughput in operations per second.
+    """
+    barrier = threading.Barrier(len(keys_per_thread) + 1)
+
+    def worker(keys):
+        barrier.wait()
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    threads = [
+        threading.Thread(target=worker, args=(keys,)) for keys in keys_per_thread
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    return sum(len(keys) for keys in keys_per_thread) / seconds
+
+
+def main():
+    """Run the benchmark for every thread count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops-per-thread", type=int, default=50000)
+    parser.add_argument("--num-keys", type=int, default=10000)
+    parser.add_argument("--num-shards", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    row = "%-8s %16s %16s %9s"
+    print(row % ("threads", "single ops/sec", "sharded ops/sec", "speedup"))
+    for num_threads in (1, 2, 4, 8, 16, 32):
+        keys_per_thread = [
+            [generator.randrange(args.num_keys) for _ in range(args.ops_per_thread)]
+            for _ in range(num_threads)
+        ]
+        single = run_workload(ThreadSafeLRUCache(args.num_keys), keys_per_thread)
+        sharded = run_workload(
+            ShardedLRUCache(args.num_keys, args.num_shards), keys_per_thread
+        )
+        print(
+            row
+            % (
+                num_threads,
+                "%.0f" % single,
+                "%.0f" % sharded,
+                "%.2f" % (sharded / single),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
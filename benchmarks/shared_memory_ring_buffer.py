@@ -0,0 +1,132 @@
+"""This module benchmarks the shared memory ring buffer against a
+multiprocessing pipe and a multiprocessing queue. A producer process
+sends a fixed number of byte strings to the main process through each
+one, and the throughput is reported in messages and megabytes per second.
+
+The pipe sends the bytes through the kernel and the queue also pickles
+them, while the ring buffer copies them straight into and out of shared
+memory, in batches so each side only writes its counter once per batch.
+Both ends of the ring buffer give up the CPU while it's full or empty
+rather than blocking.
+
+Run it from the root of the repository with:
+    python -m benchmarks.shared_memory_ring_buffer --num-messages 200000
+"""
+
+import argparse
+import functools
+import multiprocessing
+import time
+
+from data_structures.queues.shared_memory_ring_buffer import SharedMemoryRingBuffer
+
+
+def produce_ring_buffer(ring_buffer, message, count, batch_size):
+    """Enqueue the message count times in batches, giving up the CPU
+    while the buffer is full.
+    """
+    batch = [message] * batch_size
+    while count:
+        sent = ring_buffer.enqueue_many(batch[: min(batch_size, count)])
+        if not sent:
+            time.sleep(0)
+        count -= sent
+    ring_buffer.close()
+
+
+def produce_pipe(connection, message, count):
+    """Send the message count times through the pipe."""
+    for _ in range(count):
+        connection.send_bytes(message)
+    connection.close()
+
+
+def produce_queue(shared_queue, message, count):
+    """Put the message count times on the queue."""
+    for _ in range(count):
+        shared_queue.put(message)
+
+
+def consume_ring_buffer(ring_buffer, count, batch_size):
+    """Dequeue count messages in batches, giving up the CPU while the
+    buffer is empty.
+    """
+    while count:
+        received = len(ring_buffer.dequeue_many(min(batch_size, count)))
+        if not received:
+            time.sleep(0)
+        count -= received
+
+
+def consume_pipe(connection, count):
+    """Receive count messages from the pipe."""
+    for _ in range(count):
+        connection.recv_bytes()
+
+
+def consume_queue(shared_queue, count):
+    """Get count messages from the queue."""
+    for _ in range(count):
+        shared_queue.get()
+
+
+def run(produce, producer_end, consume, consumer_end, message, count):
+    """Start a producer process, consume every message in this process and
+    return the number of seconds it took.
+    """
+    producer = multiprocessing.Process(
+        target=produce, args=(producer_end, message, count)
+    )
+    start = time.perf_counter()
+    producer.start()
+    consume(consumer_end, count)
+    seconds = time.perf_counter() - start
+    producer.join()
+    return seconds
+
+
+def main():
+    """Run the benchmark for every transport."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-messages", type=int, default=200000)
+    parser.add_argument("--message-size", type=int, default=256)
+    parser.add_argument("--num-slots", type=int, default=1024)
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    message = bytes(args.message_size)
+    row = "%-20s %14s %10s"
+    print(row % ("transport", "messages/sec", "MB/sec"))
+
+    ring_buffer = SharedMemoryRingBuffer(args.num_slots, args.message_size + 4)
+    receiving, sending = multiprocessing.Pipe(duplex=False)
+    shared_queue = multiprocessing.Queue(args.num_slots)
+    transports = (
+        (
+            "ring buffer",
+            functools.partial(produce_ring_buffer, batch_size=args.batch_size),
+            functools.partial(consume_ring_buffer, batch_size=args.batch_size),
+            ring_buffer,
+        ),
+        ("pipe", produce_pipe, consume_pipe, (sending, receiving)),
+        ("multiprocessing.Queue", produce_queue, consume_queue, shared_queue),
+    )
+    for name, produce, consume, ends in transports:
+        producer_end, consumer_end = ends if isinstance(ends, tuple) else (ends, ends)
+        seconds = run(
+            produce, producer_end, consume, consumer_end, message, args.num_messages
+        )
+        print(
+            row
+            % (
+                name,
+                "%.0f" % (args.num_messages / seconds),
+                "%.1f" % (args.num_messages * args.message_size / seconds / 1e6),
+            )
+        )
+    ring_buffer.close()
+    ring_buffer.unlink()
+
+
+if __name__ == "__main__":
+    main()
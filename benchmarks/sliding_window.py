@@ -0,0 +1,54 @@
+"""This module benchmarks the monotonic deque's streaming sliding window
+helper against rescanning every window with min and max. Rescanning is
+O(window size) per sample while the monotonic deque is amortized O(1),
+so the gap grows with the window size.
+
+Run it from the root of the repository with:
+    python -m benchmarks.sliding_window --num-samples 1000000
+"""
+
+import argparse
+import random
+import time
+
+from data_structures.queues.monotonic_deque import sliding_window_min_max
+
+
+def rescan(values, window_size):
+    """Yield the minimum and maximum of every full window by rescanning
+    it.
+    """
+    for start in range(len(values) - window_size + 1):
+        window = values[start : start + window_size]
+        yield min(window), max(window)
+
+
+def samples_per_second(window_min_max, values, window_size):
+    """Consume every window aggregate and return the number of samples
+    processed per second.
+    """
+    start = time.perf_counter()
+    for _ in window_min_max(values, window_size):
+        pass
+    return len(values) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark for every window size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num-samples", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    values = [generator.gauss(0, 1) for _ in range(args.num_samples)]
+    row = "%-12s %18s %18s"
+    print(row % ("window size", "rescan samples/s", "deque samples/s"))
+    for window_size in (10, 100, 1000):
+        rescanned = samples_per_second(rescan, values, window_size)
+        streamed = samples_per_second(sliding_window_min_max, values, window_size)
+        print(row % (window_size, "%.0f" % rescanned, "%.0f" % streamed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""This module contains my implementation of a thread-safe hash table
+using chaining to handle key collisions. It uses the flat bucket layout
+of the chaining hash table ([hash, key, value, ...]) but every bucket is
+an immutable tuple, so writers replace whole buckets instead of editing
+them in place.
+
+- Reads take no lock. A reader looks up the current table and bucket
+  and scans a tuple that no other thread will ever change.
+- Writes are guarded by lock striping. The table has num_stripes locks,
+  and a key always uses lock hash % num_stripes. The capacity is always
+  a power-of-two multiple of num_stripes, so every bucket is guarded by
+  exactly one lock at any capacity.
+- Both the stripe and the bucket come from the low bits of the hash, so
+  the key's hash is first multiplied by 2^64 divided by the golden ratio
+  and its high half folded into its low half, as FibonacciHash does.
+  Otherwise keys such as multiples of 16 would all share one stripe.
+- The table doubles once the total number of items across every stripe
+  reaches its max load.
+- A resize takes every stripe lock in order, rehashes into a new table
+  and then publishes it by swapping the table reference, so readers see
+  either the old table or the new one, never a mix.
+"""
+
+import threading
+
+from data_structures.hash_tables.hash_functions import GOLDEN_RATIO_64, MASK_64
+from data_structures.hash_tables.hash_table_with_chaining import ArrayBuckets
+
+
+class ConcurrentHashTable:
+    """Class to represent a thread-safe hash table with striped locks."""
+
+    def __init__(
+        self, capacity=16, max_load_factor=0.75, num_stripes=16, hash_function=None
+    ):
+        if capacity < 1:
+            raise ValueError("Capacity must be greater than 1.")
+        if max_load_factor <= 0 or max_load_factor > 1:
+            raise ValueError(
+                "Max load factor must be greater than 0, but less than or equal to 1."
+            )
+        if num_stripes < 1 or num_stripes & (num_stripes - 1):
+            raise ValueError("Number of stripes must be a power of two.")
+        capacity = max(1 << (capacity - 1).bit_length(), num_stripes)
+        self._max_load_factor = max_load_factor
+        self._hash_function = hash if hash_function is None else hash_function
+        self._locks = [threading.Lock() for _ in range(num_stripes)]
+        self._stripe_counts = [0] * num_stripes
+        self._table = [None] * capacity
+
+    def get(self, key):
+        """Return the item associated with the given key. Takes no lock."""
+        if key is None:
+            raise KeyError("None is not a valid key")
+        hash_value = self._hash_function(key) * GOLDEN_RATIO_64 & MASK_64
+        hash_value ^= hash_value >> 32
+        table = self._table
+        bucket = table[hash_value & (len(table) - 1)]
+        if bucket:
+            entry = ArrayBuckets.find(bucket, key, hash_value)
+            if entry is not None:
+                return bucket[entry + 2]
+        return None
+
+    def put(self, key, value):
+        """Insert the given value into the hash table. If there is
+        already a value associated with the given key, then the
+        value will be overwritten.
+        """
+        if key is None:
+            raise KeyError("None is not a valid key")
+        hash_value = self._hash_function(key) * GOLDEN_RATIO_64 & MASK_64
+        hash_value ^= hash_value >> 32
+        stripe = hash_value & (len(self._locks) - 1)
+        with self._locks[stripe]:
+            table = self._table
+            bucket_index = hash_value & (len(table) - 1)
+            bucket = table[bucket_index] or ()
+            entry = ArrayBuckets.find(bucket, key, hash_value)
+            if entry is not None:
+                table[bucket_index] = (
+                    bucket[: entry + 2] + (value,) + bucket[entry + 3 :]
+                )
+                return
+            table[bucket_index] = bucket + (hash_value, key, value)
+            self._stripe_counts[stripe] += 1
+        if sum(self._stripe_counts) >= len(table) * self._max_load_factor:
+            self._resize(len(table) * 2)
+
+    def delete(self, key):
+        """Delete an item in the hash table with the given key."""
+        if key is None:
+            raise KeyError("None is not a valid key")
+        hash_value = self._hash_function(key) * GOLDEN_RATIO_64 & MASK_64
+        hash_value ^= hash_value >> 32
+        stripe = hash_value & (len(self._locks) - 1)
+        with self._locks[stripe]:
+            table = self._table
+            bucket_index = hash_value & (len(table) - 1)
+            bucket = table[bucket_index]
+            entry = None
+            if bucket:
+                entry = ArrayBuckets.find(bucket, key, hash_value)
+            if entry is None:
+                raise KeyError("Key not in hash table.")
+            table[bucket_index] = bucket[:entry] + bucket[entry + 3 :] or None
+            self._stripe_counts[stripe] -= 1
+
+    def exists(self, key):
+        """Return True if there is a value associated with the given key
+        in the hash table.
+        """
+        return self.get(key) is not None
+
+    def is_empty(self):
+        """Returns True or False depending on whether the hash table is empty."""
+        return self.num_items == 0
+
+    def keys(self):
+        """Return a list of keys found in the hash table. Concurrent writes
+        may or may not be reflected in the result.
+        """
+        return [key for _, key, _ in self._iter_entries()]
+
+    def values(self):
+        """Return a list of values found in the hash table. Concurrent
+        writes may or may not be reflected in the result.
+        """
+        return [value for _, _, value in self._iter_entries()]
+
+    def items(self):
+        """Return a list of tuples that contains the key-value pairs found
+        in the hash table. Concurrent writes may or may not be reflected in
+        the result.
+        """
+        return [(key, value) for _, key, value in self._iter_entries()]
+
+    def _iter_entries(self):
+        """Return a generator of (hash, key, value) tuples in the table."""
+        for bucket in self._table:
+            if bucket:
+                yield from ArrayBuckets.entries(bucket)
+
+    def clear(self):
+        """Clear all of the contents of the hash table."""
+        self._acquire_all()
+        try:
+            self._table = [None] * len(self._table)
+            self._stripe_counts = [0] * len(self._locks)
+        finally:
+            self._release_all()
+
+    @property
+    def num_items(self):
+        """Returns the number of items currently in the hash table."""
+        return sum(self._stripe_counts)
+
+    @property
+    def capacity(self):
+        """Returns the number of buckets in the current table."""
+        return len(self._table)
+
+    def _acquire_all(self):
+        """Acquire every stripe lock, always in the same order so that two
+        threads doing so can't deadlock.
+        """
+        for lock in self._locks:
+            lock.acquire()
+
+    def _release_all(self):
+        """Release every stripe lock."""
+        for lock in reversed(self._locks):
+            lock.release()
+
+    def _resize(self, capacity):
+        """Rehash every item into a new table with the given capacity and
+        publish it. If another thread already grew the table while this
+        one waited for the locks, nothing is done.
+        """
+        self._acquire_all()
+        try:
+            old_table = self._table
+            if len(old_table) >= capacity:
+                return
+            new_buckets = [[] for _ in range(capacity)]
+            mask = capacity - 1
+            for bucket in old_table:
+                if bucket:
+                    for index in range(0, len(bucket), 3):
+                        new_buckets[bucket[index] & mask].extend(
+                            bucket[index : index + 3]
+                        )
+            self._table = [
+                tuple(bucket) if bucket else None for bucket in new_buckets
+            ]
+        finally:
+            self._release_all()
+
+    def __getitem__(self, key):
+        """"Return the item associated with the given key."""
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        """Insert the given value into the hash table. If there is
+        already a value associated with the given key, then the
+        value will be overwritten.
+        """
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        """Delete an item in the hash table with the given key."""
+        self.delete(key)
+
+    def __contains__(self, key):
+        """Return True if there is a value associated with the given key
+        in the hash table.
+        """
+        return self.get(key) is not None
@@ -0,0 +1,134 @@
+"""This module contains hash functions that can be plugged into my hash
+table implementations through their hash_function argument. A hash
+function is any callable that maps a key to an integer, and equal keys
+must map to equal integers.
+
+- SipHash is a keyed hash. With a secret, random seed, someone who
+  controls the keys can't choose them so that they all land in the same
+  bucket (collision flooding).
+- FibonacciHash multiplies by 2^64 divided by the golden ratio. It sets
+  power_of_two, so the hash tables keep power-of-two capacities and
+  find buckets by masking the hash instead of using modulo.
+- ModularHash adapts the modular hashing functions sketched in
+  notes/hash_tables.py.
+"""
+
+import os
+
+from notes.hash_tables import hash_function_strings
+
+
+MASK_64 = (1 << 64) - 1
+GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15
+MERSENNE_PRIME_61 = (1 << 61) - 1
+
+
+def _rotate_left(value, shift):
+    """Rotate a 64 bit integer left by the given number of bits."""
+    return ((value << shift) | (value >> (64 - shift))) & MASK_64
+
+
+class SipHash:
+    """Class to represent SipHash-2-4 keyed with a 16 byte seed. Strings
+    are hashed from their UTF-8 encoding and bytes as they are. Any other
+    key is hashed from its built-in hash, so keys that compare equal, such
+    as 1 and 1.0, still hash equal.
+    """
+
+    power_of_two = False
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = os.urandom(16)
+        if len(seed) != 16:
+            raise ValueError("Seed must be 16 bytes long.")
+        self._k0 = int.from_bytes(seed[:8], "little")
+        self._k1 = int.from_bytes(seed[8:], "little")
+
+    def __call__(self, key):
+        """Return the 64 bit SipHash-2-4 hash of the given key."""
+        if isinstance(key, str):
+            data = key.encode("utf-8")
+        elif isinstance(key, (bytes, bytearray)):
+            data = bytes(key)
+        else:
+            data = (hash(key) & MASK_64).to_bytes(8, "little")
+        return self.hash_bytes(data)
+
+    def hash_bytes(self, data):
+        """Return the 64 bit SipHash-2-4 hash of the given bytes."""
+        v0 = self._k0 ^ 0x736F6D6570736575
+        v1 = self._k1 ^ 0x646F72616E646F6D
+        v2 = self._k0 ^ 0x6C7967656E657261
+        v3 = self._k1 ^ 0x7465646279746573
+        tail_start = len(data) - len(data) % 8
+        last_word = (len(data) & 0xFF) << 56 | int.from_bytes(
+            data[tail_start:], "little"
+        )
+        words = [
+            int.from_bytes(data[index : index + 8], "little")
+            for index in range(0, tail_start, 8)
+        ]
+        words.append(last_word)
+        for word in words:
+            v3 ^= word
+            for _ in range(2):
+                v0, v1, v2, v3 = self._sip_round(v0, v1, v2, v3)
+            v0 ^= word
+        v2 ^= 0xFF
+        for _ in range(4):
+            v0, v1, v2, v3 = self._sip_round(v0, v1, v2, v3)
+        return v0 ^ v1 ^ v2 ^ v3
+
+    @staticmethod
+    def _sip_round(v0, v1, v2, v3):
+        """Return the four state words after one SipRound."""
+        v0 = (v0 + v1) & MASK_64
+        v1 = _rotate_left(v1, 13) ^ v0
+        v0 = _rotate_left(v0, 32)
+        v2 = (v2 + v3) & MASK_64
+        v3 = _rotate_left(v3, 16) ^ v2
+        v0 = (v0 + v3) & MASK_64
+        v3 = _rotate_left(v3, 21) ^ v0
+        v2 = (v2 + v1) & MASK_64
+        v1 = _rotate_left(v1, 17) ^ v2
+        v2 = _rotate_left(v2, 32)
+        return v0, v1, v2, v3
+
+
+class FibonacciHash:
+    """Class to represent Fibonacci (multiplicative) hashing. The key's
+    built-in hash, xored with the seed, is multiplied by 2^64 divided by
+    the golden ratio. The high half of the product is then folded into
+    the low half, because masking only keeps the low bits and the high
+    bits are the well mixed ones.
+    """
+
+    power_of_two = True
+
+    def __init__(self, seed=0):
+        self._seed = seed & MASK_64
+
+    def __call__(self, key):
+        """Return the 64 bit Fibonacci hash of the given key."""
+        product = (((hash(key) & MASK_64) ^ self._seed) * GOLDEN_RATIO_64) & MASK_64
+        return product ^ (product >> 32)
+
+
+class ModularHash:
+    """Class to adapt one of the modular hashing functions in
+    notes/hash_tables.py, which take a key and a table size, to the
+    hash function interface. The function is called with a large prime
+    modulus, and the hash table then reduces the result to its own
+    capacity.
+    """
+
+    power_of_two = False
+
+    def __init__(self, function=hash_function_strings, modulus=MERSENNE_PRIME_61):
+        self._function = function
+        self._modulus = modulus
+
+    def __call__(self, key):
+        """Return the hash of the given key modulo the modulus."""
+        return self._function(key, self._modulus)
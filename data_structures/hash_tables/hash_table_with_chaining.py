@@ -1,7 +1,9 @@
 """This module contains my implementation of a hash table using chaining to 
-handle key collisions.
+handle key collisions. Each bucket is either a small flat list of cached
+hashes, keys and values, or a singly linked list of HashTableItems.
 """
 
+import time
 
 from data_structures.linked_lists.singly_linked_list_no_tail_pointer import (
     SinglyLinkedList,
@@ -13,18 +15,152 @@ class HashTableItem:
     chaining to handle key collisions.
     """
 
-    def __init__(self, key, value):
+    def __init__(self, key, value, hash_value=None):
         self.key = key
         self.value = value
+        self.hash_value = hash_value
 
     def __eq__(self, other):
         return self.key == other.key
 
 
+class ArrayBuckets:
+    """Class that holds the operations for buckets stored as flat lists
+    of [hash, key, value, hash, key, value, ...] entries. An entry is
+    referred to by the index of its hash in the list.
+    """
+
+    @staticmethod
+    def new_bucket():
+        """Return a new, empty bucket."""
+        return []
+
+    @staticmethod
+    def find(bucket, key, hash_value):
+        """Return the index of the entry with the given key, or None if
+        the key is not in the bucket. Stored hashes are compared before
+        keys so that most mismatches never call __eq__.
+        """
+        for index in range(0, len(bucket), 3):
+            if bucket[index] == hash_value:
+                stored_key = bucket[index + 1]
+                if stored_key is key or stored_key == key:
+                    return index
+        return None
+
+    @staticmethod
+    def get_value(bucket, entry):
+        """Return the value of the given entry."""
+        return bucket[entry + 2]
+
+    @staticmethod
+    def set_value(bucket, entry, value):
+        """Overwrite the value of the given entry."""
+        bucket[entry + 2] = value
+
+    @staticmethod
+    def append(bucket, hash_value, key, value):
+        """Add an entry to the bucket without checking for its key."""
+        bucket.extend((hash_value, key, value))
+
+    @staticmethod
+    def remove(bucket, entry):
+        """Remove the given entry by moving the last entry into its place."""
+        bucket[entry : entry + 3] = bucket[-3:]
+        del bucket[-3:]
+
+    @staticmethod
+    def entries(bucket):
+        """Return a generator of (hash, key, value) tuples in the bucket."""
+        for index in range(0, len(bucket), 3):
+            yield bucket[index], bucket[index + 1], bucket[index + 2]
+
+
+class LinkedListBuckets:
+    """Class that holds the operations for buckets stored as singly
+    linked lists of HashTableItems. An entry is referred to by its
+    HashTableItem.
+    """
+
+    @staticmethod
+    def new_bucket():
+        """Return a new, empty bucket."""
+        return SinglyLinkedList()
+
+    @staticmethod
+    def find(bucket, key, hash_value):
+        """Return the HashTableItem with the given key, or None if the
+        key is not in the bucket.
+        """
+        return bucket.find_value(HashTableItem(key, None))
+
+    @staticmethod
+    def get_value(bucket, entry):
+        """Return the value of the given entry."""
+        return entry.value
+
+    @staticmethod
+    def set_value(bucket, entry, value):
+        """Overwrite the value of the given entry."""
+        entry.value = value
+
+    @staticmethod
+    def append(bucket, hash_value, key, value):
+        """Add an entry to the bucket without checking for its key."""
+        bucket.push_front(HashTableItem(key, value, hash_value))
+
+    @staticmethod
+    def remove(bucket, entry):
+        """Remove the given entry from the bucket."""
+        bucket.remove_node(entry)
+
+    @staticmethod
+    def entries(bucket):
+        """Return a generator of (hash, key, value) tuples in the bucket."""
+        for item in bucket:
+            yield item.hash_value, item.key, item.value
+
+
+BUCKET_TYPES = {"array": ArrayBuckets, "linked_list": LinkedListBuckets}
+
+
 class HashTable:
-    """Class to represent a hash table."""
+    """Class to represent a hash table.
+
+    The bucket_type argument picks how each bucket is stored: "array"
+    (the default) keeps a flat list of cached hashes, keys and values,
+    while "linked_list" keeps a SinglyLinkedList of HashTableItems.
+
+    When incremental_resize is True, growing or shrinking the table does
+    not rehash every item at once. The old table is kept alongside the
+    new one and each get, put or delete migrates up to rehash_step of the
+    old buckets, until the old table is empty and can be dropped.
+
+    The hash_function argument is a callable mapping a key to an integer,
+    such as the ones in the hash_functions module, and defaults to the
+    built-in hash. If the hash function has a true power_of_two attribute,
+    the capacity is kept at a power of two and buckets are found by
+    masking the hash rather than taking it modulo the capacity.
 
-    def __init__(self, capacity=8, max_load_factor=0.75, min_load_factor=0.25):
+    The table never shrinks below min_capacity, and only shrinks when the
+    halved table would still be below the max load factor. With a
+    shrink_delay greater than 0, a shrink also waits until that many
+    deletes in a row have left the table at or below the min load factor,
+    so workloads that churn around a boundary do not keep rehashing.
+    """
+
+    def __init__(
+        self,
+        capacity=8,
+        max_load_factor=0.75,
+        min_load_factor=0.25,
+        incremental_resize=False,
+        rehash_step=16,
+        min_capacity=1,
+        shrink_delay=0,
+        bucket_type="array",
+        hash_function=None,
+    ):
         if capacity < 1:
             raise ValueError("Capacity must be greater than 1.")
         if max_load_factor <= 0 or max_load_factor > 1:
@@ -35,25 +171,62 @@ class HashTable:
             raise ValueError(
                 "Min load factor must be greater than 0, but less than or equal to 1."
             )
+        if rehash_step < 1:
+            raise ValueError("Rehash step must be at least 1.")
+        if min_capacity < 1:
+            raise ValueError("Min capacity must be at least 1.")
+        if shrink_delay < 0:
+            raise ValueError("Shrink delay can't be less than 0.")
+        if bucket_type not in BUCKET_TYPES:
+            raise ValueError(
+                "Bucket type must be one of %s." % ", ".join(BUCKET_TYPES)
+            )
+        capacity = max(capacity, min_capacity)
+        self._hash_function = hash if hash_function is None else hash_function
+        self._power_of_two = getattr(hash_function, "power_of_two", False)
+        if self._power_of_two:
+            capacity = 1 << (capacity - 1).bit_length()
+            min_capacity = 1 << (min_capacity - 1).bit_length()
+        self._buckets = BUCKET_TYPES[bucket_type]
         self._capacity = capacity
         self._max_load_factor = max_load_factor
         self._min_load_factor = min_load_factor
+        self._incremental_resize = incremental_resize
+        self._rehash_step = rehash_step
+        self._min_capacity = min_capacity
+        self._shrink_delay = shrink_delay
+        self._low_load_deletes = 0
+        self._resize_stats = {"grows": 0, "shrinks": 0, "rehashes": 0, "seconds": 0.0}
         self._table = [None] * self._capacity
+        self._old_table = None
+        self._rehash_index = 0
         self._num_items = 0
 
     def get(self, key):
         """Return the item associated with the given key."""
         if key is None:
             raise KeyError("None is not a valid key")
-        bucket_index = self._hash_key(key)
-        linked_list = self._table[bucket_index]
-        if not linked_list:
+        if self._old_table is not None:
+            self._rehash_old_buckets()
+        bucket, entry = self._find_entry(key, self._hash_function(key))
+        if entry is None:
             return None
-        hash_table_item = HashTableItem(key, None)
-        returned_item = linked_list.find_value(hash_table_item)
-        if not returned_item:
-            return None
-        return returned_item.value
+        return self._buckets.get_value(bucket, entry)
+
+    def _find_entry(self, key, hash_value):
+        """Return the bucket that holds the given key and the key's entry
+        in that bucket, or (None, None) if the key is not in the hash table.
+        While a resize is in progress the key may still be in the old table.
+        """
+        for table in (self._table, self._old_table):
+            if table is None:
+                continue
+            bucket = table[self._bucket_index(hash_value, len(table))]
+            if bucket:
+                entry = self._buckets.find(bucket, key, hash_value)
+                if entry is not None:
+                    return bucket, entry
+        return None, None
 
     def put(self, key, value):
         """Insert the given value into the hash table. If there is
@@ -62,36 +235,115 @@ class HashTable:
         """
         if key is None:
             raise KeyError("None is not a valid key")
-        bucket_index = self._hash_key(key)
-        hash_table_item = HashTableItem(key, value)
-        if not self._table[bucket_index]:
-            self._table[bucket_index] = SinglyLinkedList()
-        linked_list = self._table[bucket_index]
-        returned_item = linked_list.find_value(hash_table_item)
-        if not returned_item:
-            linked_list.push_front(hash_table_item)
+        if self._old_table is not None:
+            self._rehash_old_buckets()
+        hash_value = self._hash_function(key)
+        bucket, entry = self._find_entry(key, hash_value)
+        if entry is None:
+            self._insert_entry(self._table, hash_value, key, value)
             self._num_items += 1
             if self._should_double():
                 self._resize_table(2)
         else:
-            returned_item.value = value
+            self._buckets.set_value(bucket, entry, value)
+
+    def _insert_entry(self, table, hash_value, key, value):
+        """Add the given entry to its bucket in the given table, without
+        checking whether its key is already there.
+        """
+        bucket_index = self._bucket_index(hash_value, len(table))
+        if table[bucket_index] is None:
+            table[bucket_index] = self._buckets.new_bucket()
+        self._buckets.append(table[bucket_index], hash_value, key, value)
 
     def delete(self, key):
         """Delete an item in the hash table with the given key."""
+        self._remove(key)
+        if self._should_halve():
+            self._low_load_deletes += 1
+            if self._low_load_deletes > self._shrink_delay:
+                self._resize_table(0.5)
+        else:
+            self._low_load_deletes = 0
+
+    def _remove(self, key):
+        """Delete the item with the given key without shrinking the table."""
         if key is None:
             raise KeyError("None is not a valid key")
-        bucket_index = self._hash_key(key)
-        hash_table_item = HashTableItem(key, None)
-        linked_list = self._table[bucket_index]
-        if linked_list is None:
+        if self._old_table is not None:
+            self._rehash_old_buckets()
+        bucket, entry = self._find_entry(key, self._hash_function(key))
+        if entry is None:
             raise KeyError("Key not in hash table.")
-        node = linked_list.find_value(hash_table_item)
-        if not node:
-            raise KeyError("Key not in hash table")
-        linked_list.remove_node(hash_table_item)
+        self._buckets.remove(bucket, entry)
         self._num_items -= 1
-        if self._should_halve():
-            self._resize_table(0.5)
+
+    @classmethod
+    def from_items(cls, items, expected_size=None, **kwargs):
+        """Return a new hash table holding the given key-value pairs
+        or mapping.
+        The table is sized up front for expected_size items, which
+        defaults to len(items) when items has a length, so that loading
+        it never triggers a resize. Any other keyword arguments are passed
+        on to the constructor.
+        """
+        hash_table = cls(**kwargs)
+        if expected_size is None and hasattr(items, "__len__"):
+            expected_size = len(items)
+        if expected_size:
+            hash_table.reserve(expected_size)
+        hash_table.put_many(items)
+        return hash_table
+
+    def reserve(self, expected_size):
+        """Grow the table once, so that it can hold expected_size items
+        without resizing again.
+        """
+        capacity = self._capacity
+        while expected_size >= capacity * self._max_load_factor:
+            capacity *= 2
+        if capacity > self._capacity:
+            self._resize_to(capacity)
+
+    def put_many(self, items):
+        """Insert each of the given key-value pairs, or each item of the
+        given mapping, into the hash table. If items has a length, the
+        table is grown once up front rather than doubling repeatedly while
+        the pairs are inserted.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        if hasattr(items, "__len__"):
+            self.reserve(self._num_items + len(items))
+        for key, value in items:
+            self.put(key, value)
+
+    def get_many(self, keys):
+        """Return a list of the values associated with the given keys,
+        with None for each key that is not in the hash table.
+        """
+        return [self.get(key) for key in keys]
+
+    def delete_many(self, keys):
+        """Delete the items with the given keys, then shrink the table
+        at most once. If a key is not in the hash table a KeyError is
+        raised, and the keys before it stay deleted.
+        """
+        try:
+            for key in keys:
+                self._remove(key)
+        finally:
+            self._shrink_to_fit()
+
+    def _shrink_to_fit(self):
+        """Halve the capacity for as long as the table would otherwise
+        shrink on its next delete, then resize at most once.
+        """
+        capacity = self._capacity
+        while self._should_halve(capacity):
+            capacity //= 2
+        if capacity < self._capacity:
+            self._resize_to(capacity)
 
     def exists(self, key):
         """Return True if there is a value associated with the given key 
@@ -105,68 +357,149 @@ class HashTable:
 
     def keys(self):
         """Return a list of keys found in the hash table."""
-        keys = []
-        for linked_list in self._table:
-            if linked_list:
-                for hash_table_item in linked_list:
-                    keys.append(hash_table_item.key)
-        return keys
+        return [key for _, key, _ in self._iter_entries()]
 
     def values(self):
         """Return a list of values found in the hash table."""
-        values = []
-        for linked_list in self._table:
-            if linked_list:
-                for hash_table_item in linked_list:
-                    values.append(hash_table_item.value)
-        return values
+        return [value for _, _, value in self._iter_entries()]
 
     def items(self):
         """Return a list of tuples that contains the key-value
         pairs found in the hash table.
         """
-        pairs = []
-        for linked_list in self._table:
-            if linked_list:
-                for hash_table_item in linked_list:
-                    pairs.append((hash_table_item.key, hash_table_item.value))
-        return pairs
+        return [(key, value) for _, key, value in self._iter_entries()]
+
+    def _iter_entries(self):
+        """Return a generator of (hash, key, value) tuples in the hash
+        table, including any not yet migrated out of the old table.
+        """
+        for table in (self._table, self._old_table):
+            if table is None:
+                continue
+            for bucket in table:
+                if bucket:
+                    yield from self._buckets.entries(bucket)
 
     def clear(self):
         """Clear all of the contents of the hash table."""
         self._table = [None] * self._capacity
+        self._old_table = None
+        self._rehash_index = 0
         self._num_items = 0
 
+    def is_resizing(self):
+        """Return True if an incremental resize is still in progress."""
+        return self._old_table is not None
+
     @property
     def num_items(self):
         """Returns the number of items currently in the hash table."""
         return self._num_items
 
-    def _hash_key(self, key):
-        """Map the given key to a value from 0 to num_buckets - 1."""
-        return hash(key) % self._capacity
+    def _bucket_index(self, hash_value, capacity):
+        """Map the given hash to a value from 0 to capacity - 1."""
+        if self._power_of_two:
+            return hash_value & (capacity - 1)
+        return hash_value % capacity
 
     def _should_double(self):
         """Return True if the table size should be doubled."""
         return self._num_items >= self._capacity * self._max_load_factor
 
-    def _should_halve(self):
-        """Return True if the table size should be halved."""
-        return self._num_items <= self._capacity * self._min_load_factor
+    def _should_halve(self, capacity=None):
+        """Return True if the table size should be halved. The capacity
+        defaults to the capacity of the current table.
+        """
+        if capacity is None:
+            capacity = self._capacity
+        half_capacity = capacity // 2
+        return (
+            half_capacity >= self._min_capacity
+            and self._num_items <= capacity * self._min_load_factor
+            and self._num_items < half_capacity * self._max_load_factor
+        )
+
+    def resize_stats(self):
+        """Return a dictionary with the number of times the table has
+        grown, shrunk and been rehashed at the same size, and the total
+        number of seconds spent resizing, including the migration steps
+        of incremental resizes.
+        """
+        return dict(self._resize_stats)
 
     def _resize_table(self, multiple):
         """Rehash the contents of the current hash table into a new
         table by growing or shrinking the table, depending on the multiple
-        that is passed in.
+        that is passed in. With incremental resizing, the new table is
+        only allocated here and the items are migrated by later operations.
         """
-        old_table = self._table.copy()
-        self._num_items = 0
-        self._capacity = int(self._capacity * multiple)
+        self._resize_to(int(self._capacity * multiple))
+
+    def _resize_to(self, capacity):
+        """Rehash the contents of the current hash table into a new table
+        with the given capacity.
+        """
+        start = time.perf_counter()
+        if capacity > self._capacity:
+            self._resize_stats["grows"] += 1
+        elif capacity < self._capacity:
+            self._resize_stats["shrinks"] += 1
+        else:
+            self._resize_stats["rehashes"] += 1
+        self._low_load_deletes = 0
+        self._rebuild(capacity)
+        self._resize_stats["seconds"] += time.perf_counter() - start
+
+    def _rebuild(self, capacity):
+        """Move the contents of the hash table into a new table with the
+        given capacity, or start doing so when resizing incrementally.
+        """
+        if self._incremental_resize:
+            if self._old_table is not None:
+                self._finish_rehash()
+            self._old_table = self._table
+            self._rehash_index = 0
+            self._capacity = capacity
+            self._table = [None] * self._capacity
+            self._migrate_old_buckets()
+            return
+        old_table = self._table
+        self._capacity = capacity
         self._table = [None] * self._capacity
-        for linked_list in old_table:
-            if linked_list:
-                for hash_table_item in linked_list:
-                    self.put(hash_table_item.key, hash_table_item.value)
+        for bucket in old_table:
+            if bucket:
+                for hash_value, key, value in self._buckets.entries(bucket):
+                    self._insert_entry(self._table, hash_value, key, value)
+
+    def _rehash_old_buckets(self):
+        """Migrate up to rehash_step buckets from the old table, adding the
+        time taken to the resize statistics.
+        """
+        start = time.perf_counter()
+        self._migrate_old_buckets()
+        self._resize_stats["seconds"] += time.perf_counter() - start
+
+    def _migrate_old_buckets(self):
+        """Migrate up to rehash_step buckets from the old table into the
+        current table, dropping the old table once it is empty.
+        """
+        old_table = self._old_table
+        stop = min(self._rehash_index + self._rehash_step, len(old_table))
+        for bucket_index in range(self._rehash_index, stop):
+            bucket = old_table[bucket_index]
+            if bucket:
+                for hash_value, key, value in self._buckets.entries(bucket):
+                    self._insert_entry(self._table, hash_value, key, value)
+            old_table[bucket_index] = None
+        self._rehash_index = stop
+        if stop == len(old_table):
+            self._old_table = None
+            self._rehash_index = 0
+
+    def _finish_rehash(self):
+        """Migrate every remaining bucket out of the old table."""
+        while self._old_table is not None:
+            self._migrate_old_buckets()
 
     def __getitem__(self, key):
         """"Return the item associated with the given key."""
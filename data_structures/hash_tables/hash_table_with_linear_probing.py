@@ -1,7 +1,14 @@
 """This module contains my implementation of a hash table using
-linear probing (open addressing) to handle key collisions.
+linear probing (open addressing) to handle key collisions. Quadratic
+probing, double hashing and Robin Hood hashing can be selected instead
+when the table is created.
 """
 
+import time
+
+
+PROBING_STRATEGIES = ("linear", "quadratic", "double_hashing", "robin_hood")
+
 
 class Tombstone:
     """Class to act as a placeholder for a deleted item in a hash
@@ -16,9 +23,10 @@ class Tombstone:
 class HashItem:
     """Class to represent a key-value pair in a hash table."""
 
-    def __init__(self, key, value):
+    def __init__(self, key, value, hash_value=None):
         self.key = key
         self.value = value
+        self.hash_value = hash_value
 
     def __repr__(self):
         """Return a string representation of a HashItem."""
@@ -26,9 +34,52 @@ class HashItem:
 
 
 class HashTable:
-    """Class to represent a hash table."""
+    """Class to represent a hash table.
+
+    The probing argument picks how collisions are resolved:
+        - "linear" steps to the next slot
+        - "quadratic" steps 1, 2, 3... slots further on each attempt
+        - "double_hashing" steps by an odd amount derived from the key's hash
+        - "robin_hood" steps like "linear", but an item that is further from
+          its home bucket takes the slot of an item that is closer to its own,
+          and deletes shift the following items back instead of leaving
+          tombstones
+
+    Quadratic probing and double hashing only visit every slot when the
+    capacity is a power of two, so for those the capacity is rounded up
+    to the next power of two.
+
+    The hash_function argument is a callable mapping a key to an integer,
+    such as the ones in the hash_functions module, and defaults to the
+    built-in hash. Each item caches its key's hash, so keys are only
+    hashed once. If the hash function has a true power_of_two attribute,
+    the capacity is kept at a power of two and home buckets are found by
+    masking the hash rather than taking it modulo the capacity.
 
-    def __init__(self, capacity=8, min_load_factor=0.25, max_load_factor=0.75):
+    When incremental_resize is True, growing or shrinking the table does
+    not rehash every item at once. The old table is kept alongside the
+    new one and each get, put or delete migrates up to rehash_step of the
+    old slots, until the old table is empty and can be dropped.
+
+    The table never shrinks below min_capacity, and only shrinks when the
+    halved table would still be below the max load factor. With a
+    shrink_delay greater than 0, a shrink also waits until that many
+    deletes in a row have left the table at or below the min load factor,
+    so workloads that churn around a boundary do not keep rehashing.
+    """
+
+    def __init__(
+        self,
+        capacity=8,
+        min_load_factor=0.25,
+        max_load_factor=0.75,
+        probing="linear",
+        incremental_resize=False,
+        rehash_step=16,
+        min_capacity=1,
+        shrink_delay=0,
+        hash_function=None,
+    ):
         if capacity < 1:
             raise ValueError("Capacity must be greater than 1.")
         if min_load_factor <= 0 or min_load_factor > 1:
@@ -39,19 +90,56 @@ class HashTable:
             raise ValueError(
                 "Max load factor must be greater than 0 but less than or equal to 1."
             )
+        if probing not in PROBING_STRATEGIES:
+            raise ValueError(
+                "Probing must be one of %s." % ", ".join(PROBING_STRATEGIES)
+            )
+        if rehash_step < 1:
+            raise ValueError("Rehash step must be at least 1.")
+        if min_capacity < 1:
+            raise ValueError("Min capacity must be at least 1.")
+        if shrink_delay < 0:
+            raise ValueError("Shrink delay can't be less than 0.")
+        capacity = max(capacity, min_capacity)
+        self._hash_function = hash if hash_function is None else hash_function
+        self._power_of_two = getattr(hash_function, "power_of_two", False)
+        if self._power_of_two or probing in ("quadratic", "double_hashing"):
+            capacity = 1 << (capacity - 1).bit_length()
+            min_capacity = 1 << (min_capacity - 1).bit_length()
+        self._probing = probing
         self._capacity = capacity
         self._min_load_factor = min_load_factor
         self._max_load_factor = max_load_factor
+        self._incremental_resize = incremental_resize
+        self._rehash_step = rehash_step
+        self._min_capacity = min_capacity
+        self._shrink_delay = shrink_delay
+        self._low_load_deletes = 0
+        self._resize_stats = {"grows": 0, "shrinks": 0, "rehashes": 0, "seconds": 0.0}
         self._num_items = 0
+        self._num_tombstones = 0
         self._table = [None] * self._capacity
+        self._old_table = None
+        self._rehash_index = 0
 
     def get(self, key):
         """Return the item associated with the given key."""
         if key is not None:
-            bucket_index = self._hash(key)
-            item_index = self._find_item_index(key, bucket_index)
-            if self._table[item_index] is not None:
-                return self._table[item_index].value
+            if self._old_table is not None:
+                self._rehash_old_slots()
+            hash_value = self._hash_function(key)
+            if self._probing == "robin_hood":
+                item_index = self._robin_hood_find(key, hash_value)
+            else:
+                item_index = self._probe(key, hash_value)
+            if item_index is not None:
+                item = self._table[item_index]
+                if isinstance(item, HashItem):
+                    return item.value
+            if self._old_table is not None:
+                item_index = self._find_old_item_index(key, hash_value)
+                if item_index is not None:
+                    return self._old_table[item_index].value
         return None
 
     def put(self, key, value):
@@ -61,35 +149,309 @@ class HashTable:
         """
         if key is None:
             raise KeyError("None is not a valid key.")
-        bucket_index = self._hash(key)
-        item_index = self._find_item_index(key, bucket_index)
-        if self._table[item_index] is None:
-            self._table[item_index] = HashItem(key, value)
-            self._num_items += 1
-            if self._should_double():
-                self._resize_table(2)
-        else:
-            self._table[item_index].value = value
+        if self._old_table is not None:
+            self._rehash_old_slots()
+        hash_value = self._hash_function(key)
+        if self._old_table is not None:
+            item_index = self._find_old_item_index(key, hash_value)
+            if item_index is not None:
+                self._old_table[item_index].value = value
+                return
+        if self._probing == "robin_hood":
+            self._robin_hood_put(key, value, hash_value)
+            return
+        item_index = self._probe(key, hash_value)
+        item = self._table[item_index]
+        if isinstance(item, HashItem):
+            item.value = value
+            return
+        if item is not None:
+            self._num_tombstones -= 1
+        self._table[item_index] = HashItem(key, value, hash_value)
+        self._num_items += 1
+        if self._should_double():
+            self._resize_table(2)
+        elif self._should_compact():
+            self._resize_table(1)
 
     def delete(self, key):
         """Delete an item in the hash table with the given key."""
+        self._remove(key)
+        if self._should_halve():
+            self._low_load_deletes += 1
+            if self._low_load_deletes > self._shrink_delay:
+                self._resize_table(0.5)
+        else:
+            self._low_load_deletes = 0
+
+    def _remove(self, key):
+        """Delete the item with the given key without shrinking the table."""
         if key is None:
             raise KeyError("None is not a valid key")
-        bucket_index = self._hash(key)
-        item_index = self._find_item_index(key, bucket_index)
-        if self._table[item_index] is None:
-            raise KeyError("Key not in hash table.")
-        self._table[item_index] = Tombstone()
+        if self._old_table is not None:
+            self._rehash_old_slots()
+        hash_value = self._hash_function(key)
+        item_index = self._find_item_index(key, hash_value)
+        if item_index is None:
+            self._delete_old_item(key, hash_value)
+        elif self._probing == "robin_hood":
+            self._backward_shift(item_index)
+        else:
+            self._table[item_index] = Tombstone()
+            self._num_tombstones += 1
         self._num_items -= 1
-        if self._should_halve():
-            self._resize_table(0.5)
 
-    def _find_item_index(self, key, bucket_index):
-        while True:
+    def _delete_old_item(self, key, hash_value):
+        """Delete the item with the given key from the old table. The old
+        table only ever gets tombstones, so items are never shifted back
+        into slots that have already been migrated.
+        """
+        item_index = None
+        if self._old_table is not None:
+            item_index = self._find_old_item_index(key, hash_value)
+        if item_index is None:
+            raise KeyError("Key not in hash table.")
+        self._old_table[item_index] = Tombstone()
+
+    def _probe_steps(self, hash_value, capacity):
+        """Return the home bucket of a key with the given hash, the step to
+        its second slot and how much the step grows after each slot. Each
+        index in the probe sequence is the last one plus the step, modulo
+        the capacity.
+        """
+        bucket_index = self._bucket_index(hash_value, capacity)
+        if self._probing == "quadratic":
+            return bucket_index, 1, 1
+        if self._probing == "double_hashing":
+            return bucket_index, ((hash_value // capacity) | 1) % capacity, 0
+        return bucket_index, 1, 0
+
+    def _probe_sequence(self, hash_value, capacity=None):
+        """Yield the indices of the slots to examine for a key with the
+        given hash, starting at its home bucket. At most capacity indices
+        are yielded, so a search ends even if no empty slot is left. The
+        capacity defaults to the capacity of the current table.
+        """
+        if capacity is None:
+            capacity = self._capacity
+        bucket_index, step, growth = self._probe_steps(hash_value, capacity)
+        for _ in range(capacity):
+            yield bucket_index
+            bucket_index = (bucket_index + step) % capacity
+            step += growth
+
+    def _probe(self, key, hash_value, table=None):
+        """Walk the probe sequence of the given key in the given table,
+        which defaults to the current one. Return the index of the item
+        with the given key if it is there. Otherwise return the index of
+        the first tombstone on the probe sequence, or of the empty slot
+        that ends it, or None if every slot was examined. Cached hashes are
+        compared before keys so that most mismatches never call __eq__.
+        The slots are stepped through in a plain loop rather than with
+        _probe_sequence, since that is faster.
+        """
+        if table is None:
+            table = self._table
+        capacity = len(table)
+        if self._probing == "linear":
+            step, growth = 1, 0
+            if self._power_of_two:
+                index = hash_value & (capacity - 1)
+            else:
+                index = hash_value % capacity
+        else:
+            index, step, growth = self._probe_steps(hash_value, capacity)
+        tombstone_index = None
+        remaining = capacity
+        while remaining:
+            item = table[index]
+            if item is None:
+                break
+            if isinstance(item, HashItem):
+                if item.hash_value == hash_value and item.key == key:
+                    return index
+            elif tombstone_index is None:
+                tombstone_index = index
+            index += step
+            if index >= capacity:
+                index -= capacity
+            step += growth
+            remaining -= 1
+        else:
+            return tombstone_index
+        if tombstone_index is not None:
+            return tombstone_index
+        return index
+
+    def _find_item_index(self, key, hash_value):
+        """Return the index of the item with the given key, or None if
+        the key is not in the hash table.
+        """
+        if self._probing == "robin_hood":
+            return self._robin_hood_find(key, hash_value)
+        index = self._probe(key, hash_value)
+        if index is not None and isinstance(self._table[index], HashItem):
+            return index
+        return None
+
+    def _find_old_item_index(self, key, hash_value):
+        """Return the index of the item with the given key in the old
+        table, or None if the key is not there. Robin Hood tables are
+        searched without stopping early, since the old table may hold
+        tombstones.
+        """
+        index = self._probe(key, hash_value, self._old_table)
+        if index is not None and isinstance(self._old_table[index], HashItem):
+            return index
+        return None
+
+    def _distance_from_home(self, index):
+        """Return how many slots the item at the given index sits past
+        its home bucket. Only meaningful for Robin Hood probing.
+        """
+        home = self._bucket_index(self._table[index].hash_value, self._capacity)
+        return (index - home) % self._capacity
+
+    def _robin_hood_find(self, key, hash_value):
+        """Return the index of the item with the given key, or None if
+        the key is not in the hash table. The search stops early once it
+        reaches an item that is closer to its home bucket than the key
+        would be, since the key would have displaced that item.
+        """
+        bucket_index = self._bucket_index(hash_value, self._capacity)
+        for distance in range(self._capacity):
             item = self._table[bucket_index]
-            if item is None or (isinstance(item, HashItem) and item.key == key):
+            if item is None or self._distance_from_home(bucket_index) < distance:
+                return None
+            if item.hash_value == hash_value and item.key == key:
                 return bucket_index
             bucket_index = (bucket_index + 1) % self._capacity
+        return None
+
+    def _robin_hood_put(self, key, value, hash_value):
+        """Insert or update the given key using Robin Hood hashing."""
+        item_index = self._robin_hood_find(key, hash_value)
+        if item_index is not None:
+            self._table[item_index].value = value
+            return
+        self._robin_hood_insert(HashItem(key, value, hash_value))
+        self._num_items += 1
+        if self._should_double():
+            self._resize_table(2)
+
+    def _robin_hood_insert(self, item):
+        """Place the given item, whose key is not in the table, starting
+        at its home bucket and displacing items closer to their home.
+        """
+        bucket_index = self._bucket_index(item.hash_value, self._capacity)
+        distance = 0
+        while True:
+            current = self._table[bucket_index]
+            if current is None:
+                self._table[bucket_index] = item
+                return
+            current_distance = self._distance_from_home(bucket_index)
+            if current_distance < distance:
+                self._table[bucket_index] = item
+                item = current
+                distance = current_distance
+            bucket_index = (bucket_index + 1) % self._capacity
+            distance += 1
+
+    def _insert_item(self, item):
+        """Place the given item, whose key is not in the current table,
+        without triggering a resize.
+        """
+        if self._probing == "robin_hood":
+            self._robin_hood_insert(item)
+            return
+        index = self._probe(item.key, item.hash_value)
+        if index is not None:
+            if self._table[index] is not None:
+                self._num_tombstones -= 1
+            self._table[index] = item
+
+    def _backward_shift(self, item_index):
+        """Remove the item at the given index and shift each following
+        item that is not in its home bucket back by one slot, so that
+        Robin Hood probing never needs tombstones.
+        """
+        next_index = (item_index + 1) % self._capacity
+        while (
+            self._table[next_index] is not None
+            and self._distance_from_home(next_index) > 0
+        ):
+            self._table[item_index] = self._table[next_index]
+            item_index = next_index
+            next_index = (next_index + 1) % self._capacity
+        self._table[item_index] = None
+
+    @classmethod
+    def from_items(cls, items, expected_size=None, **kwargs):
+        """Return a new hash table holding the given key-value pairs
+        or mapping.
+        The table is sized up front for expected_size items, which
+        defaults to len(items) when items has a length, so that loading
+        it never triggers a resize. Any other keyword arguments are passed
+        on to the constructor.
+        """
+        hash_table = cls(**kwargs)
+        if expected_size is None and hasattr(items, "__len__"):
+            expected_size = len(items)
+        if expected_size:
+            hash_table.reserve(expected_size)
+        hash_table.put_many(items)
+        return hash_table
+
+    def reserve(self, expected_size):
+        """Grow the table once, so that it can hold expected_size items
+        without resizing again.
+        """
+        capacity = self._capacity
+        while expected_size >= capacity * self._max_load_factor:
+            capacity *= 2
+        if capacity > self._capacity:
+            self._resize_to(capacity)
+
+    def put_many(self, items):
+        """Insert each of the given key-value pairs, or each item of the
+        given mapping, into the hash table. If items has a length, the
+        table is grown once up front rather than doubling repeatedly while
+        the pairs are inserted.
+        """
+        if hasattr(items, "items"):
+            items = items.items()
+        if hasattr(items, "__len__"):
+            self.reserve(self._num_items + len(items))
+        for key, value in items:
+            self.put(key, value)
+
+    def get_many(self, keys):
+        """Return a list of the values associated with the given keys,
+        with None for each key that is not in the hash table.
+        """
+        return [self.get(key) for key in keys]
+
+    def delete_many(self, keys):
+        """Delete the items with the given keys, then shrink the table
+        at most once. If a key is not in the hash table a KeyError is
+        raised, and the keys before it stay deleted.
+        """
+        try:
+            for key in keys:
+                self._remove(key)
+        finally:
+            self._shrink_to_fit()
+
+    def _shrink_to_fit(self):
+        """Halve the capacity for as long as the table would otherwise
+        shrink on its next delete, then resize at most once.
+        """
+        capacity = self._capacity
+        while self._should_halve(capacity):
+            capacity //= 2
+        if capacity < self._capacity:
+            self._resize_to(capacity)
 
     def exists(self, key):
         """Return True if there is a value associated with the given key 
@@ -104,31 +466,73 @@ class HashTable:
     def clear(self):
         """Clear all of the contents of the hash table."""
         self._table = [None] * self._capacity
+        self._old_table = None
+        self._rehash_index = 0
         self._num_items = 0
+        self._num_tombstones = 0
+
+    def is_resizing(self):
+        """Return True if an incremental resize is still in progress."""
+        return self._old_table is not None
 
     @property
     def num_items(self):
         """Returns the number of items currently in the hash table."""
         return self._num_items
 
+    @property
+    def num_tombstones(self):
+        """Returns the number of tombstones currently in the hash table."""
+        return self._num_tombstones
+
+    def probe_length_stats(self):
+        """Return a dictionary with the mean and max probe length of the
+        items in the hash table, and a histogram mapping each probe length
+        to the number of items with that length. An item found in its home
+        bucket has a probe length of 1. Items still waiting in the old table
+        during an incremental resize are not counted.
+        """
+        histogram = {}
+        for index, item in enumerate(self._table):
+            if isinstance(item, HashItem):
+                probe_sequence = self._probe_sequence(item.hash_value)
+                for probe_length, probe_index in enumerate(probe_sequence, 1):
+                    if probe_index == index:
+                        break
+                histogram[probe_length] = histogram.get(probe_length, 0) + 1
+        if not histogram:
+            return {"mean": 0, "max": 0, "histogram": histogram}
+        total = sum(length * count for length, count in histogram.items())
+        return {
+            "mean": total / sum(histogram.values()),
+            "max": max(histogram),
+            "histogram": histogram,
+        }
+
     def keys(self):
         """Return a list of keys found in the hash table."""
-        keys = [item.key for item in self._table if isinstance(item, HashItem)]
-        return keys
+        return [item.key for item in self._iter_items()]
 
     def values(self):
         """Return a list of values found in the hash table."""
-        values = [item.value for item in self._table if isinstance(item, HashItem)]
-        return values
+        return [item.value for item in self._iter_items()]
 
     def items(self):
         """Return a list of tuples that contains the key-value
         pairs found in the hash table.
         """
-        items = [
-            (item.key, item.value) for item in self._table if isinstance(item, HashItem)
-        ]
-        return items
+        return [(item.key, item.value) for item in self._iter_items()]
+
+    def _iter_items(self):
+        """Return a generator of the HashItems in the hash table,
+        including any not yet migrated out of the old table.
+        """
+        for table in (self._table, self._old_table):
+            if table is None:
+                continue
+            for item in table:
+                if isinstance(item, HashItem):
+                    yield item
 
     def __getitem__(self, key):
         """"Return the item associated with the given key."""
@@ -151,28 +555,119 @@ class HashTable:
         """
         return self.get(key) is not None
 
-    def _hash(self, key):
-        """Map the given key to a value from 0 to num_buckets - 1."""
-        return hash(key) % self._capacity
+    def _bucket_index(self, hash_value, capacity):
+        """Map the given hash to a value from 0 to capacity - 1."""
+        if self._power_of_two:
+            return hash_value & (capacity - 1)
+        return hash_value % capacity
 
     def _should_double(self):
         """Return True if the table size should be doubled."""
         return self._num_items >= self._capacity * self._max_load_factor
 
-    def _should_halve(self):
-        """Return True if the table size should be halved."""
-        return self._num_items <= self._capacity * self._min_load_factor
+    def _should_halve(self, capacity=None):
+        """Return True if the table size should be halved. The capacity
+        defaults to the capacity of the current table.
+        """
+        if capacity is None:
+            capacity = self._capacity
+        half_capacity = capacity // 2
+        return (
+            half_capacity >= self._min_capacity
+            and self._num_items <= capacity * self._min_load_factor
+            and self._num_items < half_capacity * self._max_load_factor
+        )
+
+    def resize_stats(self):
+        """Return a dictionary with the number of times the table has
+        grown, shrunk and been rehashed at the same size, and the total
+        number of seconds spent resizing, including the migration steps
+        of incremental resizes.
+        """
+        return dict(self._resize_stats)
+
+    def _should_compact(self):
+        """Return True if items and tombstones together have reached the
+        max load factor, meaning the tombstones should be cleared out by
+        rehashing the table at its current size.
+        """
+        return (
+            self._num_items + self._num_tombstones
+            >= self._capacity * self._max_load_factor
+        )
 
     def _resize_table(self, multiple):
         """Rehash the contents of the current hash table into a new
         table by growing or shrinking the table, depending on the multiple
-        that is passed in.
+        that is passed in. With incremental resizing, the new table is
+        only allocated here and the items are migrated by later operations.
         """
-        old_table = self._table[:]
-        self._capacity = int(self._capacity * multiple)
+        self._resize_to(int(self._capacity * multiple))
+
+    def _resize_to(self, capacity):
+        """Rehash the contents of the current hash table into a new table
+        with the given capacity.
+        """
+        start = time.perf_counter()
+        if capacity > self._capacity:
+            self._resize_stats["grows"] += 1
+        elif capacity < self._capacity:
+            self._resize_stats["shrinks"] += 1
+        else:
+            self._resize_stats["rehashes"] += 1
+        self._low_load_deletes = 0
+        self._rebuild(capacity)
+        self._resize_stats["seconds"] += time.perf_counter() - start
+
+    def _rebuild(self, capacity):
+        """Move the contents of the hash table into a new table with the
+        given capacity, or start doing so when resizing incrementally.
+        """
+        if self._incremental_resize:
+            if self._old_table is not None:
+                self._finish_rehash()
+            self._old_table = self._table
+            self._rehash_index = 0
+            self._capacity = capacity
+            self._table = [None] * self._capacity
+            self._num_tombstones = 0
+            self._migrate_old_slots()
+            return
+        old_table = self._table
+        self._capacity = capacity
         self._table = [None] * self._capacity
-        self._num_items = 0
+        self._num_tombstones = 0
         for item in old_table:
-            if item is not None and not isinstance(item, Tombstone):
-                self.put(item.key, item.value)
+            if isinstance(item, HashItem):
+                self._insert_item(item)
+
+    def _rehash_old_slots(self):
+        """Migrate up to rehash_step slots from the old table, adding the
+        time taken to the resize statistics.
+        """
+        start = time.perf_counter()
+        self._migrate_old_slots()
+        self._resize_stats["seconds"] += time.perf_counter() - start
+
+    def _migrate_old_slots(self):
+        """Migrate up to rehash_step slots from the old table into the
+        current table, dropping the old table once it is empty. Migrated
+        slots are left as tombstones so that lookups in the old table can
+        still follow probe sequences through them.
+        """
+        old_table = self._old_table
+        stop = min(self._rehash_index + self._rehash_step, len(old_table))
+        for index in range(self._rehash_index, stop):
+            item = old_table[index]
+            if isinstance(item, HashItem):
+                self._insert_item(item)
+                old_table[index] = Tombstone()
+        self._rehash_index = stop
+        if stop == len(old_table):
+            self._old_table = None
+            self._rehash_index = 0
 
+    def _finish_rehash(self):
+        """Migrate every remaining slot out of the old table."""
+        while self._old_table is not None:
+            self._migrate_old_slots()
@@ -0,0 +1,240 @@
+"""This module contains my implementation of a hash table using
+linear probing (open addressing) to handle key collisions, where the
+cached hashes, keys and values are stored in three parallel arrays
+instead of one HashItem object per entry.
+"""
+
+from array import array
+
+
+class Deleted:
+    """Class to act as the sentinel for a deleted slot in a hash table
+    that stores its keys in a parallel array. A single instance is
+    shared by every deleted slot.
+    """
+
+    def __repr__(self):
+        """Return a string representation of the Deleted sentinel."""
+        return "DELETED"
+
+
+DELETED = Deleted()
+
+
+class HashTable:
+    """Class to represent a hash table whose entries are stored in
+    parallel arrays. An empty slot holds None in the keys array and a
+    deleted slot holds the DELETED sentinel.
+    """
+
+    def __init__(self, capacity=8, min_load_factor=0.25, max_load_factor=0.75):
+        if capacity < 1:
+            raise ValueError("Capacity must be greater than 1.")
+        if min_load_factor <= 0 or min_load_factor > 1:
+            raise ValueError(
+                "Min load factor must be greater than 0 but less than or equal to 1."
+            )
+        if max_load_factor <= 0 or max_load_factor > 1:
+            raise ValueError(
+                "Max load factor must be greater than 0 but less than or equal to 1."
+            )
+        self._capacity = capacity
+        self._min_load_factor = min_load_factor
+        self._max_load_factor = max_load_factor
+        self._num_items = 0
+        self._num_deleted = 0
+        self._hashes = array("q", bytes(8 * self._capacity))
+        self._keys = [None] * self._capacity
+        self._values = [None] * self._capacity
+
+    def get(self, key):
+        """Return the item associated with the given key."""
+        if key is not None:
+            index = self._find_index(key, hash(key))
+            if index != -1:
+                return self._values[index]
+        return None
+
+    def put(self, key, value):
+        """Insert the given value into the hash table. If there is
+        already a value associated with the given key, then the
+        value will be overwritten.
+        """
+        if key is None:
+            raise KeyError("None is not a valid key.")
+        hash_value = hash(key)
+        keys = self._keys
+        hashes = self._hashes
+        capacity = self._capacity
+        index = hash_value % capacity
+        first_deleted = -1
+        while True:
+            slot_key = keys[index]
+            if slot_key is None:
+                break
+            if slot_key is DELETED:
+                if first_deleted == -1:
+                    first_deleted = index
+            elif hashes[index] == hash_value and (slot_key is key or slot_key == key):
+                self._values[index] = value
+                return
+            index = (index + 1) % capacity
+        if first_deleted != -1:
+            index = first_deleted
+            self._num_deleted -= 1
+        hashes[index] = hash_value
+        keys[index] = key
+        self._values[index] = value
+        self._num_items += 1
+        if self._should_double():
+            self._resize_table(2)
+        elif self._should_compact():
+            self._resize_table(1)
+
+    def delete(self, key):
+        """Delete an item in the hash table with the given key."""
+        if key is None:
+            raise KeyError("None is not a valid key")
+        index = self._find_index(key, hash(key))
+        if index == -1:
+            raise KeyError("Key not in hash table.")
+        self._keys[index] = DELETED
+        self._values[index] = None
+        self._num_items -= 1
+        self._num_deleted += 1
+        if self._should_halve():
+            self._resize_table(0.5)
+
+    def _find_index(self, key, hash_value):
+        """Return the slot index holding the given key, or -1 if the key
+        is not in the table. Stored hashes are compared before keys so
+        that most mismatches never call __eq__.
+        """
+        keys = self._keys
+        hashes = self._hashes
+        capacity = self._capacity
+        index = hash_value % capacity
+        while True:
+            slot_key = keys[index]
+            if slot_key is None:
+                return -1
+            if (
+                slot_key is not DELETED
+                and hashes[index] == hash_value
+                and (slot_key is key or slot_key == key)
+            ):
+                return index
+            index = (index + 1) % capacity
+
+    def exists(self, key):
+        """Return True if there is a value associated with the given key
+        in the hash table.
+        """
+        return self.get(key) is not None
+
+    def is_empty(self):
+        """Returns True or False depending on whether the hash table is empty."""
+        return self._num_items == 0
+
+    def clear(self):
+        """Clear all of the contents of the hash table."""
+        self._hashes = array("q", bytes(8 * self._capacity))
+        self._keys = [None] * self._capacity
+        self._values = [None] * self._capacity
+        self._num_items = 0
+        self._num_deleted = 0
+
+    @property
+    def num_items(self):
+        """Returns the number of items currently in the hash table."""
+        return self._num_items
+
+    def keys(self):
+        """Return a list of keys found in the hash table."""
+        return [key for key in self._keys if key is not None and key is not DELETED]
+
+    def values(self):
+        """Return a list of values found in the hash table."""
+        return [
+            self._values[index]
+            for index, key in enumerate(self._keys)
+            if key is not None and key is not DELETED
+        ]
+
+    def items(self):
+        """Return a list of tuples that contains the key-value
+        pairs found in the hash table.
+        """
+        return [
+            (key, self._values[index])
+            for index, key in enumerate(self._keys)
+            if key is not None and key is not DELETED
+        ]
+
+    def __getitem__(self, key):
+        """"Return the item associated with the given key."""
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        """Insert the given value into the hash table. If there is
+        already a value associated with the given key, then the
+        value will be overwritten.
+        """
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        """Delete an item in the hash table with the given key."""
+        self.delete(key)
+
+    def __contains__(self, key):
+        """Return True if there is a value associated with the given key
+        in the hash table.
+        """
+        return self.get(key) is not None
+
+    def _should_double(self):
+        """Return True if the table size should be doubled."""
+        return self._num_items >= self._capacity * self._max_load_factor
+
+    def _should_halve(self):
+        """Return True if the table size should be halved."""
+        return self._num_items <= self._capacity * self._min_load_factor
+
+    def _should_compact(self):
+        """Return True if live items and deleted slots together have
+        reached the max load factor, meaning the deleted slots should be
+        purged by rehashing the table at its current size.
+        """
+        return (
+            self._num_items + self._num_deleted
+            >= self._capacity * self._max_load_factor
+        )
+
+    def _resize_table(self, multiple):
+        """Rehash the contents of the current hash table into a new
+        table by growing or shrinking the table, depending on the multiple
+        that is passed in. The cached hashes are reused, so no key is
+        hashed again.
+        """
+        old_hashes = self._hashes
+        old_keys = self._keys
+        old_values = self._values
+        capacity = max(1, int(self._capacity * multiple))
+        hashes = array("q", bytes(8 * capacity))
+        keys = [None] * capacity
+        values = [None] * capacity
+        for old_index, key in enumerate(old_keys):
+            if key is None or key is DELETED:
+                continue
+            hash_value = old_hashes[old_index]
+            index = hash_value % capacity
+            while keys[index] is not None:
+                index = (index + 1) % capacity
+            hashes[index] = hash_value
+            keys[index] = key
+            values[index] = old_values[old_index]
+        self._capacity = capacity
+        self._hashes = hashes
+        self._keys = keys
+        self._values = values
+        self._num_deleted = 0
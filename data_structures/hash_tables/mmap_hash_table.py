@@ -0,0 +1,215 @@
+"""This module contains my implementation of a read-only hash table that
+lives in a file and is opened with mmap. The table is written once with
+write_hash_table and can then be opened by any number of processes, which
+all share the same pages of the file in the OS page cache. Opening it does
+not insert anything, and a lookup only reads the slots and records it
+needs straight out of the mapping.
+
+The file uses linear probing, like the linear-probing HashTable, and its
+layout (all integers little-endian) is:
+
+- Header: magic b"HTBL", version (uint32), capacity (uint64), number of
+  items (uint64) and the 16 byte hash seed.
+- Slots: capacity pairs of (hash, record offset) as uint64s. An offset of
+  0 marks an empty slot, since no record can start inside the header.
+- Records: key length and value length as uint32s, then the key bytes and
+  the value bytes.
+
+Keys and values are bytes. A str is stored as its UTF-8 encoding. Python's
+hash is randomized per process, so keys are hashed with a keyed BLAKE2b
+digest whose seed is stored in the header.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+
+
+MAGIC = b"HTBL"
+VERSION = 1
+HEADER = struct.Struct("<4sIQQ16s")
+SLOT = struct.Struct("<QQ")
+RECORD_HEADER = struct.Struct("<II")
+
+
+def _to_bytes(data):
+    """Return the given key or value as bytes."""
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    raise ValueError("Keys and values must be str or bytes.")
+
+
+def _hash_bytes(data, seed):
+    """Return the 64-bit keyed hash of the given bytes."""
+    return int.from_bytes(
+        hashlib.blake2b(data, digest_size=8, key=seed).digest(), "little"
+    )
+
+
+def write_hash_table(path, items, max_load_factor=0.75, seed=None):
+    """Write the given key-value pairs to a new hash table file at the
+    given path. Items may be a mapping, anything with an items method
+    (such as a HashTable) or an iterable of pairs. If a key appears more
+    than once, its last value wins. The file is written to a temporary
+    path first and then moved into place, so a reader never opens a
+    partly written table.
+    """
+    if max_load_factor <= 0 or max_load_factor > 1:
+        raise ValueError(
+            "Max load factor must be greater than 0 but less than or equal to 1."
+        )
+    if seed is None:
+        seed = os.urandom(16)
+    if len(seed) != 16:
+        raise ValueError("Seed must be 16 bytes long.")
+    if hasattr(items, "items"):
+        items = items.items()
+    entries = {}
+    for key, value in items:
+        entries[_to_bytes(key)] = _to_bytes(value)
+
+    capacity = 1
+    while len(entries) > capacity * max_load_factor:
+        capacity *= 2
+    mask = capacity - 1
+    slots = [None] * capacity
+    offset = HEADER.size + capacity * SLOT.size
+    for key, value in entries.items():
+        hash_value = _hash_bytes(key, seed)
+        index = hash_value & mask
+        while slots[index] is not None:
+            index = (index + 1) & mask
+        slots[index] = (hash_value, offset)
+        offset += RECORD_HEADER.size + len(key) + len(value)
+
+    temp_path = "%s.tmp" % path
+    with open(temp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, capacity, len(entries), seed))
+        for slot in slots:
+            file.write(SLOT.pack(*slot) if slot is not None else bytes(SLOT.size))
+        for key, value in entries.items():
+            file.write(RECORD_HEADER.pack(len(key), len(value)))
+            file.write(key)
+            file.write(value)
+    os.replace(temp_path, path)
+
+
+class MappedHashTable:
+    """Class to represent a read-only hash table backed by a
+    memory-mapped file.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Not a hash table file.")
+        self._view = memoryview(self._map)
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError("Not a hash table file.")
+        magic, version, capacity, num_items, seed = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("Not a hash table file.")
+        self._capacity = capacity
+        self._num_items = num_items
+        self._seed = seed
+
+    def get(self, key):
+        """Return the value associated with the given key as bytes, or
+        None if the key is not in the table.
+        """
+        if key is None:
+            return None
+        key = _to_bytes(key)
+        hash_value = _hash_bytes(key, self._seed)
+        mask = self._capacity - 1
+        index = hash_value & mask
+        for _ in range(self._capacity):
+            slot_hash, offset = SLOT.unpack_from(
+                self._map, HEADER.size + index * SLOT.size
+            )
+            if offset == 0:
+                return None
+            if slot_hash == hash_value:
+                key_length, value_length = RECORD_HEADER.unpack_from(self._map, offset)
+                start = offset + RECORD_HEADER.size
+                if self._view[start : start + key_length] == key:
+                    start += key_length
+                    return bytes(self._view[start : start + value_length])
+            index = (index + 1) & mask
+        return None
+
+    def exists(self, key):
+        """Return True if there is a value associated with the given key
+        in the hash table.
+        """
+        return self.get(key) is not None
+
+    def is_empty(self):
+        """Returns True or False depending on whether the hash table is empty."""
+        return self._num_items == 0
+
+    @property
+    def num_items(self):
+        """Returns the number of items in the hash table."""
+        return self._num_items
+
+    def keys(self):
+        """Return a list of keys found in the hash table."""
+        return [key for key, _ in self._iter_records()]
+
+    def values(self):
+        """Return a list of values found in the hash table."""
+        return [value for _, value in self._iter_records()]
+
+    def items(self):
+        """Return a list of tuples that contains the key-value
+        pairs found in the hash table.
+        """
+        return list(self._iter_records())
+
+    def _iter_records(self):
+        """Return a generator of (key, value) tuples, read in the order
+        the records were written.
+        """
+        offset = HEADER.size + self._capacity * SLOT.size
+        for _ in range(self._num_items):
+            key_length, value_length = RECORD_HEADER.unpack_from(self._map, offset)
+            start = offset + RECORD_HEADER.size
+            end = start + key_length + value_length
+            yield (
+                bytes(self._view[start : start + key_length]),
+                bytes(self._view[start + key_length : end]),
+            )
+            offset = end
+
+    def close(self):
+        """Unmap the file and close it."""
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        """Return the hash table when used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the hash table when the with block exits."""
+        self.close()
+
+    def __getitem__(self, key):
+        """"Return the value associated with the given key."""
+        return self.get(key)
+
+    def __contains__(self, key):
+        """Return True if there is a value associated with the given key
+        in the hash table.
+        """
+        return self.get(key) is not None
@@ -0,0 +1,225 @@
+"""This module contains my implementation of an indexable skip list, a
+positional sequence with the same methods as the linked lists. The values
+are kept in order of position rather than sorted, and every forward
+pointer stores its width, the number of positions it jumps over. Finding
+a position then takes O(log n) expected steps down the levels instead of
+a walk from the head, so value_at, insert and remove_at_index, and the
+operations at both ends built on them, are all O(log n).
+
+The head is a sentinel at position 0 and the value at index i is at
+position i + 1. A pointer to None has the width of the jump to a virtual
+tail one position past the last value.
+"""
+
+
+import random
+
+
+MAX_LEVEL = 32
+
+
+class SkipListNode:
+    """Class to represent a node in an indexable skip list."""
+
+    __slots__ = ("data", "next", "width")
+
+    def __init__(self, data, level):
+        self.data = data
+        self.next = [None] * level
+        self.width = [1] * level
+
+    def __repr__(self):
+        """Return a representation of the skip list node."""
+        return "<SkipListNode(%r)>" % self.data
+
+
+class IndexableSkipList:
+    """Class to represent an indexable skip list. The seed makes the
+    levels given to new nodes, and so the layout of the list, repeatable.
+    """
+
+    def __init__(self, seed=None):
+        self.head = SkipListNode(None, MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        self._random = random.Random(seed)
+
+    def peek_front(self):
+        """Return the first value in the list."""
+        if self.is_empty():
+            return None
+        return self.head.next[0].data
+
+    def peek_back(self):
+        """Return the last value in the list."""
+        if self.is_empty():
+            return None
+        return self.value_at(self.size - 1)
+
+    def push_front(self, data):
+        """Insert a value at the front of the list."""
+        self.insert(0, data)
+
+    def push_back(self, data):
+        """Insert a value at the back of the list."""
+        self.insert(self.size, data)
+
+    def pop_front(self):
+        """Remove the first value in the list and return it."""
+        if self.is_empty():
+            raise IndexError("List is empty")
+        return self._remove(0)
+
+    def pop_back(self):
+        """Remove the last value in the list and return it."""
+        if self.is_empty():
+            raise IndexError("List is empty")
+        return self._remove(self.size - 1)
+
+    def find_value(self, data):
+        """Find the first occurrence of the given value and return it."""
+        for value in self:
+            if value == data:
+                return value
+        return None
+
+    def count(self, data):
+        """Return the number of times the given value is in the list."""
+        return sum(1 for value in self if value == data)
+
+    def value_at(self, index):
+        """Return the value at the given index in the list.
+        The list starts at index 0. Only handles positive indices.
+        """
+        if index >= self.size or index < 0:
+            raise IndexError("List index out of range")
+        node = self.head
+        position = 0
+        for level in range(self.level - 1, -1, -1):
+            while node.next[level] is not None and (
+                position + node.width[level] <= index + 1
+            ):
+                position += node.width[level]
+                node = node.next[level]
+        return node.data
+
+    def is_empty(self):
+        """Return True if the list is empty."""
+        return self.size == 0
+
+    def reverse(self):
+        """Reverse the list. The nodes are rebuilt, so this is O(n log n)."""
+        values = list(self)
+        self.clear()
+        for data in reversed(values):
+            self.push_back(data)
+
+    def clear(self):
+        """Remove every value from the list."""
+        self.head = SkipListNode(None, MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def insert(self, index, data):
+        """Insert the given value at the given index in the list.
+        An index equal to the size of the list appends the value.
+        """
+        if index > self.size or index < 0:
+            raise IndexError("Index out of range.")
+        predecessors, positions = self._find_predecessors(index)
+        node_level = self._random_level()
+        if node_level > self.level:
+            for level in range(self.level, node_level):
+                predecessors[level] = self.head
+                positions[level] = 0
+                self.head.next[level] = None
+                self.head.width[level] = self.size + 1
+            self.level = node_level
+        node = SkipListNode(data, node_level)
+        position = index + 1
+        for level in range(node_level):
+            previous = predecessors[level]
+            successor_position = positions[level] + previous.width[level]
+            node.next[level] = previous.next[level]
+            node.width[level] = successor_position + 1 - position
+            previous.next[level] = node
+            previous.width[level] = position - positions[level]
+        for level in range(node_level, self.level):
+            predecessors[level].width[level] += 1
+        self.size += 1
+
+    def remove_at_index(self, index):
+        """Remove the value at the given index in the list."""
+        if self.is_empty():
+            raise IndexError("List is empty.")
+        if index >= self.size or index < 0:
+            raise IndexError("Index out of range.")
+        self._remove(index)
+
+    def remove_value(self, data):
+        """Remove the first occurrence of the given value from the list."""
+        if self.is_empty():
+            raise ValueError("List is empty.")
+        for index, value in enumerate(self):
+            if value == data:
+                self._remove(index)
+                return
+        raise ValueError("Data not in list.")
+
+    def _remove(self, index):
+        """Unlink the node at the given index and return its value."""
+        predecessors, _ = self._find_predecessors(index)
+        node = predecessors[0].next[0]
+        for level in range(self.level):
+            previous = predecessors[level]
+            if previous.next[level] is node:
+                previous.next[level] = node.next[level]
+                previous.width[level] += node.width[level] - 1
+            else:
+                previous.width[level] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return node.data
+
+    def _find_predecessors(self, index):
+        """Return the last node before the given index on every level, and
+        the positions of those nodes.
+        """
+        predecessors = [self.head] * MAX_LEVEL
+        positions = [0] * MAX_LEVEL
+        node = self.head
+        position = 0
+        for level in range(self.level - 1, -1, -1):
+            while node.next[level] is not None and (
+                position + node.width[level] <= index
+            ):
+                position += node.width[level]
+                node = node.next[level]
+            predecessors[level] = node
+            positions[level] = position
+        return predecessors, positions
+
+    def _random_level(self):
+        """Return a level for a new node, where each extra level is half as
+        likely as the one below it.
+        """
+        level = 1
+        while level < MAX_LEVEL and self._random.random() < 0.5:
+            level += 1
+        return level
+
+    def __len__(self):
+        """Return the number of values in the list."""
+        return self.size
+
+    def __contains__(self, data):
+        """Return True if the given data is in the list."""
+        return any(value == data for value in self)
+
+    def __iter__(self):
+        """Return a generator of the values in the list."""
+        node = self.head.next[0]
+        while node is not None:
+            yield node.data
+            node = node.next[0]
@@ -0,0 +1,283 @@
+"""This module contains my implementation of an unrolled linked list
+with head and tail pointers. Each node holds up to node_capacity values
+in a small array instead of a single value, so there are far fewer nodes
+to allocate and follow, and iterating walks through contiguous arrays.
+
+- push_front, pop_front, push_back, pop_back and both peeks are O(1),
+  apart from shifting at most node_capacity values inside the end node.
+- value_at, insert and remove_at_index skip over whole nodes, so they
+  take O(n / node_capacity) steps to find the node, plus O(node_capacity)
+  to shift values inside it.
+
+A full node is split in half when a value is inserted into it, and a
+node that falls below half full is merged with the next node when their
+values fit in one node.
+"""
+
+
+class UnrolledLinkedListNode:
+    """Class to represent a node in an unrolled linked list."""
+
+    __slots__ = ("values", "next", "prev")
+
+    def __init__(self, values=None):
+        self.values = [] if values is None else values
+        self.next = None
+        self.prev = None
+
+    def __repr__(self):
+        """Return a representation of the unrolled linked list node."""
+        return "<UnrolledLinkedListNode(%r)>" % self.values
+
+
+class UnrolledLinkedList:
+    """Class to represent an unrolled linked list."""
+
+    def __init__(self, node_capacity=64):
+        if node_capacity < 2:
+            raise ValueError("Node capacity must be at least 2.")
+        self.node_capacity = node_capacity
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def peek_front(self):
+        """Return the first value in the linked list."""
+        if self.is_empty():
+            return None
+        return self.head.values[0]
+
+    def peek_back(self):
+        """Return the last value in the linked list."""
+        if self.is_empty():
+            return None
+        return self.tail.values[-1]
+
+    def push_front(self, data):
+        """Insert a value at the front of the linked list."""
+        if self.head is None or len(self.head.values) == self.node_capacity:
+            self._insert_node_after(None, UnrolledLinkedListNode([data]))
+        else:
+            self.head.values.insert(0, data)
+        self.size += 1
+
+    def push_back(self, data):
+        """Insert a value at the back of the linked list."""
+        if self.tail is None or len(self.tail.values) == self.node_capacity:
+            self._insert_node_after(self.tail, UnrolledLinkedListNode([data]))
+        else:
+            self.tail.values.append(data)
+        self.size += 1
+
+    def pop_front(self):
+        """Remove the first value in the linked list and return it."""
+        if self.is_empty():
+            raise IndexError("Linked list is empty")
+        node = self.head
+        data = node.values.pop(0)
+        if not node.values:
+            self._remove_node(node)
+        self.size -= 1
+        return data
+
+    def pop_back(self):
+        """Remove the last value in the linked list and return it."""
+        if self.is_empty():
+            raise IndexError("Linked list is empty")
+        node = self.tail
+        data = node.values.pop()
+        if not node.values:
+            self._remove_node(node)
+        self.size -= 1
+        return data
+
+    def find_value(self, data):
+        """Find the first occurrence of the given value and return it."""
+        for value in self:
+            if value == data:
+                return value
+        return None
+
+    def count(self, data):
+        """Return the number of times the given value is in the linked list."""
+        count = 0
+        node = self.head
+        while node is not None:
+            count += node.values.count(data)
+            node = node.next
+        return count
+
+    def value_at(self, index):
+        """Return the value at the given index in the linked list.
+        The list starts at index 0. Only handles positive indices.
+        """
+        if index >= self.size or index < 0:
+            raise IndexError("List index out of range")
+        node, offset = self._find_node(index)
+        return node.values[offset]
+
+    def is_empty(self):
+        """Return True if the linked list is empty."""
+        return self.size == 0
+
+    def reverse(self):
+        """Reverse the linked list."""
+        node = self.head
+        while node is not None:
+            node.values.reverse()
+            node.next, node.prev = node.prev, node.next
+            node = node.prev
+        self.head, self.tail = self.tail, self.head
+
+    def insert(self, index, data):
+        """Insert the given value at the given index in the linked list.
+        An index equal to the size of the list appends the value.
+        """
+        if index > self.size or index < 0:
+            raise IndexError("Index out of range.")
+        if index == self.size:
+            self.push_back(data)
+            return
+        node, offset = self._find_node(index)
+        if len(node.values) == self.node_capacity:
+            self._split_node(node)
+            if offset > len(node.values):
+                offset -= len(node.values)
+                node = node.next
+        node.values.insert(offset, data)
+        self.size += 1
+
+    def remove_at_index(self, index):
+        """Remove the value at the given index in the linked list."""
+        if self.is_empty():
+            raise IndexError("List is empty.")
+        if index >= self.size or index < 0:
+            raise IndexError("Index out of range.")
+        node, offset = self._find_node(index)
+        del node.values[offset]
+        self.size -= 1
+        self._rebalance(node)
+
+    def remove_value(self, data):
+        """Remove the first occurrence of the given value from the linked list."""
+        if self.is_empty():
+            raise ValueError("Linked list is empty.")
+        node = self.head
+        while node is not None:
+            if data in node.values:
+                node.values.remove(data)
+                self.size -= 1
+                self._rebalance(node)
+                return
+            node = node.next
+        raise ValueError("Data not in linked list.")
+
+    def remove_node(self, data):
+        """Remove the first occurrence of the given value from the linked
+        list. This is the singly linked list's name for remove_value.
+        """
+        self.remove_value(data)
+
+    def deep_copy(self):
+        """Return a copy of the linked list with copies of every node."""
+        copy = UnrolledLinkedList(self.node_capacity)
+        node = self.head
+        while node is not None:
+            node_copy = UnrolledLinkedListNode(list(node.values))
+            copy._insert_node_after(copy.tail, node_copy)
+            node = node.next
+        copy.size = self.size
+        return copy
+
+    def has_node(self, data):
+        """Return True if the given value is in the linked list."""
+        node = self.head
+        while node is not None:
+            if data in node.values:
+                return True
+            node = node.next
+        return False
+
+    def _find_node(self, index):
+        """Return the node that holds the value at the given index and the
+        value's offset within that node. The search starts from whichever
+        end of the list is closer.
+        """
+        if index < self.size // 2:
+            node = self.head
+            while index >= len(node.values):
+                index -= len(node.values)
+                node = node.next
+            return node, index
+        index = self.size - 1 - index
+        node = self.tail
+        while index >= len(node.values):
+            index -= len(node.values)
+            node = node.prev
+        return node, len(node.values) - 1 - index
+
+    def _insert_node_after(self, previous, node):
+        """Link the given node in after the previous node, or at the head
+        of the list if previous is None.
+        """
+        next_node = self.head if previous is None else previous.next
+        node.prev = previous
+        node.next = next_node
+        if previous is None:
+            self.head = node
+        else:
+            previous.next = node
+        if next_node is None:
+            self.tail = node
+        else:
+            next_node.prev = node
+
+    def _remove_node(self, node):
+        """Unlink the given node from the list."""
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+    def _split_node(self, node):
+        """Move the second half of the given node's values into a new node
+        that follows it.
+        """
+        middle = len(node.values) // 2
+        new_node = UnrolledLinkedListNode(node.values[middle:])
+        self._insert_node_after(node, new_node)
+        del node.values[middle:]
+
+    def _rebalance(self, node):
+        """Remove the given node if it is empty, or merge the next node
+        into it if it is less than half full and their values fit in one
+        node.
+        """
+        if not node.values:
+            self._remove_node(node)
+        elif (
+            len(node.values) < self.node_capacity // 2
+            and node.next is not None
+            and len(node.values) + len(node.next.values) <= self.node_capacity
+        ):
+            node.values.extend(node.next.values)
+            self._remove_node(node.next)
+
+    def __len__(self):
+        """Return the number of values in the linked list."""
+        return self.size
+
+    def __contains__(self, data):
+        """Return True if the given data is in the linked list."""
+        return self.has_node(data)
+
+    def __iter__(self):
+        """Return a generator of the values in the list."""
+        node = self.head
+        while node is not None:
+            yield from node.values
+            node = node.next
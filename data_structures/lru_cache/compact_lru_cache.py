@@ -0,0 +1,106 @@
+"""This module contains a compact implementation of an LRU Cache.
+Instead of one CacheItem object per entry, the keys and values live in
+two preallocated lists and the recency list is stored as prev and next
+indices in two preallocated integer arrays. Slots freed by eviction go
+on a free list and are handed out again by put, so once the cache has
+warmed up get and put don't allocate any per-entry objects.
+"""
+
+from array import array
+
+
+class LRUCache:
+    """Class to represent a LRU Cache whose recency list is stored in
+    integer arrays. Slot max_capacity is the dummy head of the list: its
+    next index is the most recently used slot and its prev index is the
+    least recently used slot.
+    """
+
+    def __init__(self, max_capacity):
+        if max_capacity <= 0:
+            raise ValueError("Max capacity must be greater than 0.")
+        self.max_capacity = max_capacity
+        self.items = {}
+        self._keys = [None] * max_capacity
+        self._values = [None] * max_capacity
+        self._head = max_capacity
+        self._prev = array("q", [self._head]) * (max_capacity + 1)
+        self._next = array("q", [self._head]) * (max_capacity + 1)
+
+        #the free list is threaded through the next array and ends with -1
+        for slot in range(max_capacity - 1):
+            self._next[slot] = slot + 1
+        self._next[max_capacity - 1] = -1
+        self._free = 0
+
+    def get(self, key):
+        """Given a key, return its value from the cache.
+        Return None if the item is not in the cache.
+        """
+        slot = self.items.get(key)
+        if slot is None:
+            return None
+        self._move_to_head(slot)
+        return self._values[slot]
+
+    def put(self, key, value):
+        """Given a key and a value, add an item to the cache.
+        If the cache is full, the least recently used item
+        will be evicted.
+        """
+        slot = self.items.get(key)
+        if slot is not None:
+            self._values[slot] = value
+            self._move_to_head(slot)
+            return
+        if self.is_full():
+            self._evict()
+        slot = self._free
+        self._free = self._next[slot]
+        self._keys[slot] = key
+        self._values[slot] = value
+        self.items[key] = slot
+        self._push_front(slot)
+
+    @property
+    def total_items(self):
+        """Return the number of items in the cache."""
+        return len(self.items)
+
+    def _push_front(self, slot):
+        """Insert the given slot at the front of the recency list."""
+        head = self._head
+        first = self._next[head]
+        self._prev[slot] = head
+        self._next[slot] = first
+        self._prev[first] = slot
+        self._next[head] = slot
+
+    def _move_to_head(self, slot):
+        """Move the given slot to the front of the recency list."""
+        if self._next[self._head] != slot:
+            self._remove_from_list(slot)
+            self._push_front(slot)
+
+    def _remove_from_list(self, slot):
+        """Unlink the given slot from the recency list."""
+        previous_slot = self._prev[slot]
+        next_slot = self._next[slot]
+        self._next[previous_slot] = next_slot
+        self._prev[next_slot] = previous_slot
+
+    def _evict(self):
+        """Remove the least recently used item, delete it from the
+        self.items dictionary and put its slot on the free list.
+        """
+        slot = self._prev[self._head]
+        self._remove_from_list(slot)
+        del self.items[self._keys[slot]]
+        self._keys[slot] = None
+        self._values[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+
+    def is_full(self):
+        """Return True if the cache has reached max capacity."""
+        return len(self.items) == self.max_capacity
@@ -0,0 +1,176 @@
+"""This module contains two LRU Caches that can be shared by concurrent
+callers and that can load missing items themselves.
+
+- ThreadSafeLRUCache guards the cache with a lock, since even get moves
+  the item to the front of the linked list. It can also run a background
+  thread that sweeps expired items out of the cache.
+- AsyncLRUCache is meant for a single asyncio event loop and loads items
+  with a coroutine.
+
+Both have a get_or_load(key, loader) method with single-flight semantics:
+if several callers miss on the same key at once, the loader is called
+only once and every caller waits for that one load. If the loader raises,
+every waiting caller gets the exception and nothing is cached.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+from data_structures.lru_cache.lru_cache import LRUCache
+
+
+class ThreadSafeLRUCache(LRUCache):
+    """Class to represent a LRU Cache that can be used from many threads."""
+
+    def __init__(self, max_capacity, **kwargs):
+        super().__init__(max_capacity, **kwargs)
+        self._lock = threading.RLock()
+        self._loading = {}
+        self._sweeper = None
+        self._stop_sweeping = threading.Event()
+
+    def get(self, key):
+        """Given a key, return an item from the cache.
+        Return None if the item is not in the cache.
+        """
+        with self._lock:
+            return super().get(key)
+
+    def put(self, key, value, ttl=None):
+        """Given a key and a value, add an item to the cache.
+        If the cache is full, least recently used items will
+        be evicted until the new item fits.
+        """
+        with self._lock:
+            super().put(key, value, ttl)
+
+    def sweep_expired(self):
+        """Remove every expired item from the cache and return how many
+        were removed.
+        """
+        with self._lock:
+            return super().sweep_expired()
+
+    def save(self, path):
+        """Write every item that hasn't expired to a snapshot file at the
+        given path and return how many were written.
+        """
+        with self._lock:
+            return super().save(path)
+
+    def load(self, path):
+        """Put every item from the snapshot file at the given path into
+        the cache and return how many were read.
+        """
+        with self._lock:
+            return super().load(path)
+
+    def stats(self):
+        """Return a snapshot of the cache's stats as a dictionary."""
+        with self._lock:
+            return super().stats()
+
+    def reset_stats(self):
+        """Set every stats counter back to zero."""
+        with self._lock:
+            super().reset_stats()
+
+    def start_sweeper(self, interval):
+        """Start a daemon thread that sweeps expired items out of the
+        cache every interval seconds.
+        """
+        if self._sweeper is not None:
+            raise ValueError("The sweeper is already running.")
+        self._stop_sweeping.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep_periodically, args=(interval,), daemon=True
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self):
+        """Stop the sweeper thread and wait for it to exit."""
+        if self._sweeper is not None:
+            self._stop_sweeping.set()
+            self._sweeper.join()
+            self._sweeper = None
+
+    def _sweep_periodically(self, interval):
+        """Sweep expired items every interval seconds until stopped."""
+        while not self._stop_sweeping.wait(interval):
+            self.sweep_expired()
+
+    def get_or_load(self, key, loader):
+        """Return the value cached for the given key. On a miss, call
+        loader(key) outside of the lock, cache the value it returns and
+        return it. Threads that miss on a key that is already being loaded
+        wait for that load instead of starting their own.
+        """
+        with self._lock:
+            item = super().get(key)
+            if item is not None:
+                return item.value
+            future = self._loading.get(key)
+            is_loader = future is None
+            if is_loader:
+                future = Future()
+                self._loading[key] = future
+        if not is_loader:
+            return future.result()
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            value = loader(key)
+            succeeded = True
+            with self._lock:
+                super().put(key, value)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._record_load(time.perf_counter() - start, succeeded)
+                del self._loading[key]
+
+
+class AsyncLRUCache(LRUCache):
+    """Class to represent a LRU Cache whose misses are loaded by
+    coroutines. It must only be used from one event loop thread.
+    """
+
+    def __init__(self, max_capacity, **kwargs):
+        super().__init__(max_capacity, **kwargs)
+        self._loading = {}
+
+    async def get_or_load(self, key, loader):
+        """Return the value cached for the given key. On a miss, await
+        loader(key), cache the value it returns and return it. Coroutines
+        that miss on a key that is already being loaded await that load
+        instead of starting their own. Cancelling one waiter doesn't
+        cancel the load for the others.
+        """
+        item = self.get(key)
+        if item is not None:
+            return item.value
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._loading[key] = task
+        return await asyncio.shield(task)
+
+    async def _load(self, key, loader):
+        """Await the loader for the given key and cache its value."""
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            value = await loader(key)
+            succeeded = True
+            self.put(key, value)
+            return value
+        finally:
+            self._record_load(time.perf_counter() - start, succeeded)
+            del self._loading[key]
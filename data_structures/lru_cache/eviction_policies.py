@@ -0,0 +1,325 @@
+"""This module contains caches with scan-resistant eviction policies.
+They have the same get and put interface as the LRU Cache, and each one
+is built out of LRU Caches used as segments:
+
+- SegmentedLRUCache (SLRU) puts new items in a probationary segment and
+  only promotes them to a protected segment when they are hit again.
+- TwoQueueCache (2Q) puts new items in a FIFO queue, remembers the keys
+  it pushes out in a ghost queue, and only gives an item a place in the
+  main LRU segment if its key comes back while it is still a ghost.
+- TinyLFUCache (W-TinyLFU) puts new items in a small LRU window. An item
+  pushed out of the window only enters the main SLRU segment if a
+  count-min sketch says it is used more often than the item it would
+  replace.
+
+A single scan of many keys only churns the probation, FIFO or window
+segment, so the hot items in the other segments survive it.
+"""
+
+import random
+from array import array
+
+from data_structures.lru_cache.lru_cache import LRUCache
+
+
+MASK_64 = (1 << 64) - 1
+
+
+def _pop_lru(cache):
+    """Remove the least recently used item from the given LRU Cache and
+    return it.
+    """
+    item = cache.tail.prev
+    cache._remove(item)
+    return item
+
+
+def _split_capacity(max_capacity, ratio):
+    """Return the capacity of a segment that takes the given share of
+    the cache, leaving at least one slot for the other segment.
+    """
+    return min(max(1, int(max_capacity * ratio)), max_capacity - 1)
+
+
+class CountMinSketch:
+    """Class to represent a count-min sketch that estimates how often
+    keys have been seen. Counters are capped at 15 and every counter is
+    halved once sample_size keys have been added, so old popularity
+    fades away. The rows are stored back to back in one byte array.
+    """
+
+    MAX_COUNT = 15
+    HALVE = bytes(count >> 1 for count in range(256))
+
+    def __init__(self, width, depth=4, sample_size=None, seed=0):
+        if width < 1 or depth < 1:
+            raise ValueError("Width and depth must be greater than 0.")
+        width = max(16, 1 << (width - 1).bit_length())
+        self.width = width
+        self.sample_size = 10 * width if sample_size is None else sample_size
+        self.additions = 0
+        self._shift = 64 - (width.bit_length() - 1)
+        generator = random.Random(seed)
+        self._row_multipliers = [
+            (row * width, generator.getrandbits(64) | 1) for row in range(depth)
+        ]
+        self._counters = array("B", bytes(depth * width))
+
+    def add(self, key):
+        """Count one more occurrence of the given key. Each row picks its
+        counter from the top bits of its own multiplicative hash.
+        """
+        hash_value = hash(key) & MASK_64
+        shift = self._shift
+        counters = self._counters
+        for offset, multiplier in self._row_multipliers:
+            index = offset + ((hash_value * multiplier & MASK_64) >> shift)
+            if counters[index] < self.MAX_COUNT:
+                counters[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, key):
+        """Return the estimated number of occurrences of the given key."""
+        hash_value = hash(key) & MASK_64
+        shift = self._shift
+        counters = self._counters
+        return min(
+            counters[offset + ((hash_value * multiplier & MASK_64) >> shift)]
+            for offset, multiplier in self._row_multipliers
+        )
+
+    def reset(self):
+        """Halve every counter."""
+        self._counters = array("B", self._counters.tobytes().translate(self.HALVE))
+        self.additions //= 2
+
+
+class SegmentedLRUCache:
+    """Class to represent a segmented LRU Cache. Items pushed out of the
+    protected segment go back to the front of the probation segment, so
+    they get another chance before they are evicted. The protected
+    segment is capped at its share of the cache, while probation may use
+    whatever room the protected segment leaves free.
+    """
+
+    def __init__(self, max_capacity, protected_ratio=0.8):
+        if max_capacity < 2:
+            raise ValueError("Max capacity must be at least 2.")
+        if protected_ratio <= 0 or protected_ratio >= 1:
+            raise ValueError("Protected ratio must be between 0 and 1.")
+        self.max_capacity = max_capacity
+        protected_capacity = _split_capacity(max_capacity, protected_ratio)
+        self.probation = LRUCache(max_capacity)
+        self.protected = LRUCache(protected_capacity)
+
+    def get(self, key):
+        """Given a key, return an item from the cache.
+        Return None if the item is not in the cache.
+        """
+        item = self.protected.get(key)
+        if item is not None:
+            return item
+        item = self.probation.items.get(key)
+        if item is None:
+            return None
+        self.probation._remove(item)
+        return self._promote(item.key, item.value)
+
+    def put(self, key, value):
+        """Given a key and a value, add an item to the cache. New items
+        go into the probation segment. If the cache is full, the victim
+        is evicted first.
+        """
+        if key in self.protected.items:
+            self.protected.put(key, value)
+            return
+        item = self.probation.items.get(key)
+        if item is not None:
+            self.probation._remove(item)
+            self._promote(key, value)
+            return
+        if self.is_full():
+            self._remove(self.victim())
+        self.probation.put(key, value)
+
+    def victim(self):
+        """Return the item that will be evicted next: the least recently
+        used item in probation, or in the protected segment if probation
+        is empty.
+        """
+        if self.probation.total_items:
+            return self.probation.tail.prev
+        return self.protected.tail.prev
+
+    def _remove(self, item):
+        """Remove the given item from whichever segment holds it."""
+        if self.probation.items.get(item.key) is item:
+            self.probation._remove(item)
+        else:
+            self.protected._remove(item)
+
+    def _promote(self, key, value):
+        """Insert an item into the protected segment, moving the protected
+        segment's least recently used item back into probation to make
+        room. Return the promoted item.
+        """
+        if self.protected.is_full():
+            demoted = _pop_lru(self.protected)
+            self.probation.put(demoted.key, demoted.value)
+        self.protected.put(key, value)
+        return self.protected.items[key]
+
+    def __contains__(self, key):
+        """Return True if the key is in either segment. It doesn't count
+        as an access.
+        """
+        return key in self.protected.items or key in self.probation.items
+
+    @property
+    def total_items(self):
+        """Return the number of items in the cache."""
+        return self.probation.total_items + self.protected.total_items
+
+    def is_full(self):
+        """Return True if the cache has reached max capacity."""
+        return self.total_items == self.max_capacity
+
+
+class TwoQueueCache:
+    """Class to represent a 2Q cache. Hits on the FIFO queue don't move
+    items, and the ghost queue only holds keys, never values.
+    """
+
+    def __init__(self, max_capacity, recent_ratio=0.25, ghost_ratio=0.5):
+        if max_capacity < 2:
+            raise ValueError("Max capacity must be at least 2.")
+        if recent_ratio <= 0 or recent_ratio >= 1 or ghost_ratio <= 0:
+            raise ValueError(
+                "Recent ratio must be between 0 and 1 and ghost ratio above 0."
+            )
+        self.max_capacity = max_capacity
+        recent_capacity = _split_capacity(max_capacity, recent_ratio)
+        self.recent = LRUCache(recent_capacity)
+        self.frequent = LRUCache(max_capacity - recent_capacity)
+        self.ghosts = LRUCache(max(1, int(max_capacity * ghost_ratio)))
+
+    def get(self, key):
+        """Given a key, return an item from the cache.
+        Return None if the item is not in the cache.
+        """
+        item = self.frequent.get(key)
+        if item is None:
+            item = self.recent.items.get(key)
+        return item
+
+    def put(self, key, value):
+        """Given a key and a value, add an item to the cache. A key that
+        is still remembered as a ghost goes straight into the main LRU
+        segment, every other new key goes into the FIFO queue.
+        """
+        if key in self.frequent.items:
+            self.frequent.put(key, value)
+            return
+        item = self.recent.items.get(key)
+        if item is not None:
+            item.value = value
+            return
+        ghost = self.ghosts.items.get(key)
+        if ghost is not None:
+            self.ghosts._remove(ghost)
+            self.frequent.put(key, value)
+            return
+        if self.recent.is_full():
+            evicted = _pop_lru(self.recent)
+            self.ghosts.put(evicted.key, None)
+        self.recent.put(key, value)
+
+    def __contains__(self, key):
+        """Return True if the key is cached. Ghost keys don't count and
+        neither does the check itself as an access.
+        """
+        return key in self.frequent.items or key in self.recent.items
+
+    @property
+    def total_items(self):
+        """Return the number of items in the cache."""
+        return self.recent.total_items + self.frequent.total_items
+
+    def is_full(self):
+        """Return True if the cache has reached max capacity."""
+        return self.total_items == self.max_capacity
+
+
+class TinyLFUCache:
+    """Class to represent a W-TinyLFU cache. Every get is counted in the
+    sketch. A put isn't, since callers normally put right after a get
+    has missed.
+    """
+
+    def __init__(self, max_capacity, window_ratio=0.01, seed=0):
+        if max_capacity < 3:
+            raise ValueError("Max capacity must be at least 3.")
+        if window_ratio <= 0 or window_ratio >= 1:
+            raise ValueError("Window ratio must be between 0 and 1.")
+        self.max_capacity = max_capacity
+        window_capacity = min(
+            _split_capacity(max_capacity, window_ratio), max_capacity - 2
+        )
+        self.window = LRUCache(window_capacity)
+        self.main = SegmentedLRUCache(max_capacity - window_capacity)
+        self.sketch = CountMinSketch(max_capacity, seed=seed)
+
+    def get(self, key):
+        """Given a key, return an item from the cache.
+        Return None if the item is not in the cache.
+        """
+        self.sketch.add(key)
+        item = self.window.get(key)
+        if item is None:
+            item = self.main.get(key)
+        return item
+
+    def put(self, key, value):
+        """Given a key and a value, add an item to the cache. New items go
+        into the window, and the item they push out of the window has to
+        win admission into the main segment.
+        """
+        if key in self.window.items:
+            self.window.put(key, value)
+            return
+        if key in self.main:
+            self.main.put(key, value)
+            return
+        if self.window.is_full():
+            self._admit(_pop_lru(self.window))
+        self.window.put(key, value)
+
+    def _admit(self, candidate):
+        """Move an item pushed out of the window into the main segment,
+        unless the main segment is full and the item it would evict has
+        been seen at least as often as the candidate.
+        """
+        if self.main.is_full():
+            victim = self.main.victim()
+            if self.sketch.estimate(candidate.key) <= self.sketch.estimate(
+                victim.key
+            ):
+                return
+        self.main.put(candidate.key, candidate.value)
+
+    def __contains__(self, key):
+        """Return True if the key is cached. It doesn't count as an
+        access.
+        """
+        return key in self.window.items or key in self.main
+
+    @property
+    def total_items(self):
+        """Return the number of items in the cache."""
+        return self.window.total_items + self.main.total_items
+
+    def is_full(self):
+        """Return True if the cache has reached max capacity."""
+        return self.total_items == self.max_capacity
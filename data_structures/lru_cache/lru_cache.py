@@ -1,24 +1,127 @@
-"""This module contains an implementation of an LRU Cache."""
+"""This module contains an implementation of an LRU Cache.
+
+Entries can be given a time to live, after which they are expired lazily
+when they are next accessed, or by sweep_expired. A weigher callback can
+be passed so that max_capacity is a total weight (such as bytes) rather
+than a number of entries. With record_stats=True, the cache also counts
+hits, misses, evictions, expirations and loads.
+
+A cache can be saved to a snapshot file and loaded back, so that it
+starts warm after a restart. A snapshot is a header followed by one
+pickled (key, value, remaining ttl) record per item, written from the
+least to the most recently used item. Loading puts the records back in
+that order, one at a time, which restores their recency. Snapshots are
+pickles, so only load files that you wrote yourself.
+"""
+
+import os
+import pickle
+import time
+
+
+SNAPSHOT_HEADER = b"LRUCACHE 1\n"
+
 
 class CacheItem:
-    """Class to represent an item in a cache."""
+    """Class to represent an item in a cache. It uses __slots__ so that
+    items don't each carry a __dict__.
+    """
+
+    __slots__ = ("key", "value", "weight", "expires_at", "prev", "next")
 
-    def __init__(self, key, value):
+    def __init__(self, key, value, weight=1, expires_at=None):
         self.key = key
         self.value = value
+        self.weight = weight
+        self.expires_at = expires_at
         self.prev = None
         self.next = None
 
 
+class CacheStats:
+    """Class to hold the counters of a cache that records stats."""
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "loads",
+        "load_failures",
+        "total_load_time",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Set every counter back to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.loads = 0
+        self.load_failures = 0
+        self.total_load_time = 0.0
+
+    def record_load(self, seconds, succeeded):
+        """Record a call to a loader that took the given number of seconds."""
+        if succeeded:
+            self.loads += 1
+        else:
+            self.load_failures += 1
+        self.total_load_time += seconds
+
+    def snapshot(self):
+        """Return the counters, along with the hit ratio and the average
+        load time, as a dictionary.
+        """
+        requests = self.hits + self.misses
+        load_calls = self.loads + self.load_failures
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "loads": self.loads,
+            "load_failures": self.load_failures,
+            "total_load_time": self.total_load_time,
+            "average_load_time": (
+                self.total_load_time / load_calls if load_calls else 0.0
+            ),
+        }
+
+
 class LRUCache:
-    """Class to represent a LRU Cache."""
+    """Class to represent a LRU Cache. If ttl is given, entries expire
+    that many seconds after they were last put. If weigher is given, it is
+    called as weigher(key, value) and max_capacity bounds the total weight
+    of the entries instead of their number.
+    """
 
-    def __init__(self, max_capacity):
+    def __init__(
+        self,
+        max_capacity,
+        ttl=None,
+        weigher=None,
+        clock=time.monotonic,
+        record_stats=False,
+    ):
         if max_capacity <= 0:
             raise ValueError("Max capacity must be greater than 0.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL must be greater than 0.")
         self.max_capacity = max_capacity
+        self.ttl = ttl
+        self.weigher = weigher
+        self.clock = clock
         self.items = {}
         self.total_items = 0
+        self.total_weight = 0
+
+        #stats are None when disabled, so the only cost is a None check
+        self._stats = CacheStats() if record_stats else None
 
         #dummy pointers to avoid NoneType exception when removing nodes
         self.head = CacheItem(None, None)
@@ -34,30 +137,49 @@ class LRUCache:
         """
         #return none if the item isn't in the cache
         if key not in self.items:
+            if self._stats is not None:
+                self._stats.misses += 1
             return None
 
         #retrieve the item from the dictionary
         item = self.items[key]
 
+        #expired items are removed lazily, when they are accessed
+        if self._is_expired(item, self.clock()):
+            self._remove(item)
+            if self._stats is not None:
+                self._stats.misses += 1
+                self._stats.expirations += 1
+            return None
+
         #move it to the front of the list since it is the
         #most recently accessed item
         self._move_to_head(item)
+        if self._stats is not None:
+            self._stats.hits += 1
         return item
 
-    def put(self, key, value):
+    def put(self, key, value, ttl=None):
         """Given a key and a value, add an item to the cache.
-        If the cache is full, the least recently used item
-        will be evicted.
+        If the cache is full, least recently used items will
+        be evicted until the new item fits. The ttl overrides
+        the cache's default time to live for this item.
         """
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        if weight > self.max_capacity:
+            raise ValueError("Item weight must not exceed max capacity.")
+        if ttl is None:
+            ttl = self.ttl
+        expires_at = None if ttl is None else self.clock() + ttl
+
         #first check if item in already in the cache
         item = self.items.get(key, None)
 
         #if not create a new item
         if item is None:
-            #if the cache is full, evict the last item
-            if self.is_full():
-                self._evict()
-            item = CacheItem(key, value)
+            #if the cache is full, evict items until the new one fits
+            self._evict(weight)
+            item = CacheItem(key, value, weight, expires_at)
 
             #add it to the dictionary
             self.items[key] = item
@@ -67,13 +189,109 @@ class LRUCache:
 
             #increment number of items by 1
             self.total_items += 1
+            self.total_weight += weight
         else:
             #update the value of the found item
             #move it to the front of the list since it is now
             #the most recently accessed item
             item.value = value
+            item.expires_at = expires_at
             self._move_to_head(item)
 
+            #if the item got heavier, evict others from the tail until
+            #everything fits again
+            self.total_weight += weight - item.weight
+            item.weight = weight
+            self._evict(0)
+
+    def sweep_expired(self):
+        """Remove every expired item from the cache and return how many
+        were removed.
+        """
+        now = self.clock()
+        removed = 0
+        item = self.tail.prev
+        while item is not self.head:
+            previous_item = item.prev
+            if self._is_expired(item, now):
+                self._remove(item)
+                removed += 1
+            item = previous_item
+        if self._stats is not None:
+            self._stats.expirations += removed
+        return removed
+
+    def save(self, path):
+        """Write every item that hasn't expired to a snapshot file at the
+        given path and return how many were written. The file is written
+        to a temporary path first and then moved into place.
+        """
+        now = self.clock()
+        saved = 0
+        temp_path = "%s.tmp" % path
+        with open(temp_path, "wb") as file:
+            file.write(SNAPSHOT_HEADER)
+            pickler = pickle.Pickler(file, pickle.HIGHEST_PROTOCOL)
+            item = self.tail.prev
+            while item is not self.head:
+                if not self._is_expired(item, now):
+                    ttl = None if item.expires_at is None else item.expires_at - now
+                    pickler.dump((item.key, item.value, ttl))
+
+                    #keep records independent so the pickler's memo doesn't
+                    #hold on to every item written so far
+                    pickler.clear_memo()
+                    saved += 1
+                item = item.prev
+        os.replace(temp_path, path)
+        return saved
+
+    def load(self, path):
+        """Put every item from the snapshot file at the given path into
+        the cache, reading one record at a time, and return how many were
+        read. If the snapshot holds more than fits, the least recently
+        used items are the ones evicted.
+        """
+        loaded = 0
+        with open(path, "rb") as file:
+            if file.read(len(SNAPSHOT_HEADER)) != SNAPSHOT_HEADER:
+                raise ValueError("Not an LRU Cache snapshot.")
+            unpickler = pickle.Unpickler(file)
+            while True:
+                try:
+                    key, value, ttl = unpickler.load()
+                except EOFError:
+                    break
+                self.put(key, value, ttl)
+                loaded += 1
+        return loaded
+
+    def stats(self):
+        """Return a snapshot of the cache's stats as a dictionary. It
+        includes the current number of items and total weight.
+        """
+        if self._stats is None:
+            raise ValueError("Stats are not being recorded for this cache.")
+        snapshot = self._stats.snapshot()
+        snapshot["total_items"] = self.total_items
+        snapshot["total_weight"] = self.total_weight
+        return snapshot
+
+    def reset_stats(self):
+        """Set every stats counter back to zero."""
+        if self._stats is None:
+            raise ValueError("Stats are not being recorded for this cache.")
+        self._stats.reset()
+
+    def _record_load(self, seconds, succeeded):
+        """Record a call to a loader if stats are being recorded."""
+        if self._stats is not None:
+            self._stats.record_load(seconds, succeeded)
+
+    def _is_expired(self, item, now):
+        """Return True if the given item's time to live has passed."""
+        return item.expires_at is not None and item.expires_at <= now
+
     def _push_front(self, item):
         """Insert the given item to the front of the linked list."""
         #point the item's previous pointer to head and its
@@ -88,15 +306,6 @@ class LRUCache:
         self.head.next.prev = item
         self.head.next = item
 
-    def _pop_tail(self):
-        """Remove the item that is at the end of the linked list."""
-        #get item before the tail pointer
-        previous_item = self.tail.prev
-
-        #call to method to remove from linked list
-        self._remove_from_list(previous_item)
-        return previous_item
-
     def _move_to_head(self, item):
         """Remove the item from where it is in the list and 
         move it to the head of the list.
@@ -117,20 +326,27 @@ class LRUCache:
         previous_item.next = next_item
         next_item.prev = previous_item
 
-    def _evict(self):
-        """Remove the last item in the linked list and delete it from
-        the self.items dictionary.
+    def _remove(self, item):
+        """Remove the given item from the linked list and delete it
+        from the self.items dictionary.
         """
-        #call to method to remove the last item
-        tail = self._pop_tail()
-
-        #delete item from self.items dictionary
-        self.items.pop(tail.key)
+        self._remove_from_list(item)
+        self.items.pop(item.key)
 
         #reduce number of items in the cache by 1
         self.total_items -= 1
+        self.total_weight -= item.weight
+
+    def _evict(self, weight=1):
+        """Remove items from the end of the linked list until an item
+        with the given weight fits in the cache.
+        """
+        while self.total_items and self.total_weight + weight > self.max_capacity:
+            self._remove(self.tail.prev)
+            if self._stats is not None:
+                self._stats.evictions += 1
 
     def is_full(self):
         """Return True if the cache has reached max capacity."""
-        return self.total_items == self.max_capacity
+        return self.total_weight >= self.max_capacity
 
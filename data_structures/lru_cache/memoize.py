@@ -0,0 +1,70 @@
+"""This module contains a memoization decorator backed by my LRU Cache.
+Unlike a memo table that is created for each call, the cache belongs to
+the decorated function, so its results are shared by every later call,
+and its max capacity caps how much memory it can use.
+"""
+
+import functools
+
+from data_structures.lru_cache.lru_cache import LRUCache
+
+
+#separates positional from keyword arguments in a cache key
+_KEYWORD_MARK = object()
+
+
+class HashedTuple(tuple):
+    """Class to represent a tuple that only computes its hash once. Pass
+    long sequences to a memoized function as a HashedTuple, so that
+    building the cache key doesn't hash every element on every call.
+    """
+
+    def __hash__(self):
+        """Return the tuple's hash, computing it on the first call."""
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = tuple.__hash__(self)
+            return self._hash
+
+
+def _make_key(args, kwargs):
+    """Return a cache key for the given positional and keyword arguments."""
+    if not kwargs:
+        return args
+    return args + (_KEYWORD_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(max_capacity=128, key=None):
+    """Return a decorator that caches a function's results in an LRU
+    Cache of the given max capacity, keyed on the function's arguments.
+    If key is given, it is called with the same arguments as the function
+    and returns the cache key instead. The cache records stats and is
+    available as the decorated function's cache attribute, and the
+    decorated function's cache_key attribute returns the key for a set of
+    arguments, so recursive code can read and fill the cache directly.
+    """
+
+    def decorator(function):
+        cache = LRUCache(max_capacity, record_stats=True)
+
+        def make_cache_key(*args, **kwargs):
+            if key is None:
+                return _make_key(args, kwargs)
+            return key(*args, **kwargs)
+
+        @functools.wraps(function)
+        def memoized(*args, **kwargs):
+            cache_key = make_cache_key(*args, **kwargs)
+            item = cache.get(cache_key)
+            if item is not None:
+                return item.value
+            value = function(*args, **kwargs)
+            cache.put(cache_key, value)
+            return value
+
+        memoized.cache = cache
+        memoized.cache_key = make_cache_key
+        return memoized
+
+    return decorator
@@ -0,0 +1,97 @@
+"""This module contains a sharded LRU Cache for use from many threads.
+Keys are spread over a number of independent thread-safe LRU Caches by
+their hash, and each shard has its own lock and an equal share of the
+max capacity, so threads working on different shards never wait on one
+another. Recency is tracked per shard, so the item evicted is the least
+recently used item of its shard rather than of the whole cache.
+"""
+
+from data_structures.lru_cache.concurrent_lru_cache import ThreadSafeLRUCache
+
+
+#stats that are ratios of other stats, so they are recomputed rather than summed
+_DERIVED_STATS = ("hit_ratio", "average_load_time")
+
+
+class ShardedLRUCache:
+    """Class to represent a LRU Cache split into independently locked
+    shards. Any other keyword arguments, such as ttl, weigher or
+    record_stats, are passed on to every shard.
+    """
+
+    def __init__(self, max_capacity, num_shards=16, **kwargs):
+        if num_shards < 1:
+            raise ValueError("Number of shards must be greater than 0.")
+        if max_capacity < num_shards:
+            raise ValueError("Max capacity must be at least the number of shards.")
+        self.max_capacity = max_capacity
+        share, remainder = divmod(max_capacity, num_shards)
+        self.shards = [
+            ThreadSafeLRUCache(share + (1 if index < remainder else 0), **kwargs)
+            for index in range(num_shards)
+        ]
+
+    def _shard(self, key):
+        """Return the shard that holds the given key."""
+        return self.shards[hash(key) % len(self.shards)]
+
+    def get(self, key):
+        """Given a key, return an item from the cache.
+        Return None if the item is not in the cache.
+        """
+        return self._shard(key).get(key)
+
+    def put(self, key, value, ttl=None):
+        """Given a key and a value, add an item to the cache. If the key's
+        shard is full, its least recently used items will be evicted until
+        the new item fits.
+        """
+        self._shard(key).put(key, value, ttl)
+
+    def get_or_load(self, key, loader):
+        """Return the value cached for the given key, loading it with
+        loader(key) on a miss. Concurrent misses on a key share one load.
+        """
+        return self._shard(key).get_or_load(key, loader)
+
+    def sweep_expired(self):
+        """Remove every expired item from every shard and return how many
+        were removed.
+        """
+        return sum(shard.sweep_expired() for shard in self.shards)
+
+    @property
+    def total_items(self):
+        """Return the number of items in the cache."""
+        return sum(shard.total_items for shard in self.shards)
+
+    @property
+    def total_weight(self):
+        """Return the total weight of the items in the cache."""
+        return sum(shard.total_weight for shard in self.shards)
+
+    def is_full(self):
+        """Return True if every shard has reached its max capacity."""
+        return all(shard.is_full() for shard in self.shards)
+
+    def stats(self):
+        """Return the stats of every shard added together, with the hit
+        ratio and average load time recomputed from the totals.
+        """
+        totals = {}
+        for shard in self.shards:
+            for name, value in shard.stats().items():
+                if name not in _DERIVED_STATS:
+                    totals[name] = totals.get(name, 0) + value
+        requests = totals["hits"] + totals["misses"]
+        load_calls = totals["loads"] + totals["load_failures"]
+        totals["hit_ratio"] = totals["hits"] / requests if requests else 0.0
+        totals["average_load_time"] = (
+            totals["total_load_time"] / load_calls if load_calls else 0.0
+        )
+        return totals
+
+    def reset_stats(self):
+        """Set every shard's stats counters back to zero."""
+        for shard in self.shards:
+            shard.reset_stats()
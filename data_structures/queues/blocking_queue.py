@@ -0,0 +1,225 @@
+"""This module contains two bounded queues for handing items from
+producers to consumers. Both keep their items in a CircularQueue, so no
+node is allocated per item.
+
+- BlockingQueue is shared between threads. put waits while the queue is
+  full, which gives producers backpressure, and get waits while it's
+  empty.
+- AsyncQueue is meant for a single asyncio event loop, and its put and
+  get are coroutines.
+
+Every waiting method takes an optional timeout in seconds and raises a
+TimeoutError if it runs out first. put_many and get_many move whole
+batches of items per call, so the cost of locking and waking waiters is
+paid once per batch instead of once per item.
+"""
+
+import asyncio
+import collections
+import threading
+import time
+
+from data_structures.queues.circular_queue import CircularQueue
+
+
+class BlockingQueue:
+    """Class to represent a bounded queue that can be used from many
+    threads.
+    """
+
+    def __init__(self, max_capacity):
+        self.max_capacity = max_capacity
+        self._queue = CircularQueue(max_capacity)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item, timeout=None):
+        """Insert item at the rear of the queue, waiting until there is
+        room for it.
+        """
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_room, timeout):
+                raise TimeoutError("Queue is full.")
+            self._queue.enqueue(item)
+            self._not_empty.notify()
+
+    def get(self, timeout=None):
+        """Remove and return the item at the front of the queue, waiting
+        until there is one.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError("Queue is empty.")
+            item = self._queue.dequeue()
+            self._not_full.notify()
+            return item
+
+    def put_many(self, items, timeout=None):
+        """Insert every item at the rear of the queue, in order, waiting
+        for room as often as needed. If the timeout runs out, the items
+        that were already inserted stay on the queue.
+        """
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        with self._not_full:
+            while start < len(items):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not self._not_full.wait_for(self._has_room, remaining):
+                    raise TimeoutError("Queue is full.")
+                batch = items[start : start + self.max_capacity - self._queue.size]
+                self._queue.extend(batch)
+                self._not_empty.notify(len(batch))
+                start += len(batch)
+
+    def get_many(self, max_items, timeout=None):
+        """Remove and return a list of up to max_items items from the front
+        of the queue, waiting only until there is at least one.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError("Queue is empty.")
+            items = self._queue.pop_many(max_items)
+            self._not_full.notify(len(items))
+            return items
+
+    def _has_room(self):
+        """Return True if the queue isn't full."""
+        return not self._queue.is_full()
+
+    def _has_items(self):
+        """Return True if the queue isn't empty."""
+        return not self._queue.is_empty()
+
+    def is_full(self):
+        """Return True if the queue is full, else return False."""
+        with self._lock:
+            return self._queue.is_full()
+
+    def is_empty(self):
+        """Return True if the queue is empty, else return False."""
+        with self._lock:
+            return self._queue.is_empty()
+
+    @property
+    def size(self):
+        """Return the number of items in the queue."""
+        with self._lock:
+            return self._queue.size
+
+
+class AsyncQueue:
+    """Class to represent a bounded queue whose put and get are awaited.
+    It must only be used from one event loop thread, so instead of a lock
+    it keeps the futures of the coroutines waiting for room or for items
+    and wakes them up one at a time, in the order they started waiting.
+    """
+
+    def __init__(self, max_capacity):
+        self.max_capacity = max_capacity
+        self._queue = CircularQueue(max_capacity)
+        self._putters = collections.deque()
+        self._getters = collections.deque()
+
+    async def put(self, item, timeout=None):
+        """Insert item at the rear of the queue, waiting until there is
+        room for it.
+        """
+        if self._queue.is_full():
+            await self._wait_for_room(timeout)
+        self._queue.enqueue(item)
+        self._wake_up(self._getters, 1)
+
+    async def get(self, timeout=None):
+        """Remove and return the item at the front of the queue, waiting
+        until there is one.
+        """
+        if self._queue.is_empty():
+            await self._wait_for_items(timeout)
+        item = self._queue.dequeue()
+        self._wake_up(self._putters, 1)
+        return item
+
+    async def put_many(self, items, timeout=None):
+        """Insert every item at the rear of the queue, in order, waiting
+        for room as often as needed. If the timeout runs out, the items
+        that were already inserted stay on the queue.
+        """
+        items = list(items)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        start = 0
+        while start < len(items):
+            if self._queue.is_full():
+                remaining = None if deadline is None else deadline - loop.time()
+                await self._wait_for_room(remaining)
+            batch = items[start : start + self.max_capacity - self._queue.size]
+            self._queue.extend(batch)
+            self._wake_up(self._getters, len(batch))
+            start += len(batch)
+
+    async def get_many(self, max_items, timeout=None):
+        """Remove and return a list of up to max_items items from the front
+        of the queue, waiting only until there is at least one.
+        """
+        if self._queue.is_empty():
+            await self._wait_for_items(timeout)
+        items = self._queue.pop_many(max_items)
+        self._wake_up(self._putters, len(items))
+        return items
+
+    async def _wait_for_room(self, timeout):
+        """Wait until the queue isn't full, or raise a TimeoutError."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self._queue.is_full():
+            remaining = None if deadline is None else deadline - loop.time()
+            await self._wait(self._putters, remaining, "Queue is full.")
+
+    async def _wait_for_items(self, timeout):
+        """Wait until the queue isn't empty, or raise a TimeoutError."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self._queue.is_empty():
+            remaining = None if deadline is None else deadline - loop.time()
+            await self._wait(self._getters, remaining, "Queue is empty.")
+
+    async def _wait(self, waiters, timeout, message):
+        """Add a future to the waiters and wait until it is woken up. If
+        the timeout runs out or the caller is cancelled after the future
+        was woken up, the wake up is passed on to the next waiter.
+        """
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except BaseException as error:
+            if future.done() and not future.cancelled():
+                self._wake_up(waiters, 1)
+            elif future in waiters:
+                waiters.remove(future)
+            if isinstance(error, asyncio.TimeoutError):
+                raise TimeoutError(message) from None
+            raise
+
+    def _wake_up(self, waiters, count):
+        """Wake up to count of the longest waiting waiters."""
+        while count and waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                count -= 1
+
+    def is_full(self):
+        """Return True if the queue is full, else return False."""
+        return self._queue.is_full()
+
+    def is_empty(self):
+        """Return True if the queue is empty, else return False."""
+        return self._queue.is_empty()
+
+    @property
+    def size(self):
+        """Return the number of items in the queue."""
+        return self._queue.size
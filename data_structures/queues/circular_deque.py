@@ -1,17 +1,27 @@
-"""This module contains my implementation of a circular deque."""
+"""This module contains my implementation of a circular deque.
+The items are kept in a ring buffer whose length is a power of two, so
+positions wrap around with a bitmask instead of the modulo operator.
+"""
 
+from data_structures.queues.ring_buffer import RingBuffer
 
-class CircularDeque:
-    """Class to represent a circular deque."""
 
-    def __init__(self, max_capacity):
+class CircularDeque(RingBuffer):
+    """Class to represent a circular deque.
+
+    By default the deque holds at most max_capacity items and raises a
+    ValueError when it's full. A growable deque starts with room for
+    max_capacity items and doubles its buffer whenever it fills up. If
+    shrink is also set, the buffer is halved whenever the deque falls
+    below a quarter full, though never below its starting length.
+    """
+
+    name = "deque"
+
+    def __init__(self, max_capacity, growable=False, shrink=False):
         if max_capacity < 1:
             raise ValueError("Max capacity must be at least 1.")
-        self._max_capacity = max_capacity
-        self._size = 0
-        self._items = [None] * self._max_capacity
-        self._front = -1
-        self._back = -1
+        super().__init__(max_capacity, growable, shrink)
 
     def peek_front(self):
         """Return the value of the item at the
@@ -27,38 +37,21 @@ class CircularDeque:
         """
         if self.is_empty():
             return None
-        return self._items[self._back]
-
-    def is_empty(self):
-        """Return True if the deque if empty, else return False."""
-        return self._size == 0
-
-    def is_full(self):
-        """Return True if the deque is full, else return False."""
-        return self._size == self._max_capacity
+        return self._items[(self._front + self._size - 1) & self._mask]
 
     def push_front(self, item):
         """Insert an item at the front of the deque."""
-        if self.is_full():
-            raise ValueError("Deque is full.")
-        if self.is_empty():
-            self._front = 0
-            self._back = 0
-        else:
-            self._front = (self._front + self._max_capacity - 1) % self._max_capacity
+        if self._size == self._capacity:
+            self._make_room(1)
+        self._front = (self._front - 1) & self._mask
         self._items[self._front] = item
         self._size += 1
 
     def push_back(self, item):
         """Insert an item at the back of the deque."""
-        if self.is_full():
-            raise ValueError("Deque is full.")
-        if self.is_empty():
-            self._front = 0
-            self._back = 0
-        else:
-            self._back = (self._back + 1) % self._max_capacity
-        self._items[self._back] = item
+        if self._size == self._capacity:
+            self._make_room(1)
+        self._items[(self._front + self._size) & self._mask] = item
         self._size += 1
 
     def pop_front(self):
@@ -66,29 +59,21 @@ class CircularDeque:
         if self.is_empty():
             return None
         item = self._items[self._front]
-        if self._size == 1:
-            self._front = -1
-            self._back = -1
-        else:
-            self._front = (self._front + 1) % self._max_capacity
+        self._items[self._front] = None
+        self._front = (self._front + 1) & self._mask
         self._size -= 1
+        if self._size < self._shrink_below:
+            self._shrink_buffer()
         return item
 
     def pop_back(self):
         """Remove and return the item at the back of the deque."""
         if self.is_empty():
             return None
-        item = self._items[self._back]
-        if self._size == 1:
-            self._front = -1
-            self._back = -1
-        else:
-            self._back = (self._back + self._max_capacity - 1) % self._max_capacity
+        back = (self._front + self._size - 1) & self._mask
+        item = self._items[back]
+        self._items[back] = None
         self._size -= 1
+        if self._size < self._shrink_below:
+            self._shrink_buffer()
         return item
-
-    @property
-    def size(self):
-        """Return the number of items in the deque."""
-        return self._size
-
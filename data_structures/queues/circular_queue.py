@@ -1,28 +1,33 @@
-"""This module contains my implementation of a Circular Queue."""
+"""This module contains my implementation of a Circular Queue.
+The items are kept in a ring buffer whose length is a power of two, so
+positions wrap around with a bitmask instead of the modulo operator.
+"""
 
+from data_structures.queues.ring_buffer import RingBuffer
 
-class CircularQueue:
-    """Class to represent a circular queue."""
 
-    def __init__(self, max_capacity):
+class CircularQueue(RingBuffer):
+    """Class to represent a circular queue.
+
+    By default the queue holds at most max_capacity items and raises a
+    ValueError when it's full. A growable queue starts with room for
+    max_capacity items and doubles its buffer whenever it fills up. If
+    shrink is also set, the buffer is halved whenever the queue falls
+    below a quarter full, though never below its starting length.
+    """
+
+    name = "queue"
+
+    def __init__(self, max_capacity, growable=False, shrink=False):
         if max_capacity < 1:
             raise ValueError("Max capacity can't be less than 1.")
-        self._max_capacity = max_capacity
-        self._size = 0
-        self._items = [None] * max_capacity
-        self._front = -1
-        self._rear = -1
+        super().__init__(max_capacity, growable, shrink)
 
     def enqueue(self, item):
         """Insert item at the rear of the queue."""
-        if self.is_full():
-            raise ValueError("Queue is full.")
-        if self.is_empty():
-            self._front += 1
-            self._rear += 1
-        else:
-            self._rear = (self._rear + 1) % self._max_capacity
-        self._items[self._rear] = item
+        if self._size == self._capacity:
+            self._make_room(1)
+        self._items[(self._front + self._size) & self._mask] = item
         self._size += 1
 
     def dequeue(self):
@@ -30,30 +35,15 @@ class CircularQueue:
         if self.is_empty():
             return None
         item = self._items[self._front]
-        if self._size == 1:
-            self._front = -1
-            self._rear = -1
-        else:
-            self._front = (self._front + 1) % self._max_capacity
+        self._items[self._front] = None
+        self._front = (self._front + 1) & self._mask
         self._size -= 1
+        if self._size < self._shrink_below:
+            self._shrink_buffer()
         return item
 
-    def is_full(self):
-        """Return True if the queue is full, else return False."""
-        return self._size == self._max_capacity
-
-    def is_empty(self):
-        """Return True if the queue is empty, else return False."""
-        return self._size == 0
-
     def peek(self):
         """Return the value of the item located at the front of the queue."""
         if self.is_empty():
             return None
         return self._items[self._front]
-
-    @property
-    def size(self):
-        """Return the number of items in the queue."""
-        return self._size
-
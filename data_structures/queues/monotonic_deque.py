@@ -0,0 +1,144 @@
+"""This module contains my implementation of a monotonic deque, which
+keeps the minimum and maximum of a sliding window of values.
+
+Two pairs of circular deques hold the values that could still become
+the window's minimum or maximum, together with the position each value
+was pushed at. The minimum side is kept in increasing order: when a
+value is pushed, every larger value is popped off the back first, since
+it can never be the minimum while the new value is in the window. The
+maximum side is the mirror image. Each value is pushed and popped at
+most once per side, so push and expire are amortized O(1), and the
+current minimum and maximum are always at the front.
+"""
+
+from data_structures.queues.circular_deque import CircularDeque
+
+
+class MonotonicDeque:
+    """Class to represent a sliding window with O(1) minimum and maximum.
+
+    If window_size is given, pushing a value onto a full window expires
+    the oldest value first. Otherwise the window grows until values are
+    expired by hand.
+    """
+
+    def __init__(self, window_size=None):
+        if window_size is not None and window_size < 1:
+            raise ValueError("Window size must be at least 1.")
+        self.window_size = window_size
+        if window_size is None:
+            deques = [CircularDeque(16, growable=True) for _ in range(4)]
+        else:
+            deques = [CircularDeque(window_size) for _ in range(4)]
+        (
+            self._min_positions,
+            self._min_values,
+            self._max_positions,
+            self._max_values,
+        ) = deques
+        self._oldest = 0
+        self._next = 0
+
+    def push(self, value):
+        """Add a value to the newest end of the window."""
+        if self._next - self._oldest == self.window_size:
+            self.expire()
+        position = self._next
+        values = self._min_values
+        while not values.is_empty() and values.peek_back() > value:
+            values.pop_back()
+            self._min_positions.pop_back()
+        values.push_back(value)
+        self._min_positions.push_back(position)
+        values = self._max_values
+        while not values.is_empty() and values.peek_back() < value:
+            values.pop_back()
+            self._max_positions.pop_back()
+        values.push_back(value)
+        self._max_positions.push_back(position)
+        self._next = position + 1
+
+    def expire(self, count=1):
+        """Remove the count oldest values from the window."""
+        if count > self.size:
+            raise IndexError("Not enough values in the window.")
+        self._oldest += count
+        for positions, values in (
+            (self._min_positions, self._min_values),
+            (self._max_positions, self._max_values),
+        ):
+            while not positions.is_empty() and positions.peek_front() < self._oldest:
+                positions.pop_front()
+                values.pop_front()
+
+    def current_min(self):
+        """Return the smallest value in the window, or None if it's empty."""
+        return self._min_values.peek_front()
+
+    def current_max(self):
+        """Return the largest value in the window, or None if it's empty."""
+        return self._max_values.peek_front()
+
+    def is_empty(self):
+        """Return True if the window is empty, else return False."""
+        return self._next == self._oldest
+
+    @property
+    def size(self):
+        """Return the number of values in the window."""
+        return self._next - self._oldest
+
+    def __len__(self):
+        """Return the number of values in the window."""
+        return self._next - self._oldest
+
+
+def sliding_window_min_max(values, window_size):
+    """Consume an iterable of values and yield a (minimum, maximum) tuple
+    for every full window of window_size consecutive values.
+
+    This is the same algorithm as MonotonicDeque, specialized for a
+    stream: the deques only hold positions, the values are looked up in
+    a ring of the last window_size values, and since exactly one value
+    leaves the window per step, at most one position is expired per side.
+    """
+    if window_size < 1:
+        raise ValueError("Window size must be at least 1.")
+    recent = [None] * window_size
+    min_positions = CircularDeque(window_size)
+    max_positions = CircularDeque(window_size)
+    min_back, min_push, min_pop_back = (
+        min_positions.peek_back,
+        min_positions.push_back,
+        min_positions.pop_back,
+    )
+    max_back, max_push, max_pop_back = (
+        max_positions.peek_back,
+        max_positions.push_back,
+        max_positions.pop_back,
+    )
+    min_front, min_pop_front = min_positions.peek_front, min_positions.pop_front
+    max_front, max_pop_front = max_positions.peek_front, max_positions.pop_front
+    oldest = 1 - window_size
+    for position, value in enumerate(values):
+        if min_front() == oldest - 1:
+            min_pop_front()
+        if max_front() == oldest - 1:
+            max_pop_front()
+        back = min_back()
+        while back is not None and recent[back % window_size] > value:
+            min_pop_back()
+            back = min_back()
+        back = max_back()
+        while back is not None and recent[back % window_size] < value:
+            max_pop_back()
+            back = max_back()
+        recent[position % window_size] = value
+        min_push(position)
+        max_push(position)
+        if oldest >= 0:
+            yield (
+                recent[min_front() % window_size],
+                recent[max_front() % window_size],
+            )
+        oldest += 1
@@ -0,0 +1,130 @@
+"""This module contains the ring buffer that my circular queue and
+circular deque are built on. The items are kept in a list whose length is
+a power of two, so positions wrap around with a bitmask instead of the
+modulo operator.
+"""
+
+
+def _buffer_length(capacity):
+    """Return the smallest power of two that is at least the capacity."""
+    return 1 << (capacity - 1).bit_length()
+
+
+class RingBuffer:
+    """Class to represent the ring buffer shared by the circular queue and
+    the circular deque. Subclasses add the operations on single items and
+    set name, which is used in error messages.
+
+    By default the ring buffer holds at most max_capacity items and raises
+    a ValueError when it's full. A growable ring buffer starts with room
+    for max_capacity items and doubles its buffer whenever it fills up. If
+    shrink is also set, the buffer is halved whenever it falls below a
+    quarter full, though never below its starting length.
+    """
+
+    name = "ring buffer"
+
+    def __init__(self, max_capacity, growable=False, shrink=False):
+        if shrink and not growable:
+            raise ValueError("Only a growable %s can shrink." % self.name)
+        self._max_capacity = max_capacity
+        self._growable = growable
+        self._shrink = shrink
+        self._min_length = _buffer_length(max_capacity)
+        self._size = 0
+        self._front = 0
+        self._resize(self._min_length)
+
+    def extend(self, items):
+        """Insert every item at the back of the ring buffer, in order. The
+        items are copied into the buffer in at most two slices. A ring
+        buffer that isn't growable raises a ValueError, without inserting
+        any of the items, if they don't all fit.
+        """
+        items = list(items)
+        count = len(items)
+        if self._size + count > self._capacity:
+            self._make_room(count)
+        start = (self._front + self._size) & self._mask
+        first = min(count, len(self._items) - start)
+        self._items[start : start + first] = items[:first]
+        self._items[: count - first] = items[first:]
+        self._size += count
+
+    def pop_many(self, count):
+        """Remove and return a list of up to count items from the front of
+        the ring buffer. The items are copied out in at most two slices.
+        """
+        if count < 0:
+            raise ValueError("Count can't be negative.")
+        count = min(count, self._size)
+        front = self._front
+        end = front + count
+        if end <= len(self._items):
+            items = self._items[front:end]
+            self._items[front:end] = [None] * count
+        else:
+            wrapped = end & self._mask
+            items = self._items[front:] + self._items[:wrapped]
+            self._items[front:] = [None] * (len(self._items) - front)
+            self._items[:wrapped] = [None] * wrapped
+        self._front = end & self._mask
+        self._size -= count
+        if self._size < self._shrink_below:
+            self._shrink_buffer()
+        return items
+
+    def _make_room(self, count):
+        """Grow the buffer so that count more items fit, or raise a
+        ValueError if the ring buffer isn't growable.
+        """
+        if not self._growable:
+            raise ValueError("%s is full." % self.name.capitalize())
+        self._resize(_buffer_length(self._size + count))
+
+    def _shrink_buffer(self):
+        """Halve the buffer, or more, once it has fallen below a quarter
+        full, though never below its starting length.
+        """
+        self._resize(max(self._min_length, _buffer_length(2 * self._size)))
+
+    def _resize(self, length):
+        """Copy the items, in at most two slices, to the start of a new
+        buffer of the given length.
+        """
+        if self._size == 0:
+            items = []
+        else:
+            end = self._front + self._size
+            if end <= len(self._items):
+                items = self._items[self._front : end]
+            else:
+                items = self._items[self._front :] + self._items[: end & self._mask]
+        self._items = items + [None] * (length - self._size)
+        self._mask = length - 1
+        self._front = 0
+        self._capacity = length if self._growable else self._max_capacity
+        if self._shrink and length > self._min_length:
+            self._shrink_below = length >> 2
+        else:
+            self._shrink_below = 0
+
+    def is_empty(self):
+        """Return True if the ring buffer is empty, else return False."""
+        return self._size == 0
+
+    def is_full(self):
+        """Return True if the ring buffer is full, else return False.
+        A growable ring buffer is never full.
+        """
+        return not self._growable and self._size == self._max_capacity
+
+    @property
+    def size(self):
+        """Return the number of items in the ring buffer."""
+        return self._size
+
+    @property
+    def buffer_length(self):
+        """Return the number of slots in the ring buffer."""
+        return len(self._items)
@@ -0,0 +1,231 @@
+"""This module contains my implementation of a single producer, single
+consumer ring buffer that lives in a multiprocessing.shared_memory block,
+so bytes can be handed from one process to another without pickling them
+or sending them through a pipe.
+
+The block starts with a header holding the number of slots and the slot
+size, followed by the head and tail counters, each on its own cache line,
+and then the slots. Each slot holds a 4 byte length and up to
+slot_size - 4 bytes of data. The counters only ever grow and are masked
+to find a slot, so the buffer is full when tail - head == num_slots.
+
+The tail is only written by the producer, after the slot has been
+filled, and the head is only written by the consumer, after the slot has
+been read, so no lock is needed. Each side also caches the other side's
+counter and only reads it again when the buffer looks full or empty.
+Pure Python has no memory fences, so this relies on aligned 8 byte writes
+to the block reaching the other process whole and in the order they were
+made, as they do on x86-64.
+"""
+
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+
+MAGIC = b"SPSC"
+HEADER = struct.Struct("<4sII")
+INDEX = struct.Struct("<Q")
+LENGTH = struct.Struct("<I")
+CACHE_LINE = 64
+HEAD_OFFSET = CACHE_LINE
+TAIL_OFFSET = 2 * CACHE_LINE
+SLOTS_OFFSET = 3 * CACHE_LINE
+
+
+class SharedMemoryRingBuffer:
+    """Class to represent a ring buffer of byte strings in shared memory.
+    One process may enqueue and one other process may dequeue.
+
+    Creating a ring buffer allocates a new shared memory block. Other
+    processes open it with SharedMemoryRingBuffer.attach(name), or by
+    being passed the ring buffer, which pickles as its name.
+    """
+
+    def __init__(self, num_slots, slot_size, name=None):
+        if num_slots < 1 or num_slots & (num_slots - 1):
+            raise ValueError("Number of slots must be a power of two.")
+        if slot_size <= LENGTH.size:
+            raise ValueError("Slot size must be more than %d bytes." % LENGTH.size)
+        memory = shared_memory.SharedMemory(
+            name=name, create=True, size=SLOTS_OFFSET + num_slots * slot_size
+        )
+        HEADER.pack_into(memory.buf, 0, MAGIC, num_slots, slot_size)
+        INDEX.pack_into(memory.buf, HEAD_OFFSET, 0)
+        INDEX.pack_into(memory.buf, TAIL_OFFSET, 0)
+        self._open(memory, is_creator=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Return the ring buffer in the shared memory block with the
+        given name.
+        """
+        # Opening a block registers it with this process's resource tracker,
+        # which unlinks it when this process exits, so attaching processes
+        # must not be tracked
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(memory._name, "shared_memory")
+        if bytes(memory.buf[: len(MAGIC)]) != MAGIC:
+            memory.close()
+            raise ValueError("Shared memory block isn't a ring buffer.")
+        ring_buffer = cls.__new__(cls)
+        ring_buffer._open(memory, is_creator=False)
+        return ring_buffer
+
+    def _open(self, memory, is_creator):
+        """Set up the ring buffer's attributes from its shared memory."""
+        _, self.num_slots, self.slot_size = HEADER.unpack_from(memory.buf, 0)
+        self._memory = memory
+        self._buffer = memory.buf
+        self._mask = self.num_slots - 1
+        self._is_creator = is_creator
+        self._cached_head = 0
+        self._cached_tail = 0
+
+    @property
+    def name(self):
+        """Return the name of the shared memory block."""
+        return self._memory.name
+
+    def enqueue(self, data):
+        """Copy the given bytes into the slot at the tail of the ring
+        buffer. Must only be called by the producer.
+        """
+        length = len(data)
+        if length > self.slot_size - LENGTH.size:
+            raise ValueError("Data doesn't fit in a slot.")
+        buffer = self._buffer
+        tail = INDEX.unpack_from(buffer, TAIL_OFFSET)[0]
+        if tail - self._cached_head == self.num_slots:
+            self._cached_head = INDEX.unpack_from(buffer, HEAD_OFFSET)[0]
+            if tail - self._cached_head == self.num_slots:
+                raise ValueError("Ring buffer is full.")
+        offset = SLOTS_OFFSET + (tail & self._mask) * self.slot_size
+        LENGTH.pack_into(buffer, offset, length)
+        start = offset + LENGTH.size
+        buffer[start : start + length] = data
+        INDEX.pack_into(buffer, TAIL_OFFSET, tail + 1)
+
+    def dequeue(self):
+        """Remove and return the bytes at the head of the ring buffer, or
+        None if it's empty. Must only be called by the consumer.
+        """
+        buffer = self._buffer
+        head = INDEX.unpack_from(buffer, HEAD_OFFSET)[0]
+        if head == self._cached_tail:
+            self._cached_tail = INDEX.unpack_from(buffer, TAIL_OFFSET)[0]
+            if head == self._cached_tail:
+                return None
+        data = self._read_slot(head)
+        INDEX.pack_into(buffer, HEAD_OFFSET, head + 1)
+        return data
+
+    def enqueue_many(self, items):
+        """Copy as many of the given byte strings as fit into the ring
+        buffer, in order, and return how many were enqueued. The tail is
+        only written once, after the last of them, unless one of them is
+        too big for a slot. Must only be called by the producer.
+        """
+        buffer = self._buffer
+        max_length = self.slot_size - LENGTH.size
+        tail = start_tail = INDEX.unpack_from(buffer, TAIL_OFFSET)[0]
+        for data in items:
+            length = len(data)
+            if length > max_length:
+                INDEX.pack_into(buffer, TAIL_OFFSET, tail)
+                raise ValueError("Data doesn't fit in a slot.")
+            if tail - self._cached_head == self.num_slots:
+                self._cached_head = INDEX.unpack_from(buffer, HEAD_OFFSET)[0]
+                if tail - self._cached_head == self.num_slots:
+                    break
+            offset = SLOTS_OFFSET + (tail & self._mask) * self.slot_size
+            LENGTH.pack_into(buffer, offset, length)
+            start = offset + LENGTH.size
+            buffer[start : start + length] = data
+            tail += 1
+        INDEX.pack_into(buffer, TAIL_OFFSET, tail)
+        return tail - start_tail
+
+    def dequeue_many(self, max_items):
+        """Remove and return a list of up to max_items byte strings from
+        the head of the ring buffer. The head is only written once, after
+        the last of them. Must only be called by the consumer.
+        """
+        if max_items < 0:
+            raise ValueError("Count can't be negative.")
+        buffer = self._buffer
+        head = INDEX.unpack_from(buffer, HEAD_OFFSET)[0]
+        if self._cached_tail - head < max_items:
+            self._cached_tail = INDEX.unpack_from(buffer, TAIL_OFFSET)[0]
+        end = head + min(max_items, self._cached_tail - head)
+        items = [self._read_slot(index) for index in range(head, end)]
+        INDEX.pack_into(buffer, HEAD_OFFSET, end)
+        return items
+
+    def peek(self):
+        """Return the bytes at the head of the ring buffer without
+        removing them, or None if it's empty.
+        """
+        head = INDEX.unpack_from(self._buffer, HEAD_OFFSET)[0]
+        tail = INDEX.unpack_from(self._buffer, TAIL_OFFSET)[0]
+        if head == tail:
+            return None
+        return self._read_slot(head)
+
+    def _read_slot(self, index):
+        """Return a copy of the bytes in the slot for the given counter."""
+        offset = SLOTS_OFFSET + (index & self._mask) * self.slot_size
+        length = LENGTH.unpack_from(self._buffer, offset)[0]
+        start = offset + LENGTH.size
+        return bytes(self._buffer[start : start + length])
+
+    @property
+    def size(self):
+        """Return the number of items in the ring buffer."""
+        head = INDEX.unpack_from(self._buffer, HEAD_OFFSET)[0]
+        return INDEX.unpack_from(self._buffer, TAIL_OFFSET)[0] - head
+
+    def is_empty(self):
+        """Return True if the ring buffer is empty, else return False."""
+        return self.size == 0
+
+    def is_full(self):
+        """Return True if the ring buffer is full, else return False."""
+        return self.size == self.num_slots
+
+    def close(self):
+        """Close this process's view of the shared memory block."""
+        self._buffer = None
+        self._memory.close()
+
+    def unlink(self):
+        """Free the shared memory block once every process has closed it.
+        Should be called once, by the process that created it.
+        """
+        if sys.version_info < (3, 13):
+            # Attaching from a process that shares this process's resource
+            # tracker unregisters the block, so register it again before
+            # unlink unregisters it
+            resource_tracker.register(self._memory._name, "shared_memory")
+        self._memory.unlink()
+
+    def __enter__(self):
+        """Return the ring buffer."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the ring buffer, and free its block if this process
+        created it.
+        """
+        self.close()
+        if self._is_creator:
+            self.unlink()
+
+    def __reduce__(self):
+        """Pickle the ring buffer as its name, so another process attaches
+        to the same block.
+        """
+        return (SharedMemoryRingBuffer.attach, (self.name,))
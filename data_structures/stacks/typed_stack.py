@@ -0,0 +1,72 @@
+"""This module contains my implementation of a typed stack. The items
+are stored unboxed in an array.array, so with the default "q" typecode
+every item takes 8 bytes instead of a pointer to a separate int object.
+Items must fit the typecode, or array raises a TypeError or an
+OverflowError.
+"""
+
+from array import array
+
+
+class TypedStack:
+    """Class to represent a stack of numbers of one array typecode."""
+
+    def __init__(self, typecode="q"):
+        self._items = array(typecode)
+
+    def push(self, item):
+        """Insert at the top of the stack."""
+        self._items.append(item)
+
+    def push_many(self, items):
+        """Insert every item at the top of the stack, in order, so the last
+        item ends up on top. If any item doesn't fit the typecode, none of
+        them are inserted.
+        """
+        if isinstance(items, array) and items.typecode == self.typecode:
+            self._items.extend(items)
+        else:
+            self._items.fromlist(items if isinstance(items, list) else list(items))
+
+    def pop(self):
+        """Remove and return the top item in the stack."""
+        try:
+            return self._items.pop()
+        except IndexError:
+            raise IndexError("Stack is empty.") from None
+
+    def pop_many(self, count):
+        """Remove and return an array of up to count items from the top of
+        the stack, in the order they would have been popped.
+        """
+        if count < 0:
+            raise ValueError("Count can't be negative.")
+        start = max(0, len(self._items) - count)
+        items = self._items[start:]
+        del self._items[start:]
+        items.reverse()
+        return items
+
+    def is_empty(self):
+        """Return True if the stack is empty, else return False."""
+        return len(self._items) == 0
+
+    def peek(self):
+        """Return the value of the item on top of the stack."""
+        if self.is_empty():
+            return None
+        return self._items[-1]
+
+    @property
+    def size(self):
+        """Return the number of items on the stack."""
+        return len(self._items)
+
+    @property
+    def typecode(self):
+        """Return the array typecode of the items."""
+        return self._items.typecode
+
+    def __len__(self):
+        """Return the number of items on the stack."""
+        return len(self._items)
@@ -17,6 +17,8 @@ with each coin as long as that coin is less than or equal to the remaining amoun
 - Take the minimum of all possible paths as your answer
 """
 
+from data_structures.lru_cache.memoize import memoize
+
 # Bottom Up Solution
 # time complexity: O(n * m), where 'n' is the total and 'm' is the length of coins
 # space comexplity: O(n)
@@ -38,27 +40,43 @@ def min_coins_to_make_change(coins, total):
 
 # Top down solution with Recursion
 # time complexity: O(n * m), where 'n' is the amount and 'm' is the length of coins
-# space comexplity: O(n)
+# space comexplity: O(n), capped at the LRU Cache's max capacity
+# The memo table is an LRU Cache keyed on (coins, remaining_amount) and shared
+# by every call, so repeated queries with the same coins reuse earlier results
 def coinChange(coins, amount):
     if not coins:
         return 0
-    memo = [-1] * (amount + 1)
-    min_coins = make_change(coins, amount, memo)
+    min_coins = make_change(tuple(coins), amount)
     if min_coins == float("inf"):
         return -1
     return min_coins
 
 
-def make_change(coins, remaining_amount, memo):
+@memoize(max_capacity=4096)
+def make_change(coins, remaining_amount):
+    return _make_change(coins, remaining_amount)
+
+
+# The recursion checks the decorator's LRU Cache itself instead of calling the
+# memoized function, so each level of recursion is one stack frame rather than
+# two. The recursion solves the amounts in roughly increasing order and each
+# amount only looks up the ones at most max(coins) below it, so as long as the
+# largest coin is smaller than the cache's max capacity, nothing is evicted
+# before it's needed, even when the amount is larger than the max capacity
+def _make_change(coins, remaining_amount):
     if remaining_amount == 0:
-        min_coins = 0
-    elif memo[remaining_amount] >= 0:
-        return memo[remaining_amount]
-    else:
-        min_coins = float("inf")
-        for coin in coins:
-            if coin <= remaining_amount:
-                result = make_change(coins, remaining_amount - coin, memo)
-                min_coins = min(min_coins, result + 1)
-    memo[remaining_amount] = min_coins
-    return memo[remaining_amount]
+        return 0
+    cache = make_change.cache
+    min_coins = float("inf")
+    for coin in coins:
+        if coin <= remaining_amount:
+            subproblem = remaining_amount - coin
+            key = make_change.cache_key(coins, subproblem)
+            item = cache.get(key)
+            if item is None:
+                result = _make_change(coins, subproblem)
+                cache.put(key, result)
+            else:
+                result = item.value
+            min_coins = min(min_coins, result + 1)
+    return min_coins
@@ -15,9 +15,13 @@ result will be stored in the memo table
 - The memoized calls will take constant time
 - The number of non-memoized calls is 'n', and each takes constant time
 - So the time complexity O(n)
+- The memo table is an LRU Cache shared by every call, so later calls
+reuse earlier results, and its capacity bounds the memory it uses
 
 """
 
+from data_structures.lru_cache.memoize import memoize
+
 # The below functions assume that all inputs will be valid and that n
 # will never be less than 0
 
@@ -37,21 +41,35 @@ def naive_fibonacci(n):
 # time complexity: O(n)
 # space complexity: O(n)
 def fibonacci_top_down(n):
-    memo = {}
-    return compute_fibonacci(n, memo)
+    return compute_fibonacci(n)
 
 
-def compute_fibonacci(n, memo):
-    if n in memo:
-        return memo[n]
+@memoize(max_capacity=1024)
+def compute_fibonacci(n):
+    return _compute_fibonacci(n)
+
+
+# The recursion checks the decorator's LRU Cache itself instead of calling the
+# memoized function, so each level of recursion is one stack frame rather than
+# two. Since fib(n - 2) is always looked up right after fib(n - 1) is computed,
+# it is one of the two most recently used entries and is never evicted first
+def _compute_fibonacci(n):
     if n == 0:
-        fibonacci = 0
-    elif n == 1 or n == 2:
-        fibonacci = 1
-    else:
-        fibonacci = compute_fibonacci(n - 1, memo) + compute_fibonacci(n - 2, memo)
-    memo[n] = fibonacci
-    return memo[n]
+        return 0
+    if n == 1 or n == 2:
+        return 1
+    cache = compute_fibonacci.cache
+    fibonacci = 0
+    for subproblem in (n - 1, n - 2):
+        key = compute_fibonacci.cache_key(subproblem)
+        item = cache.get(key)
+        if item is None:
+            value = _compute_fibonacci(subproblem)
+            cache.put(key, value)
+        else:
+            value = item.value
+        fibonacci += value
+    return fibonacci
 
 
 # time complexity: O(n)
@@ -10,6 +10,7 @@ pick the item or don't pick it (0-1 property)
 
 from pprint import pprint
 from collections import namedtuple
+from data_structures.lru_cache.memoize import HashedTuple, memoize
 
 # Bottom Up Solution
 # The num_items variable represents a row in the matrix and weight represents a column
@@ -40,47 +41,51 @@ def knapsack_bottom_up(items, max_weight):
 
 # Top Down Solution
 # Time complexity: O(n * m), where 'n' is the number of items and 'm' is the maximum weight
-# space complexity: O(n * m)
+# space complexity: O(n * m) per call, which is not capped by any LRU Cache
+# Each call keeps its own memo table of every subproblem, since an LRU Cache
+# smaller than the n * m subproblems would evict results that are still needed and
+# solve them over and over. The tradeoff is that one large call holds up to n * (m + 1)
+# results in memory until it returns. Only the answers to whole queries are kept in
+# an LRU Cache keyed on (items, max_weight), which is capped and shared by every
+# call. The items are passed as a HashedTuple so that their hash is only computed
+# once per call to knapsack_top_down
 def knapsack_top_down(items, max_weight):
-    total_items = len(items)
-    running_total = 0
-    memo = [[None] * (max_weight + 1) for num in range(total_items + 1)]
-    return find_max_item_value(items, max_weight, total_items, running_total, memo)
+    return solve_knapsack(HashedTuple(items), max_weight)
 
 
-def find_max_item_value(items, remaining_weight, num_items, running_total, memo):
-    # Check for memoized value
-    if memo[num_items][remaining_weight] is not None:
-        return memo[num_items][remaining_weight]
+@memoize(max_capacity=128)
+def solve_knapsack(items, max_weight):
+    return find_max_item_value(items, max_weight, len(items), {})
 
+
+def find_max_item_value(items, remaining_weight, num_items, memo):
     # Base Cases: Weight is 0 or no items to choose from
     if remaining_weight == 0 or num_items == 0:
-        result = running_total
-    
+        return 0
+
+    # Check for memoized value
+    key = (remaining_weight, num_items)
+    if key in memo:
+        return memo[key]
+
     # Case 1: The item's weight turned out to be greater than the remaining weight, so pass on choosing
     # this item
-    elif items[num_items - 1].weight > remaining_weight:
-        result = find_max_item_value(
-            items, remaining_weight, num_items - 1, running_total, memo
-        )
+    item = items[num_items - 1]
+    if item.weight > remaining_weight:
+        result = find_max_item_value(items, remaining_weight, num_items - 1, memo)
+
     # Case 2: The item's weight falls within the remaining weight constraint, so take the greater between the
     # result of passing on this item or choosing this item
     else:
-        temp1 = find_max_item_value(
-            items, remaining_weight, num_items - 1, running_total, memo
-        )
-        temp2 = find_max_item_value(
-            items,
-            remaining_weight - items[num_items - 1].weight,
-            num_items - 1,
-            running_total + items[num_items - 1].value,
-            memo,
+        result = max(
+            find_max_item_value(items, remaining_weight, num_items - 1, memo),
+            find_max_item_value(
+                items, remaining_weight - item.weight, num_items - 1, memo
+            )
+            + item.value,
         )
-        result = max(temp1, temp2)
-
-        
-    memo[num_items][remaining_weight] = result
-    return memo[num_items][remaining_weight]
+    memo[key] = result
+    return result
 
 
 
@@ -19,15 +19,34 @@ def dfs_visit(node, adjacency_matrix, visited):
 
 
 # iterative implementation of dfs_visit
-# will produce a different ordering than the recursive version
-def dfs_visit_iterative(node, adjacency_matrix, visited):
+# will produce a different ordering than the recursive version.
+# the nodes waiting to be visited are kept in a python list, unless an
+# empty stack with push_many and pop is passed in, such as a
+# TypedStack("q"), which gets the unvisited neighbors of each node in
+# one push_many call
+def dfs_visit_iterative(node, adjacency_matrix, visited, stack=None):
+    if stack is None:
+        stack = []
     visited.add(node)
-    stack = [node]
+    if isinstance(stack, list):
+        stack.append(node)
+        while stack:
+            current_node = stack.pop()
+            yield current_node
+            for neighbor, value in enumerate(adjacency_matrix[current_node]):
+                if value == 1 and neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append(neighbor)
+        return
+    push_many = stack.push_many
+    pop = stack.pop
+    push_many([node])
     while stack:
-        current_node = stack.pop()
+        current_node = pop()
         yield current_node
+        new_neighbors = []
         for neighbor, value in enumerate(adjacency_matrix[current_node]):
             if value == 1 and neighbor not in visited:
                 visited.add(neighbor)
-                stack.append(neighbor)
-
+                new_neighbors.append(neighbor)
+        push_many(new_neighbors)
@@ -0,0 +1,197 @@
+"""This module contains tests for my implementation of a thread-safe
+hash table that uses lock striping.
+"""
+
+import threading
+import unittest
+from data_structures.hash_tables.concurrent_hash_table import ConcurrentHashTable
+
+
+class ConcurrentHashTableTestCase(unittest.TestCase):
+    """Class for running single-threaded tests on the concurrent hash table."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.hash_table = ConcurrentHashTable(num_stripes=4)
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.hash_table
+
+    def test_invalid_arguments_raise_error(self):
+        """Test that invalid constructor arguments raise an error."""
+        with self.assertRaises(ValueError):
+            ConcurrentHashTable(capacity=0)
+        with self.assertRaises(ValueError):
+            ConcurrentHashTable(max_load_factor=0)
+        with self.assertRaises(ValueError):
+            ConcurrentHashTable(num_stripes=3)
+
+    def test_capacity_is_multiple_of_stripes(self):
+        """Test that the capacity is rounded up to a power of two that is
+        at least the number of stripes.
+        """
+        self.assertEqual(16, ConcurrentHashTable(capacity=2, num_stripes=16).capacity)
+        self.assertEqual(32, ConcurrentHashTable(capacity=20, num_stripes=4).capacity)
+
+    def test_put_get_and_overwrite(self):
+        """Test that values can be inserted, retrieved and overwritten."""
+        self.hash_table.put("cat", 1)
+        self.hash_table["dog"] = 2
+        self.hash_table.put("cat", 3)
+        self.assertEqual(3, self.hash_table.get("cat"))
+        self.assertEqual(2, self.hash_table["dog"])
+        self.assertIsNone(self.hash_table.get("bird"))
+        self.assertEqual(2, self.hash_table.num_items)
+
+    def test_none_key_raises_error(self):
+        """Test that None can't be used as a key."""
+        with self.assertRaises(KeyError):
+            self.hash_table.put(None, 1)
+        with self.assertRaises(KeyError):
+            self.hash_table.get(None)
+        with self.assertRaises(KeyError):
+            self.hash_table.delete(None)
+
+    def test_delete(self):
+        """Test that deleting keys removes them, and that deleting a
+        missing key raises an error.
+        """
+        for key in range(10):
+            self.hash_table.put(key, key)
+        del self.hash_table[3]
+        self.hash_table.delete(7)
+        self.assertNotIn(3, self.hash_table)
+        self.assertFalse(self.hash_table.exists(7))
+        self.assertEqual(8, self.hash_table.num_items)
+        with self.assertRaises(KeyError):
+            self.hash_table.delete(3)
+
+    def test_keys_values_and_items(self):
+        """Test that keys, values and items reflect the table contents."""
+        expected = {"a": 1, "b": 2, "c": 3}
+        for key, value in expected.items():
+            self.hash_table.put(key, value)
+        self.assertEqual(sorted(expected), sorted(self.hash_table.keys()))
+        self.assertEqual([1, 2, 3], sorted(self.hash_table.values()))
+        self.assertEqual(sorted(expected.items()), sorted(self.hash_table.items()))
+
+    def test_grows_and_keeps_items(self):
+        """Test that the table grows as items are added and that every
+        item can still be found afterwards.
+        """
+        for key in range(1000):
+            self.hash_table.put(key, str(key))
+        self.assertGreater(self.hash_table.capacity, 1000)
+        for key in range(1000):
+            self.assertEqual(str(key), self.hash_table.get(key))
+
+    def test_growth_follows_total_load(self):
+        """Test that keys sharing their low bits neither crowd into one
+        stripe nor grow the table past what its total load calls for.
+        """
+        for multiple in (16, 1024):
+            table = ConcurrentHashTable()
+            for key in range(1000):
+                table.put(key * multiple, key)
+            self.assertEqual(2048, table.capacity)
+            for key in range(1000):
+                self.assertEqual(key, table.get(key * multiple))
+
+    def test_clear(self):
+        """Test that clearing the table removes every item."""
+        for key in range(20):
+            self.hash_table.put(key, key)
+        self.hash_table.clear()
+        self.assertTrue(self.hash_table.is_empty())
+        self.assertEqual([], self.hash_table.items())
+
+    def test_hash_function(self):
+        """Test that a custom hash function is used for every key."""
+        table = ConcurrentHashTable(hash_function=lambda key: 0)
+        for key in range(10):
+            table.put(key, key)
+        for key in range(10):
+            self.assertEqual(key, table.get(key))
+
+
+class ThreadSafetyTestCase(unittest.TestCase):
+    """Class for running multi-threaded tests on the concurrent hash table."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.hash_table = ConcurrentHashTable(capacity=1, num_stripes=8)
+        self.num_threads = 8
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.hash_table
+
+    def run_threads(self, target):
+        """Run the target function in several threads, passing each one
+        its thread number, and wait for them all to finish.
+        """
+        threads = [
+            threading.Thread(target=target, args=(number,))
+            for number in range(self.num_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_concurrent_puts_are_not_lost(self):
+        """Test that no insert is lost when threads insert disjoint keys
+        while the table resizes underneath them.
+        """
+
+        def insert(number):
+            for key in range(number * 1000, (number + 1) * 1000):
+                self.hash_table.put(key, key)
+
+        self.run_threads(insert)
+        self.assertEqual(self.num_threads * 1000, self.hash_table.num_items)
+        for key in range(self.num_threads * 1000):
+            self.assertEqual(key, self.hash_table.get(key))
+
+    def test_concurrent_put_and_delete(self):
+        """Test that the item count stays correct when threads insert and
+        delete their own keys.
+        """
+
+        def insert_and_delete(number):
+            keys = range(number * 500, (number + 1) * 500)
+            for key in keys:
+                self.hash_table.put(key, key)
+            for key in keys:
+                if key % 2:
+                    self.hash_table.delete(key)
+
+        self.run_threads(insert_and_delete)
+        self.assertEqual(self.num_threads * 250, self.hash_table.num_items)
+        for key in range(self.num_threads * 500):
+            self.assertEqual(key % 2 == 0, key in self.hash_table)
+
+    def test_readers_see_consistent_values(self):
+        """Test that lock-free readers only ever see a value that was
+        written for a key, even while writers update keys and resize.
+        """
+        errors = []
+
+        def read_or_write(number):
+            for round_number in range(2000):
+                key = round_number % 300
+                if number % 2:
+                    self.hash_table.put(key, (key, round_number))
+                else:
+                    value = self.hash_table.get(key)
+                    if value is not None and value[0] != key:
+                        errors.append((key, value))
+
+        self.run_threads(read_or_write)
+        self.assertEqual([], errors)
+        self.assertEqual(300, self.hash_table.num_items)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""This module contains tests for the hash functions that can be plugged
+into my hash table implementations.
+"""
+
+import unittest
+from data_structures.hash_tables.hash_functions import (
+    FibonacciHash,
+    ModularHash,
+    SipHash,
+)
+from notes.hash_tables import hash_function_integers
+
+
+class SipHashTestCase(unittest.TestCase):
+    """Class for running tests on the SipHash hash function."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.sip_hash = SipHash(bytes(range(16)))
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.sip_hash
+
+    def test_reference_vectors(self):
+        """Test that the hashes match the reference vectors from the
+        SipHash paper, which use the key 00 01 ... 0f and the messages
+        00 01 ... (n - 1).
+        """
+        self.assertEqual(0x726FDB47DD0E0E31, self.sip_hash.hash_bytes(b""))
+        self.assertEqual(0x93F5F5799A932462, self.sip_hash.hash_bytes(bytes(range(8))))
+        self.assertEqual(
+            0xA129CA6149BE45E5, self.sip_hash.hash_bytes(bytes(range(15)))
+        )
+
+    def test_invalid_seed_raises_error(self):
+        """Test that a seed that is not 16 bytes long raises an error."""
+        with self.assertRaises(ValueError):
+            SipHash(b"short")
+
+    def test_seed_changes_hash(self):
+        """Test that the same key hashes differently under different seeds,
+        and that a random seed is chosen when none is given.
+        """
+        other = SipHash(bytes(range(1, 17)))
+        self.assertNotEqual(self.sip_hash("Apple"), other("Apple"))
+        self.assertNotEqual(SipHash()("Apple"), SipHash()("Apple"))
+
+    def test_equal_keys_hash_equal(self):
+        """Test that keys which compare equal have equal hashes."""
+        self.assertEqual(self.sip_hash("Apple"), self.sip_hash("Apple"))
+        self.assertEqual(self.sip_hash(b"Apple"), self.sip_hash(bytearray(b"Apple")))
+        self.assertEqual(self.sip_hash(1), self.sip_hash(1.0))
+        self.assertEqual(self.sip_hash((1, "a")), self.sip_hash((1, "a")))
+
+
+class FibonacciHashTestCase(unittest.TestCase):
+    """Class for running tests on the Fibonacci hash function."""
+
+    def test_requires_power_of_two_capacity(self):
+        """Test that the Fibonacci hash asks for power of two capacities."""
+        self.assertTrue(FibonacciHash.power_of_two)
+
+    def test_spreads_keys_sharing_low_bits(self):
+        """Test that keys which are all multiples of 1024 still spread over
+        most of the buckets of a table with 64 buckets.
+        """
+        fibonacci_hash = FibonacciHash()
+        buckets = {fibonacci_hash(key << 10) & 63 for key in range(256)}
+        self.assertGreater(len(buckets), 48)
+
+    def test_seed_changes_hash(self):
+        """Test that the seed changes the hash of a key."""
+        self.assertNotEqual(FibonacciHash()(12345), FibonacciHash(seed=99)(12345))
+
+    def test_hash_fits_in_64_bits(self):
+        """Test that hashes are non-negative and less than 2^64."""
+        fibonacci_hash = FibonacciHash()
+        for key in (-1, 0, 1, 2 ** 100, "Apple"):
+            self.assertTrue(0 <= fibonacci_hash(key) < 2 ** 64)
+
+
+class ModularHashTestCase(unittest.TestCase):
+    """Class for running tests on the adapter for the modular hashing
+    functions in the notes.
+    """
+
+    def test_adapts_notes_functions(self):
+        """Test that the adapter passes the key and modulus through to the
+        function it wraps.
+        """
+        self.assertEqual(12345, ModularHash(hash_function_integers)(12345))
+        self.assertEqual(3, ModularHash(hash_function_integers, modulus=7)(10))
+        string_hash = ModularHash()
+        self.assertEqual(string_hash("Apple"), string_hash("Apple"))
+        self.assertNotEqual(string_hash("Apple"), string_hash("Apply"))
+
+
+if __name__ == "__main__":
+    unittest.main()
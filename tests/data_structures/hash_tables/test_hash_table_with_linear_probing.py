@@ -2,8 +2,17 @@
 table that uses linear probing to handle collisions.
 """
 
+import random
 import unittest
-from data_structures.hash_tables.hash_table_with_linear_probing import HashTable
+from data_structures.hash_tables.hash_functions import (
+    FibonacciHash,
+    ModularHash,
+    SipHash,
+)
+from data_structures.hash_tables.hash_table_with_linear_probing import (
+    HashTable,
+    PROBING_STRATEGIES,
+)
 
 
 class HashTableTestCase(unittest.TestCase):
@@ -278,6 +287,512 @@ class HashTableTestCase(unittest.TestCase):
         with self.assertRaises(AttributeError):
             self.non_empty_table.num_items = 100
 
+    def test_delete_counts_tombstones(self):
+        """Test that each deletion leaves a tombstone that is counted by
+        the num_tombstones property.
+        """
+        self.assertEqual(0, self.non_empty_table.num_tombstones)
+        self.non_empty_table.delete("Peach")
+        self.non_empty_table.delete("Apple")
+        self.assertEqual(2, self.non_empty_table.num_tombstones)
+
+        # halving the table rehashes it, which clears the tombstones
+        self.non_empty_table.delete("Avocado")
+        self.assertEqual(4, self.non_empty_table._capacity)
+        self.assertEqual(0, self.non_empty_table.num_tombstones)
+
+    def test_insert_reuses_tombstone(self):
+        """Test that inserting a key whose probe sequence passes a
+        tombstone places the key in the tombstone's slot.
+        """
+        table = HashTable(capacity=16, min_load_factor=0.01)
+        table.put(1, "one")
+        table.put(17, "seventeen")  # collides with 1 and lands in slot 2
+        table.delete(1)
+        self.assertEqual(1, table.num_tombstones)
+        table.put(33, "thirty three")
+        self.assertEqual(0, table.num_tombstones)
+        self.assertEqual(33, table._table[1].key)
+        self.assertEqual("seventeen", table.get(17))
+
+    def test_delete_heavy_workload_compacts_tombstones(self):
+        """Test that alternating inserts and deletes of distinct keys
+        trigger a rehash before tombstones can fill the table.
+        """
+        table = HashTable(capacity=16, min_load_factor=0.01)
+        table.put(-1, "anchor")
+        for key in range(1000):
+            table.put(key, key)
+            table.delete(key)
+            self.assertLess(
+                table.num_items + table.num_tombstones,
+                table._capacity * table._max_load_factor,
+            )
+        self.assertEqual(16, table._capacity)
+        self.assertEqual("anchor", table.get(-1))
+        self.assertIsNone(table.get(1000))
+
+    def test_lookup_terminates_without_empty_slots(self):
+        """Test that looking up a missing key ends even when every slot
+        holds an item or a tombstone.
+        """
+        table = HashTable(capacity=4, min_load_factor=0.01, max_load_factor=1)
+        for key in range(3):
+            table.put(key, key)
+        table.delete(0)
+        table._table[3] = table._table[0]
+        self.assertIsNone(table.get(100))
+        with self.assertRaises(KeyError):
+            table.delete(100)
+
+    def test_probe_length_stats(self):
+        """Test that the probe length statistics reflect how far each
+        item sits from its home bucket.
+        """
+        self.assertEqual(
+            {"mean": 0, "max": 0, "histogram": {}},
+            self.empty_table.probe_length_stats(),
+        )
+        table = HashTable(capacity=16)
+        table.put(1, "one")
+        table.put(17, "seventeen")
+        table.put(33, "thirty three")
+        table.put(5, "five")
+        stats = table.probe_length_stats()
+        self.assertEqual({1: 2, 2: 1, 3: 1}, stats["histogram"])
+        self.assertEqual(3, stats["max"])
+        self.assertEqual(7 / 4, stats["mean"])
+
+    def test_num_tombstones_no_setter(self):
+        """Test that the num_tombstones property is not writable."""
+        with self.assertRaises(AttributeError):
+            self.non_empty_table.num_tombstones = 100
+
+
+class ProbingStrategiesTestCase(unittest.TestCase):
+    """Class for running tests on the probing strategies that can be
+    selected for the hash table.
+    """
+
+    def test_invalid_probing_strategy_raises_error(self):
+        """Test that an unknown probing strategy raises an error."""
+        with self.assertRaises(ValueError):
+            HashTable(probing="cubic")
+
+    def test_capacity_rounded_to_power_of_two(self):
+        """Test that quadratic probing and double hashing round the
+        capacity up to a power of two, while the other strategies keep
+        the capacity they were given.
+        """
+        self.assertEqual(16, HashTable(capacity=10, probing="quadratic")._capacity)
+        self.assertEqual(
+            16, HashTable(capacity=10, probing="double_hashing")._capacity
+        )
+        self.assertEqual(8, HashTable(capacity=8, probing="quadratic")._capacity)
+        self.assertEqual(10, HashTable(capacity=10, probing="linear")._capacity)
+        self.assertEqual(10, HashTable(capacity=10, probing="robin_hood")._capacity)
+
+    def test_random_operations_match_dictionary(self):
+        """Test that a random mix of puts and deletes leaves every strategy
+        with the same contents as a dictionary.
+        """
+        for probing in PROBING_STRATEGIES:
+            with self.subTest(probing=probing):
+                generator = random.Random(42)
+                table = HashTable(probing=probing)
+                expected = {}
+                for _ in range(3000):
+                    key = generator.randrange(300)
+                    if key in expected and generator.random() < 0.4:
+                        table.delete(key)
+                        del expected[key]
+                    else:
+                        table.put(key, key * 2)
+                        expected[key] = key * 2
+                self.assertEqual(len(expected), table.num_items)
+                self.assertEqual(sorted(expected.items()), sorted(table.items()))
+                for key in range(300):
+                    self.assertEqual(expected.get(key), table.get(key))
+
+    def test_colliding_keys_use_different_probe_sequences(self):
+        """Test that keys sharing a home bucket are placed according to
+        the selected probing strategy.
+        """
+        slots = {}
+        for probing in ("linear", "quadratic", "double_hashing"):
+            table = HashTable(capacity=64, probing=probing)
+            for key in (0, 64, 128):
+                table.put(key, key)
+            slots[probing] = [
+                index for index, item in enumerate(table._table) if item is not None
+            ]
+        self.assertEqual([0, 1, 2], slots["linear"])
+        self.assertEqual([0, 1, 3], slots["quadratic"])
+        self.assertEqual([0, 1, 3], slots["double_hashing"])
+
+    def test_robin_hood_delete_leaves_no_tombstones(self):
+        """Test that deleting from a Robin Hood table shifts the following
+        items back instead of leaving tombstones.
+        """
+        table = HashTable(capacity=16, min_load_factor=0.01, probing="robin_hood")
+        for key in (1, 17, 33, 2):
+            table.put(key, key)
+        # slots 1 to 4 now hold 1, 17, 33 and 2
+        table.delete(1)
+        self.assertEqual(0, table.num_tombstones)
+        self.assertEqual(
+            [17, 33, 2], [table._table[index].key for index in range(1, 4)]
+        )
+        self.assertIsNone(table._table[4])
+        self.assertEqual(33, table.get(33))
+        self.assertEqual(2, table.get(2))
+
+    def test_robin_hood_takes_slot_from_richer_item(self):
+        """Test that an inserted item further from its home bucket takes
+        the slot of an item that is closer to its own home bucket.
+        """
+        table = HashTable(capacity=16, probing="robin_hood")
+        table.put(1, "one")
+        table.put(2, "two")
+        table.put(17, "seventeen")
+        # 17 has to pass 1 in its home bucket, then takes slot 2 from 2,
+        # which only sits in its home bucket, leaving 2 one slot further on
+        self.assertEqual(
+            [1, 17, 2], [table._table[index].key for index in range(1, 4)]
+        )
+        self.assertEqual({1: 1, 2: 2}, table.probe_length_stats()["histogram"])
+
+    def test_probe_length_stats_follow_probe_sequence(self):
+        """Test that probe lengths count the slots visited along the
+        strategy's own probe sequence.
+        """
+        table = HashTable(capacity=64, probing="quadratic")
+        for key in (0, 64, 128):
+            table.put(key, key)
+        self.assertEqual(
+            {1: 1, 2: 1, 3: 1}, table.probe_length_stats()["histogram"]
+        )
+
+
+class IncrementalResizeTestCase(unittest.TestCase):
+    """Class for running tests on the incremental resizing mode of the
+    hash table.
+    """
+
+    def test_invalid_rehash_step_raises_error(self):
+        """Test that a rehash step less than 1 raises an error."""
+        with self.assertRaises(ValueError):
+            HashTable(incremental_resize=True, rehash_step=0)
+
+    def test_growth_is_spread_over_later_operations(self):
+        """Test that doubling the table only migrates rehash_step slots
+        per operation, and that every item stays reachable meanwhile.
+        """
+        table = HashTable(capacity=64, incremental_resize=True, rehash_step=4)
+        for key in range(48):
+            table.put(key, key)
+        # the 48th item reached the max load factor and started a resize
+        self.assertTrue(table.is_resizing())
+        self.assertEqual(128, table._capacity)
+        self.assertEqual(4, table._rehash_index)
+        for key in range(48):
+            self.assertEqual(key, table.get(key))
+        self.assertFalse(table.is_resizing())
+        self.assertEqual(48, table.num_items)
+        self.assertEqual(list(range(48)), sorted(table.keys()))
+
+    def test_update_and_delete_during_resize(self):
+        """Test that keys still in the old table can be updated and
+        deleted before they are migrated.
+        """
+        table = HashTable(
+            capacity=64, min_load_factor=0.01, incremental_resize=True, rehash_step=1
+        )
+        for key in range(48):
+            table.put(key, key)
+        self.assertTrue(table.is_resizing())
+        table.put(47, "updated")
+        table.delete(46)
+        self.assertEqual(47, table.num_items)
+        self.assertEqual("updated", table.get(47))
+        self.assertIsNone(table.get(46))
+        with self.assertRaises(KeyError):
+            table.delete(46)
+        self.assertEqual(47, len(table.items()))
+
+    def test_clear_cancels_resize(self):
+        """Test that clearing the table drops the old table."""
+        table = HashTable(capacity=64, incremental_resize=True, rehash_step=1)
+        for key in range(48):
+            table.put(key, key)
+        table.clear()
+        self.assertFalse(table.is_resizing())
+        self.assertEqual([], table.items())
+
+    def test_random_operations_match_dictionary(self):
+        """Test that a random mix of puts and deletes, growing and
+        shrinking the table several times, leaves every probing strategy
+        with the same contents as a dictionary.
+        """
+        for probing in PROBING_STRATEGIES:
+            with self.subTest(probing=probing):
+                generator = random.Random(7)
+                table = HashTable(
+                    probing=probing, incremental_resize=True, rehash_step=1
+                )
+                expected = {}
+                for step in range(4000):
+                    key = generator.randrange(400)
+                    delete_chance = 0.2 if step < 2000 else 0.8
+                    if key in expected and generator.random() < delete_chance:
+                        table.delete(key)
+                        del expected[key]
+                    else:
+                        table.put(key, step)
+                        expected[key] = step
+                    self.assertEqual(len(expected), table.num_items)
+                self.assertEqual(sorted(expected.items()), sorted(table.items()))
+                for key in range(400):
+                    self.assertEqual(expected.get(key), table.get(key))
+
+
+class BulkOperationsTestCase(unittest.TestCase):
+    """Class for running tests on the bulk loading, lookup and deletion
+    methods of the hash table.
+    """
+
+    def count_resizes(self, table):
+        """Wrap the table's resize method so that every call is counted
+        in the returned list.
+        """
+        calls = []
+        resize_to = table._resize_to
+
+        def counting_resize_to(capacity):
+            calls.append(capacity)
+            resize_to(capacity)
+
+        table._resize_to = counting_resize_to
+        return calls
+
+    def test_from_items_sizes_table_once(self):
+        """Test that from_items sizes the table for every pair up front,
+        so that loading it never resizes.
+        """
+        pairs = [(key, key * 2) for key in range(1000)]
+        table = HashTable.from_items(pairs)
+        self.assertEqual(2048, table._capacity)
+        self.assertEqual(1000, table.num_items)
+        self.assertEqual(sorted(pairs), sorted(table.items()))
+
+    def test_from_items_with_expected_size_and_options(self):
+        """Test that from_items uses expected_size for iterables without a
+        length and passes other keyword arguments to the constructor.
+        """
+        pairs = ((key, key) for key in range(100))
+        table = HashTable.from_items(pairs, expected_size=100, max_load_factor=0.5)
+        self.assertEqual(256, table._capacity)
+        self.assertEqual(0.5, table._max_load_factor)
+        self.assertEqual(100, table.num_items)
+
+    def test_put_many_resizes_at_most_once(self):
+        """Test that put_many grows the table at most once for a sized
+        batch, and accepts a mapping.
+        """
+        table = HashTable()
+        calls = self.count_resizes(table)
+        table.put_many({"key%d" % key: key for key in range(500)})
+        self.assertEqual([1024], calls)
+        self.assertEqual(500, table.num_items)
+        self.assertEqual(499, table.get("key499"))
+
+    def test_get_many(self):
+        """Test that get_many returns the values in key order, with None
+        for missing keys.
+        """
+        table = HashTable.from_items([("Apple", 1), ("Banana", 2)])
+        self.assertEqual([2, None, 1], table.get_many(["Banana", "Bread", "Apple"]))
+
+    def test_delete_many_shrinks_at_most_once(self):
+        """Test that delete_many removes every key and shrinks the table
+        at most once.
+        """
+        table = HashTable.from_items([(key, key) for key in range(1000)])
+        calls = self.count_resizes(table)
+        table.delete_many(range(990))
+        self.assertEqual(1, len(calls))
+        self.assertEqual(10, table.num_items)
+        self.assertEqual(list(range(990, 1000)), sorted(table.keys()))
+        self.assertGreater(table._capacity * table._max_load_factor, 10)
+
+    def test_delete_many_missing_key_raises_error(self):
+        """Test that delete_many raises an error for a missing key, after
+        deleting the keys that came before it.
+        """
+        table = HashTable.from_items([(key, key) for key in range(10)])
+        with self.assertRaises(KeyError):
+            table.delete_many([0, 1, 100, 2])
+        self.assertEqual(8, table.num_items)
+        self.assertIsNone(table.get(1))
+        self.assertEqual(2, table.get(2))
+
+
+class ResizePolicyTestCase(unittest.TestCase):
+    """Class for running tests on the min capacity, shrink hysteresis and
+    resize statistics of the hash table.
+    """
+
+    def test_invalid_resize_policy_raises_error(self):
+        """Test that an invalid min capacity or shrink delay raises an
+        error.
+        """
+        with self.assertRaises(ValueError):
+            HashTable(min_capacity=0)
+
+        with self.assertRaises(ValueError):
+            HashTable(shrink_delay=-1)
+
+    def test_capacity_raised_to_min_capacity(self):
+        """Test that the starting capacity is at least the min capacity."""
+        self.assertEqual(64, HashTable(capacity=8, min_capacity=64)._capacity)
+
+    def test_never_shrinks_below_min_capacity(self):
+        """Test that deleting every item does not shrink the table below
+        its min capacity, or below a capacity of 1 by default.
+        """
+        table = HashTable(capacity=8, min_capacity=4)
+        for key in range(5):
+            table.put(key, key)
+        for key in range(5):
+            table.delete(key)
+        self.assertEqual(4, table._capacity)
+
+        table = HashTable(capacity=8)
+        for key in range(5):
+            table.put(key, key)
+        for key in range(5):
+            table.delete(key)
+        self.assertEqual(1, table._capacity)
+        table.put("Apple", 1)
+        self.assertEqual(1, table.get("Apple"))
+
+    def test_shrink_waits_for_shrink_delay(self):
+        """Test that the table only shrinks once shrink_delay deletes in a
+        row have found it at or below the min load factor.
+        """
+        table = HashTable(capacity=16, shrink_delay=2)
+        for key in range(5):
+            table.put(key, key)
+        table.delete(0)  # 4 items, first low load delete
+        table.delete(1)  # second
+        self.assertEqual(16, table._capacity)
+        table.put(1, 1)
+        table.delete(1)  # third in a row, so the table shrinks
+        self.assertEqual(8, table._capacity)
+
+    def test_shrink_delay_resets_when_load_recovers(self):
+        """Test that a delete that leaves the table above the min load
+        factor resets the count of low load deletes.
+        """
+        table = HashTable(capacity=16, shrink_delay=1)
+        for key in range(6):
+            table.put(key, key)
+        table.delete(0)  # 5 items, above the min load factor
+        table.delete(1)  # 4 items, first low load delete
+        table.put(0, 0)
+        table.put(1, 1)
+        table.delete(1)  # 5 items, count starts over
+        table.delete(0)  # 4 items, first low load delete again
+        self.assertEqual(16, table._capacity)
+
+    def test_no_shrink_when_halved_table_would_need_to_grow(self):
+        """Test that the table does not shrink when the halved table would
+        already be at the max load factor.
+        """
+        table = HashTable(capacity=16, min_load_factor=0.5, max_load_factor=0.75)
+        for key in range(11):
+            table.put(key, key)
+        for key in range(4):
+            table.delete(key)
+        # 7 items would fill 8 slots beyond the max load factor
+        self.assertEqual(16, table._capacity)
+        stats = table.resize_stats()
+        self.assertEqual(0, stats["shrinks"])
+
+    def test_resize_stats(self):
+        """Test that resize_stats counts grows and shrinks and adds up the
+        time spent resizing.
+        """
+        table = HashTable()
+        self.assertEqual(
+            {"grows": 0, "shrinks": 0, "rehashes": 0, "seconds": 0.0},
+            table.resize_stats(),
+        )
+        for key in range(100):
+            table.put(key, key)
+        for key in range(100):
+            table.delete(key)
+        stats = table.resize_stats()
+        self.assertEqual(5, stats["grows"])
+        self.assertEqual(8, stats["shrinks"])
+        self.assertGreater(stats["seconds"], 0)
+
+        # the snapshot is a copy
+        stats["grows"] = 100
+        self.assertEqual(5, table.resize_stats()["grows"])
+
+
+class HashFunctionTestCase(unittest.TestCase):
+    """Class for running tests on plugging hash functions into the hash
+    table.
+    """
+
+    def test_hash_functions_match_dictionary(self):
+        """Test that a random mix of puts and deletes leaves the table with
+        the same contents as a dictionary whichever hash function it uses.
+        """
+        for hash_function in (SipHash(), FibonacciHash(), ModularHash()):
+            with self.subTest(hash_function=type(hash_function).__name__):
+                generator = random.Random(11)
+                table = HashTable(hash_function=hash_function)
+                expected = {}
+                for step in range(2000):
+                    key = "key%d" % generator.randrange(200)
+                    if key in expected and generator.random() < 0.4:
+                        table.delete(key)
+                        del expected[key]
+                    else:
+                        table.put(key, step)
+                        expected[key] = step
+                self.assertEqual(sorted(expected.items()), sorted(table.items()))
+
+    def test_power_of_two_hash_function_rounds_capacity(self):
+        """Test that a hash function asking for power of two capacities
+        rounds the capacity up and uses masking for buckets.
+        """
+        table = HashTable(capacity=10, min_capacity=3, hash_function=FibonacciHash())
+        self.assertEqual(16, table._capacity)
+        self.assertEqual(4, table._min_capacity)
+        self.assertEqual(5, table._bucket_index(21, 16))
+
+    def test_each_key_hashed_once(self):
+        """Test that a key is hashed once per operation and that resizing
+        reuses the cached hashes.
+        """
+        calls = []
+
+        def counting_hash(key):
+            calls.append(key)
+            return hash(key)
+
+        table = HashTable(hash_function=counting_hash)
+        for key in range(100):
+            table.put(key, key)
+        self.assertEqual(100, len(calls))
+        table.get(5)
+        table.delete(5)
+        self.assertEqual(102, len(calls))
+
 
 if __name__ == "__main__":
     unittest.main()
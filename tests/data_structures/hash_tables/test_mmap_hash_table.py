@@ -0,0 +1,124 @@
+"""This module contains tests for my implementation of a read-only hash
+table that is stored in a memory-mapped file.
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+from data_structures.hash_tables.hash_table_with_linear_probing import HashTable
+from data_structures.hash_tables.mmap_hash_table import (
+    MappedHashTable,
+    write_hash_table,
+)
+
+
+class MappedHashTableTestCase(unittest.TestCase):
+    """Class for running tests on the memory-mapped hash table."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "table.htbl")
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        self.directory.cleanup()
+        del self.directory
+
+    def test_round_trip(self):
+        """Test that every written key can be looked up after opening the
+        file, and that missing keys return None.
+        """
+        items = {
+            "key %d" % number: struct.pack("<Q", number * 100)
+            for number in range(1000)
+        }
+        write_hash_table(self.path, items)
+        with MappedHashTable(self.path) as table:
+            self.assertEqual(1000, table.num_items)
+            for key, value in items.items():
+                self.assertEqual(value, table.get(key))
+            self.assertIsNone(table.get("missing"))
+            self.assertIsNone(table.get(None))
+            self.assertIn(b"key 5", table)
+            self.assertNotIn("key 1000", table)
+
+    def test_str_values_are_stored_as_utf8(self):
+        """Test that str keys and values are stored as UTF-8 bytes."""
+        write_hash_table(self.path, [("café", "crème")])
+        with MappedHashTable(self.path) as table:
+            self.assertEqual("crème".encode("utf-8"), table["café"])
+            self.assertEqual(
+                [("café".encode("utf-8"), "crème".encode("utf-8"))], table.items()
+            )
+
+    def test_last_duplicate_wins(self):
+        """Test that when a key is written more than once, the last value
+        is stored.
+        """
+        write_hash_table(self.path, [("a", "1"), ("b", "2"), ("a", "3")])
+        with MappedHashTable(self.path) as table:
+            self.assertEqual(2, table.num_items)
+            self.assertEqual(b"3", table.get("a"))
+            self.assertEqual([b"a", b"b"], table.keys())
+            self.assertEqual([b"3", b"2"], table.values())
+
+    def test_write_from_hash_table(self):
+        """Test that a linear-probing HashTable can be written to a file."""
+        hash_table = HashTable()
+        for number in range(50):
+            hash_table.put(str(number), str(number * 2))
+        write_hash_table(self.path, hash_table)
+        with MappedHashTable(self.path) as table:
+            self.assertEqual(
+                sorted(hash_table.keys()), sorted(key.decode() for key in table.keys())
+            )
+            for key, value in hash_table.items():
+                self.assertEqual(value.encode(), table.get(key))
+
+    def test_empty_and_full_tables(self):
+        """Test that lookups terminate in an empty table and in a table
+        with no empty slots.
+        """
+        write_hash_table(self.path, {})
+        with MappedHashTable(self.path) as table:
+            self.assertTrue(table.is_empty())
+            self.assertIsNone(table.get("a"))
+        write_hash_table(self.path, {"a": "1", "b": "2"}, max_load_factor=1)
+        with MappedHashTable(self.path) as table:
+            self.assertEqual(b"2", table.get("b"))
+            self.assertIsNone(table.get("c"))
+
+    def test_tables_can_be_opened_many_times(self):
+        """Test that several readers can map the same file at once and that
+        the hash seed stored in the file is used by all of them.
+        """
+        write_hash_table(self.path, {"a": "1"}, seed=bytes(16))
+        first = MappedHashTable(self.path)
+        second = MappedHashTable(self.path)
+        self.assertEqual(first.get("a"), second.get("a"))
+        first.close()
+        second.close()
+
+    def test_invalid_input_raises_error(self):
+        """Test that bad arguments and files that are not hash tables raise
+        an error.
+        """
+        with self.assertRaises(ValueError):
+            write_hash_table(self.path, {1: "a"})
+        with self.assertRaises(ValueError):
+            write_hash_table(self.path, {}, seed=b"short")
+        with self.assertRaises(ValueError):
+            write_hash_table(self.path, {}, max_load_factor=0)
+        with open(self.path, "wb") as file:
+            file.write(b"not a hash table at all, just some bytes")
+        with self.assertRaises(ValueError):
+            MappedHashTable(self.path)
+        open(self.path, "wb").close()
+        with self.assertRaises(ValueError):
+            MappedHashTable(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
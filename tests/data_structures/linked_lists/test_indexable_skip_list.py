@@ -0,0 +1,139 @@
+"""This module contains tests for the indexable skip list implementation."""
+
+
+import random
+import unittest
+from data_structures.linked_lists.indexable_skip_list import IndexableSkipList
+
+
+class IndexableSkipListTestCase(unittest.TestCase):
+    """Class for running tests on the indexable skip list implementation."""
+
+    def setUp(self):
+        """Create different skip list fixtures."""
+        self.empty_list = IndexableSkipList(seed=0)
+        self.non_empty_list = IndexableSkipList(seed=0)
+        #0 should be the first value of the list
+        for data in range(6, -1, -1):
+            self.non_empty_list.push_front(data)
+
+    def tearDown(self):
+        """Delete skip list fixtures."""
+        del self.empty_list
+        del self.non_empty_list
+
+    def assert_widths_are_correct(self, skip_list):
+        """Assert that every pointer's width is the distance to the node it
+        points to, or to one past the last value if it points to None.
+        """
+        positions = {id(skip_list.head): 0}
+        node = skip_list.head.next[0]
+        position = 1
+        while node is not None:
+            positions[id(node)] = position
+            position += 1
+            node = node.next[0]
+        for level in range(skip_list.level):
+            node = skip_list.head
+            while node is not None:
+                target = node.next[level]
+                end = skip_list.size + 1 if target is None else positions[id(target)]
+                self.assertEqual(end - positions[id(node)], node.width[level])
+                node = target
+
+    def test_peek(self):
+        """Test that the peek methods return None on an empty list and the
+        first and last values otherwise.
+        """
+        self.assertIsNone(self.empty_list.peek_front())
+        self.assertIsNone(self.empty_list.peek_back())
+        self.assertEqual(0, self.non_empty_list.peek_front())
+        self.assertEqual(6, self.non_empty_list.peek_back())
+
+    def test_push_and_pop(self):
+        """Test that values pushed and popped at both ends keep their order."""
+        self.non_empty_list.push_back(7)
+        self.non_empty_list.push_front(-1)
+        self.assertEqual(list(range(-1, 8)), list(self.non_empty_list))
+        self.assertEqual(-1, self.non_empty_list.pop_front())
+        self.assertEqual(7, self.non_empty_list.pop_back())
+        self.assertEqual(7, len(self.non_empty_list))
+        self.assert_widths_are_correct(self.non_empty_list)
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_front()
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_back()
+
+    def test_value_at(self):
+        """Test that value at returns every value and rejects bad indices."""
+        for index in range(7):
+            self.assertEqual(index, self.non_empty_list.value_at(index))
+        with self.assertRaises(IndexError):
+            self.non_empty_list.value_at(7)
+        with self.assertRaises(IndexError):
+            self.non_empty_list.value_at(-1)
+
+    def test_insert_and_remove_at_index(self):
+        """Test that inserting and removing in the middle shifts the values
+        after the index.
+        """
+        self.non_empty_list.insert(3, "a")
+        self.non_empty_list.insert(8, "b")
+        self.assertEqual([0, 1, 2, "a", 3, 4, 5, 6, "b"], list(self.non_empty_list))
+        self.non_empty_list.remove_at_index(3)
+        self.non_empty_list.remove_at_index(0)
+        self.assertEqual([1, 2, 3, 4, 5, 6, "b"], list(self.non_empty_list))
+        self.assert_widths_are_correct(self.non_empty_list)
+        with self.assertRaises(IndexError):
+            self.non_empty_list.insert(8, "c")
+        with self.assertRaises(IndexError):
+            self.non_empty_list.remove_at_index(7)
+        with self.assertRaises(IndexError):
+            self.empty_list.remove_at_index(0)
+
+    def test_matches_python_list(self):
+        """Test that random positional edits give the same result as the
+        same edits on a Python list.
+        """
+        generator = random.Random(1)
+        expected = []
+        for _ in range(2000):
+            if expected and generator.random() < 0.4:
+                index = generator.randrange(len(expected))
+                del expected[index]
+                self.empty_list.remove_at_index(index)
+            else:
+                index = generator.randint(0, len(expected))
+                data = generator.randrange(100)
+                expected.insert(index, data)
+                self.empty_list.insert(index, data)
+        self.assertEqual(expected, list(self.empty_list))
+        for index in range(0, len(expected), 7):
+            self.assertEqual(expected[index], self.empty_list.value_at(index))
+        self.assert_widths_are_correct(self.empty_list)
+
+    def test_search_and_remove_value(self):
+        """Test find value, count, membership and remove value."""
+        self.non_empty_list.push_back(2)
+        self.assertEqual(2, self.non_empty_list.find_value(2))
+        self.assertIsNone(self.non_empty_list.find_value(10))
+        self.assertEqual(2, self.non_empty_list.count(2))
+        self.assertIn(6, self.non_empty_list)
+        self.assertNotIn(10, self.non_empty_list)
+        self.non_empty_list.remove_value(2)
+        self.assertEqual([0, 1, 3, 4, 5, 6, 2], list(self.non_empty_list))
+        with self.assertRaises(ValueError):
+            self.non_empty_list.remove_value(10)
+        with self.assertRaises(ValueError):
+            self.empty_list.remove_value(0)
+
+    def test_reverse(self):
+        """Test that reversing the list reverses the order of its values."""
+        self.non_empty_list.reverse()
+        self.assertEqual([6, 5, 4, 3, 2, 1, 0], list(self.non_empty_list))
+        self.assertEqual(0, self.non_empty_list.value_at(6))
+        self.assert_widths_are_correct(self.non_empty_list)
+
+
+if __name__ == "__main__":
+    unittest.main()
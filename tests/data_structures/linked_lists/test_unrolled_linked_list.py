@@ -0,0 +1,170 @@
+"""This module contains tests for the unrolled linked list implementation."""
+
+
+import unittest
+from data_structures.linked_lists.unrolled_linked_list import UnrolledLinkedList
+
+
+class UnrolledLinkedListTestCase(unittest.TestCase):
+    """Class for running tests on the unrolled linked list implementation."""
+
+    def setUp(self):
+        """Create different linked list fixtures."""
+        self.empty_list = UnrolledLinkedList(node_capacity=4)
+        self.non_empty_list = UnrolledLinkedList(node_capacity=4)
+        #0 should be the first value of the list, spread over two nodes
+        for data in range(6, -1, -1):
+            self.non_empty_list.push_front(data)
+
+    def tearDown(self):
+        """Delete linked list fixtures."""
+        del self.empty_list
+        del self.non_empty_list
+
+    def assert_nodes_are_linked(self, linked_list):
+        """Assert that the nodes are linked both ways, that no node is empty
+        or over capacity and that the size matches the values held.
+        """
+        node = linked_list.head
+        previous = None
+        total = 0
+        while node is not None:
+            self.assertIs(previous, node.prev)
+            self.assertTrue(0 < len(node.values) <= linked_list.node_capacity)
+            total += len(node.values)
+            previous = node
+            node = node.next
+        self.assertIs(previous, linked_list.tail)
+        self.assertEqual(total, linked_list.size)
+
+    def test_invalid_node_capacity(self):
+        """Test that a list can't be created with nodes holding one value."""
+        with self.assertRaises(ValueError):
+            UnrolledLinkedList(node_capacity=1)
+
+    def test_peek_empty_list(self):
+        """Test that both peek methods return None when the list is empty."""
+        self.assertIsNone(self.empty_list.peek_front())
+        self.assertIsNone(self.empty_list.peek_back())
+
+    def test_peek_non_empty_list(self):
+        """Test that the peek methods return the first and last values."""
+        self.assertEqual(0, self.non_empty_list.peek_front())
+        self.assertEqual(6, self.non_empty_list.peek_back())
+
+    def test_push_front_and_push_back(self):
+        """Test that values pushed on both ends come out in order and fill
+        nodes up to their capacity.
+        """
+        for data in range(5):
+            self.empty_list.push_back(data)
+        self.empty_list.push_front(-1)
+        self.assertEqual([-1, 0, 1, 2, 3, 4], list(self.empty_list))
+        self.assertEqual(6, len(self.empty_list))
+        self.assertEqual([0, 1, 2, 3], self.empty_list.head.next.values)
+        self.assert_nodes_are_linked(self.empty_list)
+
+    def test_pop_empty_list(self):
+        """Test that both pop methods raise an IndexError on an empty list."""
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_front()
+        with self.assertRaises(IndexError):
+            self.empty_list.pop_back()
+
+    def test_pop_front_and_pop_back(self):
+        """Test that popping from both ends returns the values in order and
+        removes nodes once they are empty.
+        """
+        self.assertEqual(0, self.non_empty_list.pop_front())
+        self.assertEqual(6, self.non_empty_list.pop_back())
+        self.assertEqual(5, self.non_empty_list.pop_back())
+        self.assertEqual(4, self.non_empty_list.pop_back())
+        self.assert_nodes_are_linked(self.non_empty_list)
+        self.assertEqual([1, 2, 3], list(self.non_empty_list))
+        for data in (1, 2, 3):
+            self.assertEqual(data, self.non_empty_list.pop_front())
+        self.assertTrue(self.non_empty_list.is_empty())
+        self.assertIsNone(self.non_empty_list.head)
+        self.assertIsNone(self.non_empty_list.tail)
+
+    def test_value_at(self):
+        """Test that value at finds values in any node, searching from
+        either end.
+        """
+        for index in range(7):
+            self.assertEqual(index, self.non_empty_list.value_at(index))
+        with self.assertRaises(IndexError):
+            self.non_empty_list.value_at(7)
+        with self.assertRaises(IndexError):
+            self.non_empty_list.value_at(-1)
+
+    def test_insert_splits_full_nodes(self):
+        """Test that inserting into a full node splits it in two."""
+        self.non_empty_list.insert(1, "a")
+        self.non_empty_list.insert(6, "b")
+        self.non_empty_list.insert(9, "c")
+        self.assertEqual(
+            [0, "a", 1, 2, 3, 4, "b", 5, 6, "c"], list(self.non_empty_list)
+        )
+        self.assert_nodes_are_linked(self.non_empty_list)
+        with self.assertRaises(IndexError):
+            self.non_empty_list.insert(11, "d")
+
+    def test_remove_at_index_merges_nodes(self):
+        """Test that removing values merges nodes that fall below half full."""
+        #the fixture's nodes hold [0, 1, 2] and [3, 4, 5, 6]
+        for index in (3, 1, 1):
+            self.non_empty_list.remove_at_index(index)
+        self.assertEqual([0, 4, 5, 6], list(self.non_empty_list))
+        self.assertIs(self.non_empty_list.head, self.non_empty_list.tail)
+        self.assert_nodes_are_linked(self.non_empty_list)
+        with self.assertRaises(IndexError):
+            self.non_empty_list.remove_at_index(4)
+        with self.assertRaises(IndexError):
+            self.empty_list.remove_at_index(0)
+
+    def test_remove_value(self):
+        """Test that remove value and remove node remove the first
+        occurrence of a value and raise a ValueError if it is missing.
+        """
+        self.non_empty_list.push_back(3)
+        self.non_empty_list.remove_value(3)
+        self.non_empty_list.remove_node(6)
+        self.assertEqual([0, 1, 2, 4, 5, 3], list(self.non_empty_list))
+        self.assert_nodes_are_linked(self.non_empty_list)
+        with self.assertRaises(ValueError):
+            self.non_empty_list.remove_value(10)
+        with self.assertRaises(ValueError):
+            self.empty_list.remove_value(0)
+
+    def test_search_methods(self):
+        """Test find value, count and membership."""
+        self.non_empty_list.push_back(2)
+        self.assertEqual(2, self.non_empty_list.find_value(2))
+        self.assertIsNone(self.non_empty_list.find_value(10))
+        self.assertEqual(2, self.non_empty_list.count(2))
+        self.assertIn(6, self.non_empty_list)
+        self.assertNotIn(10, self.non_empty_list)
+
+    def test_reverse(self):
+        """Test that reversing swaps the head and tail and the order of the
+        values inside every node.
+        """
+        self.non_empty_list.reverse()
+        self.assertEqual([6, 5, 4, 3, 2, 1, 0], list(self.non_empty_list))
+        self.assertEqual(6, self.non_empty_list.peek_front())
+        self.assertEqual(0, self.non_empty_list.peek_back())
+        self.assert_nodes_are_linked(self.non_empty_list)
+
+    def test_deep_copy(self):
+        """Test that a deep copy has the same values but no shared nodes."""
+        copy = self.non_empty_list.deep_copy()
+        self.assertEqual(list(self.non_empty_list), list(copy))
+        self.assertIsNot(self.non_empty_list.head, copy.head)
+        copy.push_back(7)
+        self.assertEqual(7, len(self.non_empty_list))
+        self.assert_nodes_are_linked(copy)
+
+
+if __name__ == "__main__":
+    unittest.main()
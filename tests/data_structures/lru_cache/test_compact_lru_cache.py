@@ -0,0 +1,114 @@
+"""This module contains tests for the compact LRU Cache implementation."""
+import tracemalloc
+import unittest
+from data_structures.lru_cache.compact_lru_cache import LRUCache
+
+
+class CompactLRUCacheTestCase(unittest.TestCase):
+    """Class to run tests on the compact LRU Cache implementation."""
+
+    def test_invalid_max_capacity(self):
+        """Test to ensure the LRU Cache can't be instantiated
+        with a max capacity less than 1.
+        """
+        with self.assertRaises(ValueError):
+            LRUCache(-10)
+
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+    def test_cache_hit_and_miss(self):
+        """Test that a cached value is returned and that a missing key
+        returns None.
+        """
+        cache = LRUCache(3)
+        cache.put(1, "computation")
+        self.assertEqual("computation", cache.get(1))
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(1, cache.total_items)
+
+    def test_updating_item(self):
+        """Test to ensure that when an item is already in the
+        cache and the put operation is called, its value
+        is updated.
+        """
+        cache = LRUCache(3)
+        cache.put(1, "compuation one")
+        cache.put(2, "computation two")
+        cache.put(3, "computation three")
+
+        cache.put(3, "New computation")
+
+        self.assertEqual("New computation", cache.get(3))
+        self.assertEqual(3, cache.total_items)
+
+    def test_eviction_policy(self):
+        """Test that when the cache gets full, that the
+        last item is evicted.
+        """
+        cache = LRUCache(3)
+        cache.put(1, "compuation one")
+        cache.put(2, "computation two")
+        cache.put(3, "computation three")
+
+        #this should cause the first item to be kicked out
+        cache.put(4, "computation four")
+        self.assertIsNone(cache.get(1))
+
+        #this should move two to the top
+        #cache should look like this: 2, 4, 3
+        cache.get(2)
+
+        #item 3 should get evicted
+        cache.put(5, "computation five")
+        self.assertIsNone(cache.get(3))
+        self.assertEqual("computation two", cache.get(2))
+        self.assertEqual("computation four", cache.get(4))
+        self.assertTrue(cache.is_full())
+
+    def test_capacity_of_one(self):
+        """Test that a cache with a single slot always holds the most
+        recently inserted item.
+        """
+        cache = LRUCache(1)
+        for key in range(5):
+            cache.put(key, key)
+            self.assertEqual(key, cache.get(key))
+        self.assertEqual(1, cache.total_items)
+
+    def test_evicted_slots_are_reused(self):
+        """Test that evicted slots go back on the free list and are the
+        only slots handed out once the cache is full.
+        """
+        cache = LRUCache(4)
+        for key in range(100):
+            cache.put(key, key)
+        self.assertEqual([0, 1, 2, 3], sorted(cache.items.values()))
+        self.assertEqual([96, 97, 98, 99], sorted(cache.items))
+
+    def test_steady_state_does_not_grow_memory(self):
+        """Test that once the cache is full, a long run of gets, updates
+        and evictions doesn't leave any new memory allocated.
+        """
+        cache = LRUCache(1000)
+        keys = list(range(10000))
+
+        #warm up with a full round of churn so the dictionary has grown
+        #to its final size before anything is measured
+        tracemalloc.start()
+        try:
+            for key in keys[:5000]:
+                cache.put(key, key)
+                cache.get(key - 500)
+            before = tracemalloc.get_traced_memory()[0]
+            for key in keys[5000:]:
+                cache.put(key, key)
+                cache.get(key - 500)
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(after - before, 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
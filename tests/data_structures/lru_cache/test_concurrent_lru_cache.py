@@ -0,0 +1,197 @@
+"""This module contains tests for the thread-safe and asyncio LRU Caches."""
+import asyncio
+import threading
+import time
+import unittest
+from data_structures.lru_cache.concurrent_lru_cache import (
+    AsyncLRUCache,
+    ThreadSafeLRUCache,
+)
+
+
+class ThreadSafeLRUCacheTestCase(unittest.TestCase):
+    """Class to run tests on the thread-safe LRU Cache."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.cache = ThreadSafeLRUCache(3)
+        self.calls = []
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.cache
+        del self.calls
+
+    def slow_loader(self, key):
+        """Record the call, wait a little and return a value for the key."""
+        self.calls.append(key)
+        time.sleep(0.05)
+        return "value %s" % key
+
+    def run_threads(self, target, num_threads=8):
+        """Run the target in several threads and return their results."""
+        results = [None] * num_threads
+
+        def run(number):
+            try:
+                results[number] = target()
+            except Exception as error:
+                results[number] = error
+
+        threads = [
+            threading.Thread(target=run, args=(number,))
+            for number in range(num_threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_get_and_put(self):
+        """Test that the cache still behaves like an LRU Cache."""
+        for key in range(4):
+            self.cache.put(key, key)
+        self.assertIsNone(self.cache.get(0))
+        self.assertEqual(3, self.cache.get(3).value)
+
+    def test_get_or_load_caches_the_value(self):
+        """Test that a miss calls the loader and that a hit doesn't."""
+        self.assertEqual("value 1", self.cache.get_or_load(1, self.slow_loader))
+        self.assertEqual("value 1", self.cache.get_or_load(1, self.slow_loader))
+        self.assertEqual([1], self.calls)
+        self.assertEqual("value 1", self.cache.get(1).value)
+
+    def test_concurrent_misses_load_once(self):
+        """Test that concurrent misses on one key share a single load."""
+        results = self.run_threads(
+            lambda: self.cache.get_or_load(1, self.slow_loader)
+        )
+        self.assertEqual(["value 1"] * 8, results)
+        self.assertEqual([1], self.calls)
+
+    def test_failed_load_is_shared_and_not_cached(self):
+        """Test that every waiter gets the loader's exception, and that a
+        later call loads again.
+        """
+
+        def failing_loader(key):
+            self.calls.append(key)
+            time.sleep(0.05)
+            raise ValueError("backend down")
+
+        results = self.run_threads(
+            lambda: self.cache.get_or_load(1, failing_loader)
+        )
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual([1], self.calls)
+        self.assertIsNone(self.cache.get(1))
+        self.assertEqual("value 1", self.cache.get_or_load(1, self.slow_loader))
+
+    def test_background_sweeper(self):
+        """Test that the sweeper thread removes expired items without them
+        being accessed, and that it can be stopped.
+        """
+        cache = ThreadSafeLRUCache(3, ttl=0.01)
+        cache.put(1, "one")
+        cache.put(2, "two", ttl=60)
+        cache.start_sweeper(0.01)
+        try:
+            with self.assertRaises(ValueError):
+                cache.start_sweeper(0.01)
+            deadline = time.monotonic() + 2
+            while 1 in cache.items and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            cache.stop_sweeper()
+        self.assertEqual([2], list(cache.items))
+
+    def test_load_stats(self):
+        """Test that successful and failed loads are counted and timed."""
+        cache = ThreadSafeLRUCache(3, record_stats=True)
+        cache.get_or_load(1, self.slow_loader)
+        with self.assertRaises(KeyError):
+            cache.get_or_load(2, lambda key: {}[key])
+        stats = cache.stats()
+        self.assertEqual(1, stats["loads"])
+        self.assertEqual(1, stats["load_failures"])
+        self.assertEqual(2, stats["misses"])
+        self.assertGreaterEqual(stats["total_load_time"], 0.05)
+        self.assertAlmostEqual(stats["total_load_time"] / 2, stats["average_load_time"])
+
+
+class AsyncLRUCacheTestCase(unittest.IsolatedAsyncioTestCase):
+    """Class to run tests on the asyncio LRU Cache."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.cache = AsyncLRUCache(3)
+        self.calls = []
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.cache
+        del self.calls
+
+    async def slow_loader(self, key):
+        """Record the call, wait a little and return a value for the key."""
+        self.calls.append(key)
+        await asyncio.sleep(0.01)
+        return "value %s" % key
+
+    async def test_concurrent_misses_load_once(self):
+        """Test that concurrent misses on one key share a single load and
+        that the value is cached afterwards.
+        """
+        results = await asyncio.gather(
+            *(self.cache.get_or_load(1, self.slow_loader) for _ in range(8))
+        )
+        self.assertEqual(["value 1"] * 8, results)
+        self.assertEqual([1], self.calls)
+        self.assertEqual("value 1", await self.cache.get_or_load(1, self.slow_loader))
+        self.assertEqual([1], self.calls)
+
+    async def test_failed_load_is_shared_and_not_cached(self):
+        """Test that every waiter gets the loader's exception, and that a
+        later call loads again.
+        """
+
+        async def failing_loader(key):
+            self.calls.append(key)
+            await asyncio.sleep(0.01)
+            raise ValueError("backend down")
+
+        results = await asyncio.gather(
+            *(self.cache.get_or_load(1, failing_loader) for _ in range(4)),
+            return_exceptions=True,
+        )
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual([1], self.calls)
+        self.assertIsNone(self.cache.get(1))
+        self.assertEqual("value 1", await self.cache.get_or_load(1, self.slow_loader))
+
+    async def test_cancelled_waiter_does_not_cancel_load(self):
+        """Test that cancelling one waiter leaves the load running for the
+        other waiters.
+        """
+        first = asyncio.ensure_future(self.cache.get_or_load(1, self.slow_loader))
+        second = asyncio.ensure_future(self.cache.get_or_load(1, self.slow_loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        self.assertEqual("value 1", await second)
+        self.assertEqual([1], self.calls)
+
+    async def test_load_stats(self):
+        """Test that a shared load is counted once."""
+        cache = AsyncLRUCache(3, record_stats=True)
+        await asyncio.gather(
+            *(cache.get_or_load(1, self.slow_loader) for _ in range(4))
+        )
+        stats = cache.stats()
+        self.assertEqual(1, stats["loads"])
+        self.assertEqual(4, stats["misses"])
+        self.assertGreater(stats["total_load_time"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
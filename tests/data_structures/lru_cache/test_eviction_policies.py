@@ -0,0 +1,168 @@
+"""This module contains tests for the scan-resistant eviction policies."""
+import unittest
+from data_structures.lru_cache.eviction_policies import (
+    CountMinSketch,
+    SegmentedLRUCache,
+    TinyLFUCache,
+    TwoQueueCache,
+)
+from data_structures.lru_cache.lru_cache import LRUCache
+
+
+class PolicyInterfaceTestCase(unittest.TestCase):
+    """Class to run the tests that every policy should pass."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.policies = [SegmentedLRUCache, TwoQueueCache, TinyLFUCache]
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.policies
+
+    def test_invalid_max_capacity(self):
+        """Test that every policy rejects a capacity that is too small to
+        split into segments.
+        """
+        for policy in self.policies:
+            with self.subTest(policy=policy.__name__):
+                with self.assertRaises(ValueError):
+                    policy(1)
+
+    def test_hit_miss_and_update(self):
+        """Test that every policy returns cached items, returns None on a
+        miss and updates the value of an existing key.
+        """
+        for policy in self.policies:
+            with self.subTest(policy=policy.__name__):
+                cache = policy(10)
+                cache.put(1, "one")
+                self.assertEqual("one", cache.get(1).value)
+                cache.put(1, "uno")
+                self.assertEqual(1, cache.get(1).key)
+                self.assertEqual("uno", cache.get(1).value)
+                self.assertIsNone(cache.get(2))
+
+    def test_capacity_is_never_exceeded(self):
+        """Test that every policy stays within its max capacity."""
+        for policy in self.policies:
+            with self.subTest(policy=policy.__name__):
+                cache = policy(10)
+                for key in range(100):
+                    if cache.get(key % 13) is None:
+                        cache.put(key % 13, key)
+                    cache.put(key + 1000, key)
+                    self.assertLessEqual(cache.total_items, 10)
+
+    def access(self, cache, keys):
+        """Get every key from the cache, putting the ones that miss."""
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    def warm_up_and_scan(self, cache, is_cached):
+        """Access 20 hot keys ten times, mixed in with keys that are used
+        once, then scan 1000 new keys. Return how many hot keys are still
+        cached according to is_cached, which doesn't count as an access.
+        """
+        for round_number in range(10):
+            self.access(cache, range(20))
+            first_cold_key = 100 + round_number * 10
+            self.access(cache, range(first_cold_key, first_cold_key + 10))
+        self.access(cache, range(1000, 2000))
+        return sum(is_cached(key) for key in range(20))
+
+    def test_hot_items_survive_a_scan(self):
+        """Test that items that were hit repeatedly are still cached after
+        a scan of many keys that are used only once, unlike in an LRU
+        Cache.
+        """
+        cache = LRUCache(100)
+        self.assertEqual(0, self.warm_up_and_scan(cache, cache.items.__contains__))
+        for policy in self.policies:
+            with self.subTest(policy=policy.__name__):
+                cache = policy(100)
+                self.assertEqual(20, self.warm_up_and_scan(cache, cache.__contains__))
+
+
+class SegmentedLRUCacheTestCase(unittest.TestCase):
+    """Class to run tests on the segmented LRU Cache."""
+
+    def test_promotion_and_demotion(self):
+        """Test that a second access promotes an item to the protected
+        segment, and that a full protected segment demotes its least
+        recently used item back to probation.
+        """
+        cache = SegmentedLRUCache(4, protected_ratio=0.5)
+        cache.put(1, "one")
+        self.assertIn(1, cache.probation.items)
+        cache.get(1)
+        self.assertIn(1, cache.protected.items)
+        cache.put(2, "two")
+        cache.get(2)
+        cache.put(3, "three")
+        cache.get(3)
+        self.assertEqual([2, 3], sorted(cache.protected.items))
+        self.assertEqual([1], list(cache.probation.items))
+        self.assertEqual(3, cache.total_items)
+
+
+class TwoQueueCacheTestCase(unittest.TestCase):
+    """Class to run tests on the 2Q cache."""
+
+    def test_ghost_key_goes_to_main_segment(self):
+        """Test that a key pushed out of the FIFO queue is remembered as a
+        ghost and enters the main segment when it is put again.
+        """
+        cache = TwoQueueCache(8, recent_ratio=0.25)
+        cache.put(1, "one")
+        cache.put(2, "two")
+        cache.put(3, "three")
+        self.assertNotIn(1, cache)
+        self.assertIn(1, cache.ghosts.items)
+        cache.put(1, "one")
+        self.assertIn(1, cache.frequent.items)
+        self.assertNotIn(1, cache.ghosts.items)
+
+
+class TinyLFUCacheTestCase(unittest.TestCase):
+    """Class to run tests on the W-TinyLFU cache."""
+
+    def test_rarely_used_items_are_not_admitted(self):
+        """Test that an item pushed out of the window isn't admitted when
+        it has been seen less often than the item it would evict.
+        """
+        cache = TinyLFUCache(5, window_ratio=0.2)
+        for key in range(4):
+            for _ in range(3):
+                if cache.get(key) is None:
+                    cache.put(key, key)
+        cache.put(100, 100)
+        cache.put(101, 101)
+        self.assertNotIn(100, cache)
+        self.assertIn(101, cache)
+        self.assertEqual(4, cache.main.total_items)
+
+
+class CountMinSketchTestCase(unittest.TestCase):
+    """Class to run tests on the count-min sketch."""
+
+    def test_estimates_and_aging(self):
+        """Test that estimates never undercount, are capped, and are halved
+        once the sample size is reached.
+        """
+        sketch = CountMinSketch(64, sample_size=1000)
+        for _ in range(3):
+            sketch.add("a")
+        for _ in range(20):
+            sketch.add("b")
+        self.assertGreaterEqual(sketch.estimate("a"), 3)
+        self.assertEqual(CountMinSketch.MAX_COUNT, sketch.estimate("b"))
+        self.assertEqual(0, sketch.estimate("never added"))
+        sketch.reset()
+        self.assertEqual(CountMinSketch.MAX_COUNT // 2, sketch.estimate("b"))
+        self.assertEqual(11, sketch.additions)
+
+
+if __name__ == "__main__":
+    unittest.main()
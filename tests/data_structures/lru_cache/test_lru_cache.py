@@ -1,4 +1,6 @@
 """This module contains tests for the LRU Cache implementation."""
+import os
+import tempfile
 import unittest
 from data_structures.lru_cache.lru_cache import CacheItem, LRUCache
 
@@ -76,6 +78,262 @@ class LRUCacheTestCase(unittest.TestCase):
         self.assertIsNone(item)
 
 
+class FakeClock:
+    """Class to act as a clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current time."""
+        return self.now
+
+
+class TTLTestCase(unittest.TestCase):
+    """Class to run tests on the LRU Cache's time to live support."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.clock = FakeClock()
+        self.cache = LRUCache(10, ttl=10, clock=self.clock)
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.cache
+        del self.clock
+
+    def test_invalid_ttl(self):
+        """Test that a TTL of 0 or less raises an error."""
+        with self.assertRaises(ValueError):
+            LRUCache(3, ttl=0)
+
+    def test_items_expire_lazily(self):
+        """Test that an item is returned until its TTL passes and is
+        removed from the cache when it is accessed after that.
+        """
+        self.cache.put(1, "one")
+        self.clock.now = 9.9
+        self.assertEqual("one", self.cache.get(1).value)
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get(1))
+        self.assertEqual(0, self.cache.total_items)
+        self.assertNotIn(1, self.cache.items)
+
+    def test_per_item_ttl_and_refresh(self):
+        """Test that a TTL passed to put overrides the default, and that
+        putting an item again restarts its TTL.
+        """
+        self.cache.put(1, "one", ttl=1)
+        self.cache.put(2, "two")
+        self.clock.now = 5
+        self.cache.put(2, "two again")
+        self.assertIsNone(self.cache.get(1))
+        self.clock.now = 12
+        self.assertEqual("two again", self.cache.get(2).value)
+
+    def test_sweep_expired(self):
+        """Test that sweeping removes every expired item, wherever it is
+        in the recency list, and leaves the others.
+        """
+        for key in range(6):
+            self.cache.put(key, key, ttl=key + 1)
+        self.cache.get(0)
+        self.clock.now = 3
+        self.assertEqual(3, self.cache.sweep_expired())
+        self.assertEqual([3, 4, 5], sorted(self.cache.items))
+        self.assertEqual(3, self.cache.total_items)
+        self.assertEqual(3, self.cache.total_weight)
+
+
+class WeigherTestCase(unittest.TestCase):
+    """Class to run tests on the LRU Cache's weighted capacity."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.cache = LRUCache(100, weigher=lambda key, value: len(value))
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.cache
+
+    def test_evicts_until_new_item_fits(self):
+        """Test that as many items as needed are evicted from the tail to
+        make room for a heavy item.
+        """
+        for key in range(5):
+            self.cache.put(key, "x" * 20)
+        self.assertTrue(self.cache.is_full())
+        self.cache.put("big", "x" * 50)
+        self.assertEqual([3, 4, "big"], list(self.cache.items))
+        self.assertEqual(90, self.cache.total_weight)
+
+    def test_update_changes_weight(self):
+        """Test that updating an item with a heavier value evicts other
+        items but never the updated one.
+        """
+        self.cache.put(1, "x" * 40)
+        self.cache.put(2, "x" * 40)
+        self.cache.put(1, "x" * 90)
+        self.assertEqual([1], list(self.cache.items))
+        self.assertEqual(90, self.cache.total_weight)
+        self.cache.put(1, "x")
+        self.assertEqual(1, self.cache.total_weight)
+
+    def test_item_heavier_than_capacity(self):
+        """Test that an item heavier than the whole cache raises an error
+        and leaves the cache unchanged.
+        """
+        self.cache.put(1, "x" * 10)
+        with self.assertRaises(ValueError):
+            self.cache.put(2, "x" * 101)
+        self.assertEqual([1], list(self.cache.items))
+        self.assertEqual(10, self.cache.total_weight)
+
+
+class StatsTestCase(unittest.TestCase):
+    """Class to run tests on the LRU Cache's stats."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.clock = FakeClock()
+        self.cache = LRUCache(
+            10,
+            weigher=lambda key, value: len(value),
+            clock=self.clock,
+            record_stats=True,
+        )
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.cache
+        del self.clock
+
+    def test_stats_disabled_by_default(self):
+        """Test that asking a cache that doesn't record stats for them
+        raises an error.
+        """
+        cache = LRUCache(3)
+        with self.assertRaises(ValueError):
+            cache.stats()
+        with self.assertRaises(ValueError):
+            cache.reset_stats()
+
+    def test_hits_misses_evictions_and_expirations(self):
+        """Test that every kind of access is counted in the snapshot."""
+        self.cache.put("a", "xxxx", ttl=5)
+        self.cache.put("b", "xxxx")
+        self.cache.get("a")
+        self.cache.get("missing")
+        self.cache.put("c", "xxxx")
+        self.clock.now = 10
+        self.cache.get("c")
+        self.cache.get("b")
+        self.cache.get("a")
+        stats = self.cache.stats()
+        self.assertEqual(2, stats["hits"])
+        self.assertEqual(3, stats["misses"])
+        self.assertEqual(0.4, stats["hit_ratio"])
+        self.assertEqual(1, stats["evictions"])
+        self.assertEqual(1, stats["expirations"])
+        self.assertEqual(1, stats["total_items"])
+        self.assertEqual(4, stats["total_weight"])
+
+    def test_expirations(self):
+        """Test that lazy and swept expirations are both counted."""
+        self.cache.put("a", "x", ttl=1)
+        self.cache.put("b", "x", ttl=1)
+        self.clock.now = 2
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.sweep_expired()
+        stats = self.cache.stats()
+        self.assertEqual(2, stats["expirations"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(0, stats["evictions"])
+
+    def test_reset_stats(self):
+        """Test that resetting clears the counters but not the cache."""
+        self.cache.put("a", "xx")
+        self.cache.get("a")
+        self.cache.reset_stats()
+        stats = self.cache.stats()
+        self.assertEqual(0, stats["hits"])
+        self.assertEqual(0.0, stats["hit_ratio"])
+        self.assertEqual(0.0, stats["average_load_time"])
+        self.assertEqual(2, stats["total_weight"])
+
+
+class SnapshotTestCase(unittest.TestCase):
+    """Class to run tests on saving and loading LRU Cache snapshots."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.snapshot")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        self.directory.cleanup()
+        del self.directory
+        del self.clock
+
+    def recency_order(self, cache):
+        """Return the cache's keys from most to least recently used."""
+        keys = []
+        item = cache.head.next
+        while item is not cache.tail:
+            keys.append(item.key)
+            item = item.next
+        return keys
+
+    def test_round_trip_keeps_recency(self):
+        """Test that a loaded cache has the same items in the same order."""
+        cache = LRUCache(5)
+        for key in range(5):
+            cache.put(key, {"value": key})
+        cache.get(1)
+        self.assertEqual(5, cache.save(self.path))
+        restored = LRUCache(5)
+        self.assertEqual(5, restored.load(self.path))
+        self.assertEqual(self.recency_order(cache), self.recency_order(restored))
+        self.assertEqual({"value": 3}, restored.get(3).value)
+
+    def test_smaller_cache_keeps_most_recent_items(self):
+        """Test that loading into a smaller cache keeps the most recently
+        used items.
+        """
+        cache = LRUCache(5)
+        for key in range(5):
+            cache.put(key, key)
+        cache.save(self.path)
+        restored = LRUCache(2)
+        restored.load(self.path)
+        self.assertEqual([4, 3], self.recency_order(restored))
+
+    def test_remaining_ttl_is_kept(self):
+        """Test that expired items aren't saved and that the others keep
+        the time they had left to live.
+        """
+        cache = LRUCache(5, clock=self.clock)
+        cache.put("short", 1, ttl=5)
+        cache.put("long", 2, ttl=50)
+        cache.put("forever", 3)
+        self.clock.now = 10
+        self.assertEqual(2, cache.save(self.path))
+        restored = LRUCache(5, clock=self.clock)
+        restored.load(self.path)
+        self.assertEqual(["forever", "long"], self.recency_order(restored))
+        self.assertEqual(50, restored.items["long"].expires_at)
+        self.assertIsNone(restored.items["forever"].expires_at)
+
+    def test_invalid_snapshot(self):
+        """Test that loading a file that isn't a snapshot raises an error."""
+        with open(self.path, "wb") as file:
+            file.write(b"something else entirely")
+        with self.assertRaises(ValueError):
+            LRUCache(5).load(self.path)
+
+
 if __name__ == "__main__":
     unittest.main()
     
\ No newline at end of file
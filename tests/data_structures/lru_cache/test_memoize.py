@@ -0,0 +1,150 @@
+"""This module contains tests for the memoization decorator."""
+import random
+import unittest
+from data_structures.lru_cache.memoize import HashedTuple, memoize
+from dynammic_programming.min_coins_to_make_change import (
+    coinChange,
+    make_change,
+    min_coins_to_make_change,
+)
+from dynammic_programming.nth_fibonacci import (
+    compute_fibonacci,
+    fibonacci_bottom_up,
+    fibonacci_top_down,
+)
+from dynammic_programming.zero_one_knapsack import (
+    Item,
+    knapsack_bottom_up,
+    knapsack_top_down,
+)
+
+
+class MemoizeTestCase(unittest.TestCase):
+    """Class to run tests on the memoization decorator."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.calls = []
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.calls
+
+    def test_results_are_cached_across_calls(self):
+        """Test that the function is only called once per set of
+        arguments, including when its result is None.
+        """
+
+        @memoize(max_capacity=10)
+        def square(number, offset=0):
+            self.calls.append((number, offset))
+            return None if number < 0 else number * number + offset
+
+        self.assertEqual(4, square(2))
+        self.assertEqual(4, square(2))
+        self.assertEqual(5, square(2, offset=1))
+        self.assertIsNone(square(-1))
+        self.assertIsNone(square(-1))
+        self.assertEqual([(2, 0), (2, 1), (-1, 0)], self.calls)
+        stats = square.cache.stats()
+        self.assertEqual(2, stats["hits"])
+        self.assertEqual(3, stats["misses"])
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used results are evicted once the
+        cache is full.
+        """
+
+        @memoize(max_capacity=2)
+        def identity(number):
+            self.calls.append(number)
+            return number
+
+        for number in (1, 2, 3, 1):
+            identity(number)
+        self.assertEqual([1, 2, 3, 1], self.calls)
+        self.assertEqual(2, identity.cache.total_items)
+        self.assertEqual(2, identity.cache.stats()["evictions"])
+
+    def test_custom_key(self):
+        """Test that a key function can make unhashable arguments usable."""
+
+        @memoize(key=lambda numbers: tuple(numbers))
+        def total(numbers):
+            self.calls.append(numbers)
+            return sum(numbers)
+
+        self.assertEqual(6, total([1, 2, 3]))
+        self.assertEqual(6, total([1, 2, 3]))
+        self.assertEqual(1, len(self.calls))
+
+    def test_cache_key(self):
+        """Test that the decorated function's cache_key returns the key its
+        results are cached under, including with a custom key function.
+        """
+
+        @memoize()
+        def add(first, second=0):
+            return first + second
+
+        @memoize(key=lambda first, second=0: first)
+        def add_first(first, second=0):
+            return first + second
+
+        add(1, second=2)
+        add_first(3, second=4)
+        self.assertEqual(3, add.cache.get(add.cache_key(1, second=2)).value)
+        self.assertIsNone(add.cache.get(add.cache_key(1, 2)))
+        self.assertEqual(3, add_first.cache_key(3, second=4))
+        self.assertEqual(7, add_first.cache.get(add_first.cache_key(3)).value)
+
+    def test_hashed_tuple(self):
+        """Test that a HashedTuple hashes and compares like a tuple."""
+        items = HashedTuple([1, 2, 3])
+        self.assertEqual(hash((1, 2, 3)), hash(items))
+        self.assertEqual(hash((1, 2, 3)), hash(items))
+        self.assertEqual((1, 2, 3), items)
+
+    def test_fibonacci_shares_its_cache(self):
+        """Test that the top down fibonacci solver reuses results from
+        earlier calls.
+        """
+        self.assertEqual(fibonacci_bottom_up(900), fibonacci_top_down(900))
+        misses = compute_fibonacci.cache.stats()["misses"]
+        self.assertEqual(fibonacci_bottom_up(901), fibonacci_top_down(901))
+        self.assertEqual(misses + 1, compute_fibonacci.cache.stats()["misses"])
+
+    def test_fibonacci_recursion_depth(self):
+        """Test that the top down fibonacci solver handles inputs close to
+        the recursion limit.
+        """
+        self.assertEqual(fibonacci_bottom_up(900), fibonacci_top_down(900))
+
+    def test_coin_change_recursion_depth(self):
+        """Test that the top down coin change solver handles amounts close
+        to the recursion limit, and amounts with more subproblems than its
+        cache holds.
+        """
+        self.assertEqual(180, coinChange([1, 2, 5], 900))
+        misses = make_change.cache.stats()["misses"]
+        self.assertEqual(
+            min_coins_to_make_change([7, 11, 13], 5000),
+            coinChange([7, 11, 13], 5000),
+        )
+        self.assertLessEqual(make_change.cache.stats()["misses"] - misses, 5001)
+
+    def test_knapsack_with_more_subproblems_than_cache(self):
+        """Test that the top down knapsack solver matches the bottom up one
+        when there are more subproblems than its cache holds.
+        """
+        generator = random.Random(0)
+        items = [
+            Item(generator.randint(1, 60), generator.randint(1, 100))
+            for _ in range(30)
+        ]
+        self.assertGreater(len(items) * 601, 4096)
+        self.assertEqual(knapsack_bottom_up(items, 600), knapsack_top_down(items, 600))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""This module contains tests for the sharded LRU Cache."""
+import threading
+import unittest
+from data_structures.lru_cache.sharded_lru_cache import ShardedLRUCache
+
+
+class ShardedLRUCacheTestCase(unittest.TestCase):
+    """Class to run tests on the sharded LRU Cache."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.cache = ShardedLRUCache(10, num_shards=4, record_stats=True)
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.cache
+
+    def test_invalid_arguments(self):
+        """Test that a cache with no shards, or with fewer slots than
+        shards, can't be created.
+        """
+        with self.assertRaises(ValueError):
+            ShardedLRUCache(10, num_shards=0)
+        with self.assertRaises(ValueError):
+            ShardedLRUCache(3, num_shards=4)
+
+    def test_capacity_is_split_between_shards(self):
+        """Test that the shards' capacities add up to the max capacity."""
+        capacities = [shard.max_capacity for shard in self.cache.shards]
+        self.assertEqual([3, 3, 2, 2], capacities)
+
+    def test_get_and_put(self):
+        """Test that items are stored in exactly one shard and found again."""
+        for key in range(6):
+            self.cache.put(key, str(key))
+        for key in range(6):
+            self.assertEqual(str(key), self.cache.get(key).value)
+        self.assertEqual(6, self.cache.total_items)
+        self.assertEqual(6, sum(len(shard.items) for shard in self.cache.shards))
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_eviction_never_exceeds_capacity(self):
+        """Test that putting many keys keeps every shard within its share."""
+        for key in range(100):
+            self.cache.put(key, key)
+        self.assertEqual(10, self.cache.total_items)
+        self.assertTrue(self.cache.is_full())
+
+    def test_aggregate_stats(self):
+        """Test that the shards' stats are added up and the ratios are
+        recomputed from the totals.
+        """
+        for key in range(4):
+            self.cache.put(key, key)
+        for key in range(8):
+            self.cache.get(key)
+        self.cache.get_or_load("loaded", lambda key: key.upper())
+        stats = self.cache.stats()
+        self.assertEqual(4, stats["hits"])
+        self.assertEqual(5, stats["misses"])
+        self.assertAlmostEqual(4 / 9, stats["hit_ratio"])
+        self.assertEqual(1, stats["loads"])
+        self.assertEqual(5, stats["total_items"])
+        self.cache.reset_stats()
+        self.assertEqual(0, self.cache.stats()["hits"])
+
+    def test_concurrent_puts(self):
+        """Test that threads putting their own keys don't lose any."""
+        cache = ShardedLRUCache(8000, num_shards=8)
+
+        def insert(number):
+            for key in range(number * 1000, (number + 1) * 1000):
+                cache.put(key, key)
+
+        threads = [
+            threading.Thread(target=insert, args=(number,)) for number in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(8000, cache.total_items)
+        self.assertTrue(all(cache.get(key).value == key for key in range(8000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
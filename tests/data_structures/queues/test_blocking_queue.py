@@ -0,0 +1,122 @@
+"""This module contains tests for the blocking and asyncio queues."""
+
+
+import asyncio
+import threading
+import unittest
+from data_structures.queues.blocking_queue import AsyncQueue, BlockingQueue
+
+
+class BlockingQueueTestCase(unittest.TestCase):
+    """Class to run tests on the blocking queue."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.queue = BlockingQueue(3)
+
+    def tearDown(self):
+        """Delete fixtures."""
+        del self.queue
+
+    def test_put_and_get(self):
+        """Test that items come out in the order they were put in."""
+        for num in range(3):
+            self.queue.put(num)
+        self.assertTrue(self.queue.is_full())
+        self.assertEqual([0, 1, 2], [self.queue.get() for _ in range(3)])
+        self.assertTrue(self.queue.is_empty())
+
+    def test_timeouts(self):
+        """Test that put on a full queue and get on an empty queue raise a
+        TimeoutError once the timeout runs out.
+        """
+        with self.assertRaises(TimeoutError):
+            self.queue.get(timeout=0.01)
+        self.queue.put_many([0, 1, 2])
+        with self.assertRaises(TimeoutError):
+            self.queue.put(3, timeout=0.01)
+        with self.assertRaises(TimeoutError):
+            self.queue.put_many([3], timeout=0.01)
+        self.assertEqual(3, self.queue.size)
+
+    def test_put_waits_for_room(self):
+        """Test that a put on a full queue goes through once a consumer
+        makes room.
+        """
+        self.queue.put_many([0, 1, 2])
+        producer = threading.Thread(target=self.queue.put, args=(3,))
+        producer.start()
+        self.assertEqual(0, self.queue.get(timeout=1))
+        producer.join(timeout=1)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual([1, 2, 3], self.queue.get_many(10))
+
+    def test_producers_and_consumers(self):
+        """Test that every item put by several producers in batches larger
+        than the queue is got exactly once.
+        """
+        results = []
+        results_lock = threading.Lock()
+
+        def produce(number):
+            self.queue.put_many(range(number * 100, (number + 1) * 100))
+
+        def consume():
+            received = 0
+            while received < 200:
+                items = self.queue.get_many(min(4, 200 - received), timeout=5)
+                received += len(items)
+                with results_lock:
+                    results.extend(items)
+
+        threads = [threading.Thread(target=produce, args=(num,)) for num in range(4)]
+        threads += [threading.Thread(target=consume) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(list(range(400)), sorted(results))
+
+
+class AsyncQueueTestCase(unittest.IsolatedAsyncioTestCase):
+    """Class to run tests on the asyncio queue."""
+
+    async def test_put_and_get(self):
+        """Test that items come out in the order they were put in."""
+        queue = AsyncQueue(3)
+        await queue.put_many([0, 1])
+        await queue.put(2)
+        self.assertTrue(queue.is_full())
+        self.assertEqual(0, await queue.get())
+        self.assertEqual([1, 2], await queue.get_many(10))
+        self.assertTrue(queue.is_empty())
+
+    async def test_timeouts(self):
+        """Test that put on a full queue and get on an empty queue raise a
+        TimeoutError and leave the queue usable.
+        """
+        queue = AsyncQueue(1)
+        with self.assertRaises(TimeoutError):
+            await queue.get(timeout=0.01)
+        await queue.put(0)
+        with self.assertRaises(TimeoutError):
+            await queue.put(1, timeout=0.01)
+        self.assertEqual(0, await queue.get(timeout=0.01))
+
+    async def test_producers_and_consumers(self):
+        """Test that a producer blocked on a full queue is woken up by a
+        consumer and every item is got exactly once.
+        """
+        queue = AsyncQueue(2)
+
+        async def consume():
+            return [await queue.get(timeout=5) for _ in range(50)]
+
+        consumers = [asyncio.ensure_future(consume()) for _ in range(2)]
+        await queue.put_many(range(100), timeout=5)
+        results = await asyncio.gather(*consumers)
+        self.assertEqual(list(range(100)), sorted(results[0] + results[1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -177,5 +177,58 @@ class CircularDequeTestCase(unittest.TestCase):
         self.assertEqual(self.empty_deque.size, 0)
 
 
+    def test_extend_and_pop_many_wrap_around(self):
+        """Test that batches of items are added and removed in order when
+        they wrap around the end of the buffer.
+        """
+        self.assertEqual([0, 1, 2], self.full_deque.pop_many(3))
+        self.full_deque.extend([5, 6, 7])
+        self.assertTrue(self.full_deque.is_full())
+        self.assertEqual(7, self.full_deque.peek_back())
+        self.assertEqual([3, 4, 5, 6, 7], self.full_deque.pop_many(10))
+        with self.assertRaises(ValueError):
+            self.full_deque.extend(range(6))
+
+
+class GrowableCircularDequeTestCase(unittest.TestCase):
+    """Class to run tests on the growable mode of the circular deque."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.deque = CircularDeque(2, growable=True, shrink=True)
+
+    def tearDown(self):
+        """Delete fixtures."""
+        del self.deque
+
+    def test_deque_grows_at_both_ends(self):
+        """Test that pushing onto either end of a growable deque doubles
+        the buffer and keeps the items in order.
+        """
+        for num in range(5):
+            self.deque.push_front(-num)
+            self.deque.push_back(num)
+        self.assertFalse(self.deque.is_full())
+        self.assertEqual(16, self.deque.buffer_length)
+        self.assertEqual(-4, self.deque.peek_front())
+        self.assertEqual(4, self.deque.peek_back())
+        self.assertEqual(
+            [-4, -3, -2, -1, 0, 0, 1, 2, 3, 4], self.deque.pop_many(10)
+        )
+
+    def test_deque_shrinks_when_mostly_empty(self):
+        """Test that popping from either end halves the buffer once the
+        deque falls below a quarter full.
+        """
+        self.deque.extend(range(16))
+        for num in range(15, 7, -1):
+            self.assertEqual(num, self.deque.pop_back())
+        for num in range(5):
+            self.assertEqual(num, self.deque.pop_front())
+        self.assertEqual(8, self.deque.buffer_length)
+        self.assertEqual([5, 6, 7], self.deque.pop_many(3))
+        self.assertEqual(2, self.deque.buffer_length)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -101,7 +101,76 @@ class CircularQueueTestCase(unittest.TestCase):
         self.assertEqual(self.empty_queue.size, 0)
         self.assertEqual(self.full_queue.size, 5)
 
-    
+    def test_extend_and_pop_many_wrap_around(self):
+        """Test that batches of items are added and removed in order when
+        they wrap around the end of the buffer.
+        """
+        self.assertEqual([0, 1, 2], self.full_queue.pop_many(3))
+        self.full_queue.extend([5, 6, 7])
+        self.assertTrue(self.full_queue.is_full())
+        self.assertEqual([3, 4, 5, 6, 7], self.full_queue.pop_many(10))
+        self.assertTrue(self.full_queue.is_empty())
+
+    def test_extend_full_queue_raises_error(self):
+        """Test that extending a queue that isn't growable past its max
+        capacity raises an error and leaves the queue unchanged.
+        """
+        self.full_queue.dequeue()
+        with self.assertRaises(ValueError):
+            self.full_queue.extend([5, 6])
+        self.assertEqual([1, 2, 3, 4], self.full_queue.pop_many(5))
+
+
+class GrowableCircularQueueTestCase(unittest.TestCase):
+    """Class to run tests on the growable mode of my circular queue."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.queue = CircularQueue(4, growable=True, shrink=True)
+
+    def tearDown(self):
+        """Delete fixtures."""
+        del self.queue
+
+    def test_shrink_requires_growable(self):
+        """Test that only a growable queue can be made to shrink."""
+        with self.assertRaises(ValueError):
+            CircularQueue(4, shrink=True)
+
+    def test_buffer_length_is_a_power_of_two(self):
+        """Test that the buffer is rounded up to a power of two."""
+        self.assertEqual(8, CircularQueue(5).buffer_length)
+        self.assertEqual(4, self.queue.buffer_length)
+
+    def test_queue_grows_when_full(self):
+        """Test that a growable queue is never full and keeps its items in
+        order when it doubles while wrapped around.
+        """
+        self.queue.extend([0, 1, 2])
+        self.queue.pop_many(2)
+        for num in range(3, 10):
+            self.queue.enqueue(num)
+        self.assertFalse(self.queue.is_full())
+        self.assertEqual(8, self.queue.size)
+        self.assertEqual(8, self.queue.buffer_length)
+        self.queue.extend(range(10, 20))
+        self.assertEqual(32, self.queue.buffer_length)
+        self.assertEqual(list(range(2, 20)), self.queue.pop_many(18))
+
+    def test_queue_shrinks_when_mostly_empty(self):
+        """Test that the buffer is halved when the queue falls below a
+        quarter full, but never below its starting length.
+        """
+        self.queue.extend(range(32))
+        self.assertEqual(32, self.queue.buffer_length)
+        self.assertEqual(list(range(25)), self.queue.pop_many(25))
+        self.assertEqual(16, self.queue.buffer_length)
+        for num in range(25, 32):
+            self.assertEqual(num, self.queue.dequeue())
+        self.assertEqual(4, self.queue.buffer_length)
+        self.assertIsNone(self.queue.dequeue())
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,89 @@
+"""This module contains tests for the monotonic deque."""
+
+
+import random
+import unittest
+from data_structures.queues.monotonic_deque import (
+    MonotonicDeque,
+    sliding_window_min_max,
+)
+
+
+class MonotonicDequeTestCase(unittest.TestCase):
+    """Class to run tests on the monotonic deque."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.window = MonotonicDeque()
+        for value in (5, 1, 4, 1, 3, 9, 2):
+            self.window.push(value)
+
+    def tearDown(self):
+        """Delete fixtures."""
+        del self.window
+
+    def extremes(self, window):
+        """Return the window's current minimum and maximum."""
+        return window.current_min(), window.current_max()
+
+    def test_invalid_window_size(self):
+        """Test that a window must hold at least one value."""
+        with self.assertRaises(ValueError):
+            MonotonicDeque(0)
+        with self.assertRaises(ValueError):
+            list(sliding_window_min_max([1, 2], 0))
+
+    def test_empty_window(self):
+        """Test that an empty window has no minimum or maximum."""
+        window = MonotonicDeque()
+        self.assertTrue(window.is_empty())
+        self.assertIsNone(window.current_min())
+        self.assertIsNone(window.current_max())
+        with self.assertRaises(IndexError):
+            window.expire()
+
+    def test_expire_oldest_values(self):
+        """Test that the minimum and maximum follow the window as its
+        oldest values are expired, including repeated values.
+        """
+        self.assertEqual((1, 9), self.extremes(self.window))
+        self.window.expire(2)
+        self.assertEqual((1, 9), self.extremes(self.window))
+        self.window.expire(2)
+        self.assertEqual((2, 9), self.extremes(self.window))
+        self.window.expire(2)
+        self.assertEqual((2, 2), self.extremes(self.window))
+        self.assertEqual(1, self.window.size)
+        with self.assertRaises(IndexError):
+            self.window.expire(2)
+
+    def test_fixed_window_expires_on_push(self):
+        """Test that pushing onto a full fixed size window expires its
+        oldest value.
+        """
+        window = MonotonicDeque(3)
+        for value in (3, 1, 2, 5):
+            window.push(value)
+        self.assertEqual(3, len(window))
+        self.assertEqual((1, 5), self.extremes(window))
+        window.push(4)
+        self.assertEqual((2, 5), self.extremes(window))
+
+    def test_sliding_window_matches_rescanning(self):
+        """Test that the streaming helper gives the same minimum and
+        maximum as rescanning every window.
+        """
+        generator = random.Random(0)
+        values = [generator.randrange(50) for _ in range(500)]
+        for window_size in (1, 2, 7, 500, 501):
+            windows = [
+                values[start : start + window_size]
+                for start in range(len(values) - window_size + 1)
+            ]
+            expected = [(min(window), max(window)) for window in windows]
+            results = list(sliding_window_min_max(iter(values), window_size))
+            self.assertEqual(expected, results)
+
+
+if __name__ == "__main__":
+    unittest.main()
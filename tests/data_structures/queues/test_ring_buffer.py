@@ -0,0 +1,51 @@
+"""This module contains tests for the ring buffer shared by my circular
+queue and circular deque.
+"""
+
+
+import unittest
+from data_structures.queues.ring_buffer import RingBuffer
+
+
+class RingBufferTestCase(unittest.TestCase):
+    """Class to run tests on the ring buffer."""
+
+    def test_only_growable_ring_buffer_can_shrink(self):
+        """Test that asking a fixed size ring buffer to shrink raises an
+        error.
+        """
+        with self.assertRaises(ValueError):
+            RingBuffer(4, shrink=True)
+
+    def test_extend_and_pop_many_wrap_around(self):
+        """Test that batches keep their order when they wrap around the
+        end of the buffer, and that a full ring buffer rejects a batch
+        whole.
+        """
+        ring_buffer = RingBuffer(4)
+        ring_buffer.extend([0, 1, 2])
+        self.assertEqual([0, 1], ring_buffer.pop_many(2))
+        ring_buffer.extend([3, 4, 5])
+        self.assertTrue(ring_buffer.is_full())
+        with self.assertRaises(ValueError):
+            ring_buffer.extend([6])
+        self.assertEqual([2, 3, 4, 5], ring_buffer.pop_many(10))
+        self.assertTrue(ring_buffer.is_empty())
+        with self.assertRaises(ValueError):
+            ring_buffer.pop_many(-1)
+
+    def test_growable_ring_buffer_grows_and_shrinks(self):
+        """Test that a growable ring buffer doubles to fit a batch and
+        shrinks back to its starting length as it empties.
+        """
+        ring_buffer = RingBuffer(4, growable=True, shrink=True)
+        ring_buffer.extend(range(20))
+        self.assertEqual(32, ring_buffer.buffer_length)
+        self.assertEqual(20, ring_buffer.size)
+        self.assertEqual(list(range(19)), ring_buffer.pop_many(19))
+        self.assertEqual(4, ring_buffer.buffer_length)
+        self.assertEqual([19], ring_buffer.pop_many(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""This module contains tests for the shared memory ring buffer."""
+
+
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+from data_structures.queues.shared_memory_ring_buffer import SharedMemoryRingBuffer
+
+
+def produce(ring_buffer, count):
+    """Enqueue count numbered messages, retrying while the buffer is full."""
+    for number in range(count):
+        data = b"message %d" % number
+        while True:
+            try:
+                ring_buffer.enqueue(data)
+                break
+            except ValueError:
+                pass
+    ring_buffer.close()
+
+
+class SharedMemoryRingBufferTestCase(unittest.TestCase):
+    """Class to run tests on the shared memory ring buffer."""
+
+    def setUp(self):
+        """Create fixtures."""
+        self.ring_buffer = SharedMemoryRingBuffer(4, 16)
+
+    def tearDown(self):
+        """Close and free fixtures."""
+        self.ring_buffer.close()
+        self.ring_buffer.unlink()
+        del self.ring_buffer
+
+    def test_invalid_arguments(self):
+        """Test that the number of slots must be a power of two and a slot
+        must have room for data after its length.
+        """
+        with self.assertRaises(ValueError):
+            SharedMemoryRingBuffer(3, 16)
+        with self.assertRaises(ValueError):
+            SharedMemoryRingBuffer(4, 4)
+
+    def test_enqueue_and_dequeue_wrap_around(self):
+        """Test that items come out in order as the counters wrap around
+        the slots.
+        """
+        self.assertIsNone(self.ring_buffer.dequeue())
+        for number in range(10):
+            self.ring_buffer.enqueue(b"item %d" % number)
+            self.assertEqual(b"item %d" % number, self.ring_buffer.peek())
+            self.assertEqual(b"item %d" % number, self.ring_buffer.dequeue())
+        self.ring_buffer.enqueue(b"")
+        self.assertEqual(b"", self.ring_buffer.dequeue())
+        self.assertTrue(self.ring_buffer.is_empty())
+
+    def test_full_ring_buffer_raises_error(self):
+        """Test that enqueueing into a full ring buffer, or enqueueing data
+        that doesn't fit in a slot, raises an error.
+        """
+        for number in range(4):
+            self.ring_buffer.enqueue(bytes([number]))
+        self.assertTrue(self.ring_buffer.is_full())
+        with self.assertRaises(ValueError):
+            self.ring_buffer.enqueue(b"x")
+        self.assertEqual(b"\x00", self.ring_buffer.dequeue())
+        self.ring_buffer.enqueue(b"x")
+        self.assertEqual(b"\x01", self.ring_buffer.dequeue())
+        with self.assertRaises(ValueError):
+            self.ring_buffer.enqueue(b"x" * 13)
+        self.ring_buffer.enqueue(b"x" * 12)
+
+    def test_enqueue_many_and_dequeue_many(self):
+        """Test that batches stop at a full or empty buffer and keep their
+        order across the wrap around.
+        """
+        self.ring_buffer.enqueue(b"a")
+        self.assertEqual([b"a"], self.ring_buffer.dequeue_many(10))
+        batch = [b"b", b"c", b"d", b"e", b"f"]
+        self.assertEqual(4, self.ring_buffer.enqueue_many(batch))
+        self.assertEqual(0, self.ring_buffer.enqueue_many([b"f"]))
+        self.assertEqual([b"b", b"c"], self.ring_buffer.dequeue_many(2))
+        self.assertEqual(1, self.ring_buffer.enqueue_many([b"f"]))
+        self.assertEqual([b"d", b"e", b"f"], self.ring_buffer.dequeue_many(10))
+        self.assertEqual([], self.ring_buffer.dequeue_many(10))
+
+    def test_dequeue_many_negative_count_raises_error(self):
+        """Test that a negative count raises an error and leaves the head
+        where it was.
+        """
+        self.ring_buffer.enqueue_many([b"a", b"b"])
+        self.assertEqual([b"a"], self.ring_buffer.dequeue_many(1))
+        with self.assertRaises(ValueError):
+            self.ring_buffer.dequeue_many(-1)
+        self.assertEqual(1, self.ring_buffer.size)
+        self.assertEqual([b"b"], self.ring_buffer.dequeue_many(10))
+
+    def test_attach_by_name_and_pickle(self):
+        """Test that a ring buffer opened by name or unpickled shares the
+        same slots and counters.
+        """
+        consumer = pickle.loads(pickle.dumps(self.ring_buffer))
+        attached = SharedMemoryRingBuffer.attach(self.ring_buffer.name)
+        self.ring_buffer.enqueue(b"shared")
+        self.assertEqual(1, attached.size)
+        self.assertEqual(b"shared", consumer.dequeue())
+        self.assertTrue(attached.is_empty())
+        consumer.close()
+        attached.close()
+
+    def test_between_processes(self):
+        """Test that every message from a producer process arrives in order,
+        even though the buffer fills up many times.
+        """
+        producer = multiprocessing.Process(
+            target=produce, args=(self.ring_buffer, 1000)
+        )
+        producer.start()
+        received = []
+        while len(received) < 1000:
+            data = self.ring_buffer.dequeue()
+            if data is not None:
+                received.append(data)
+        producer.join(timeout=10)
+        self.assertEqual(0, producer.exitcode)
+        self.assertEqual([b"message %d" % number for number in range(1000)], received)
+
+    def test_attach_from_unrelated_process(self):
+        """Test that a process that isn't a multiprocessing child can
+        attach, dequeue and exit without freeing the block.
+        """
+        self.ring_buffer.enqueue(b"first")
+        self.ring_buffer.enqueue(b"second")
+        consumer = (
+            "from data_structures.queues.shared_memory_ring_buffer import "
+            "SharedMemoryRingBuffer\n"
+            "ring_buffer = SharedMemoryRingBuffer.attach(%r)\n"
+            "assert ring_buffer.dequeue() == b'first'\n"
+            "ring_buffer.close()\n" % self.ring_buffer.name
+        )
+        root = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", consumer],
+            cwd=os.path.abspath(root),
+            capture_output=True,
+            timeout=30,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        self.assertNotIn(b"leaked", result.stderr)
+        attached = SharedMemoryRingBuffer.attach(self.ring_buffer.name)
+        self.assertEqual(b"second", attached.dequeue())
+        attached.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
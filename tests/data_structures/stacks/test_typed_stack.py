@@ -0,0 +1,73 @@
+"""This module contains the test case for my implementation of a typed
+stack backed by an array.array.
+"""
+
+
+import unittest
+from array import array
+from data_structures.stacks.typed_stack import TypedStack
+
+
+class TypedStackTestCase(unittest.TestCase):
+    """Class to run tests on the typed stack implementation."""
+
+    def setUp(self):
+        """Create stack fixtures."""
+        self.empty_stack = TypedStack()
+        self.non_empty_stack = TypedStack()
+        for num in range(5):
+            self.non_empty_stack.push(num)
+
+    def tearDown(self):
+        """Cleanup fixtures."""
+        del self.empty_stack
+        del self.non_empty_stack
+
+    def test_items_are_unboxed(self):
+        """Test that the default typecode stores every item in 8 bytes."""
+        self.assertEqual("q", self.empty_stack.typecode)
+        self.assertEqual(8, self.non_empty_stack._items.itemsize)
+        self.assertEqual("d", TypedStack("d").typecode)
+
+    def test_push_and_pop(self):
+        """Test that items come off the stack in reverse order."""
+        self.assertEqual(4, self.non_empty_stack.peek())
+        popped = [self.non_empty_stack.pop() for _ in range(5)]
+        self.assertEqual([4, 3, 2, 1, 0], popped)
+        self.assertTrue(self.non_empty_stack.is_empty())
+
+    def test_empty_stack(self):
+        """Test that peek returns None and pop raises an IndexError on an
+        empty stack.
+        """
+        self.assertIsNone(self.empty_stack.peek())
+        with self.assertRaises(IndexError):
+            self.empty_stack.pop()
+        self.assertEqual(0, self.empty_stack.size)
+
+    def test_push_many_and_pop_many(self):
+        """Test that batches are pushed in order and popped top first."""
+        self.non_empty_stack.push_many([5, 6])
+        self.non_empty_stack.push_many(array("q", [7]))
+        self.assertEqual(8, len(self.non_empty_stack))
+        self.assertEqual(array("q", [7, 6, 5]), self.non_empty_stack.pop_many(3))
+        self.assertEqual(array("q"), self.non_empty_stack.pop_many(0))
+        self.assertEqual(
+            array("q", [4, 3, 2, 1, 0]), self.non_empty_stack.pop_many(10)
+        )
+        with self.assertRaises(ValueError):
+            self.non_empty_stack.pop_many(-1)
+
+    def test_items_must_fit_the_typecode(self):
+        """Test that a batch with an item that doesn't fit the typecode is
+        rejected as a whole.
+        """
+        with self.assertRaises(TypeError):
+            self.non_empty_stack.push("a")
+        with self.assertRaises(OverflowError):
+            self.non_empty_stack.push_many([5, 2**64])
+        self.assertEqual(5, self.non_empty_stack.size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,15 +2,16 @@
 
 
 import unittest
+from data_structures.stacks.typed_stack import TypedStack
 from graph_theory.algorithms.traversals.dfs_adjacency_list import (
     dfs as dfs_adjacency_list,
+    dfs_visit_iterative as dfs_visit_iterative_adjacency_list,
 )
 from graph_theory.algorithms.traversals.dfs_adjacency_matrix import (
     dfs as dfs_adjacency_matrix,
+    dfs_visit_iterative as dfs_visit_iterative_adjacency_matrix,
 )
 
-# The iterative version of dfs_visit is not tested here, but given the inputs below,
-# it will produce an ordering of [0, 3, 5, 1, 2, 4], which is another correct dfs order
 class DFSTestCase(unittest.TestCase):
     """Class to run tests on my dfs implementation."""
 
@@ -47,6 +48,22 @@ class DFSTestCase(unittest.TestCase):
         results = [0, 1, 2, 3, 5, 4]
         self.assertEqual(results, list(dfs_adjacency_matrix(self.adjacency_matrix)))
 
+    def test_dfs_visit_iterative(self):
+        """Test that the iterative versions of dfs_visit produce another
+        correct dfs order, whether they keep the nodes waiting to be
+        visited in a list or in a typed stack.
+        """
+        results = [0, 3, 5, 1, 2, 4]
+        for stack in (None, TypedStack("q")):
+            nodes = dfs_visit_iterative_adjacency_list(
+                0, self.adjacency_list, set(), stack
+            )
+            self.assertEqual(results, list(nodes))
+            nodes = dfs_visit_iterative_adjacency_matrix(
+                0, self.adjacency_matrix, set(), stack
+            )
+            self.assertEqual(results, list(nodes))
+
 
 if __name__ == "__main__":
     unittest.main()